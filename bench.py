@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Updater Benchmarks
+--------------------------------
+Times the updater's hot paths against the offline Streak stand-in
+(streak_standin.py) at several pipeline sizes and compares them with the
+stored baselines in bench-baseline.json.
+
+Usage:  python3 bench.py [--scales 1000,10000,100000] [--save] [--tolerance 0.5]
+
+Cases, each run in a fresh process so peak RSS is its own:
+  fetch    fetch_all_boxes() over HTTP from the stand-in
+  metrics  compute_metrics() over the same boxes
+  output   data-partners.json / data.js and portal shards into a temp dir
+           holding the previous output, after 1% of boxes changed
+
+Records wall time, peak RSS and stand-in request counts. Fails (exit 1) when
+a case is slower or bigger than its baseline by more than the tolerance, or
+makes more requests; --save records the current numbers as the new baseline.
+Baselines are machine-specific — re-save them when the runner changes.
+"""
+
+import os, json, resource, subprocess, sys, tempfile, time
+
+SCRIPT_DIR    = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(SCRIPT_DIR, "bench-baseline.json")
+SCALES        = (1000, 10000, 100000)
+CASES         = ("fetch", "metrics", "output")
+TOLERANCE     = 0.5      # allowed fractional slowdown / growth over baseline
+SLACK         = {"wall_s": 0.5, "peak_rss_mb": 5}   # plus this much, so tiny cases are not flaky
+BENCH_RATE    = 10000    # STREAK_RATE for the case processes, so throttling is not measured
+SEED          = 1
+
+# ── Case runner (child process) ────────────────────────────────────
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+def run_case(case, count):
+    """Run one case in this process and return its measurements. Input
+    generation happens before the clock starts."""
+    import update
+    from streak_standin import synthetic_box, synthetic_pipeline
+
+    schema = update.PipelineSchema(synthetic_pipeline())
+    if case == "fetch":
+        start = time.perf_counter()
+        boxes = update.fetch_all_boxes()
+        wall  = time.perf_counter() - start
+        assert len(boxes) == count, f"fetched {len(boxes)} of {count} boxes"
+    elif case == "metrics":
+        boxes = [synthetic_box(i, SEED) for i in range(count)]
+        start = time.perf_counter()
+        update.compute_metrics(boxes, schema)
+        wall  = time.perf_counter() - start
+    elif case == "output":
+        state = update.MetricsState(schema)
+        for i in range(count):
+            state.upsert(synthetic_box(i, SEED))
+        with tempfile.TemporaryDirectory() as out_dir:
+            # Start from a previous run's output, as a real run does (the
+            # partner table patch diffs against it), with 1% of boxes changed
+            update.write_dashboard_bundles(state, state.summary(), out_dir, budgets={})
+            for i in range(0, count, 100):
+                state.upsert(synthetic_box(i, SEED + 1))
+            start   = time.perf_counter()
+            summary = state.summary()
+            update.write_dashboard_bundles(state, summary, out_dir, budgets={})
+            public  = update.public_partner_records(state.partners())
+            update.write_portal_shards(public, summary["lastUpdated"], os.path.join(out_dir, "portal"))
+            wall    = time.perf_counter() - start
+    else:
+        raise ValueError(f"unknown case {case!r}")
+    return {"wall_s": round(wall, 3), "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+# ── Driver ─────────────────────────────────────────────────────────
+def measure(case, count, server):
+    """Run a case in a child process against `server`; add its request count."""
+    from urllib.request import urlopen, Request
+    urlopen(Request(server.url + "/_reset", method="POST")).close()
+    env = {**os.environ, "STREAK_BASE_URL": server.url, "STREAK_RATE": str(BENCH_RATE)}
+    proc = subprocess.run([sys.executable, __file__, "--case", case, str(count)],
+                          env=env, capture_output=True, text=True, cwd=SCRIPT_DIR)
+    if proc.returncode:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"{case} @ {count} failed")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    with urlopen(server.url + "/_stats") as r:
+        result["requests"] = json.load(r).get("total", 0)
+    return result
+
+def regressions(name, result, base, tolerance):
+    """Messages for each metric of `result` that is worse than `base`."""
+    out = []
+    for metric in ("wall_s", "peak_rss_mb"):
+        if metric in base and result[metric] > base[metric] * (1 + tolerance) + SLACK[metric]:
+            out.append(f"{name}: {metric} {result[metric]} vs baseline {base[metric]}")
+    if "requests" in base and result["requests"] > base["requests"]:
+        out.append(f"{name}: requests {result['requests']} vs baseline {base['requests']}")
+    return out
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def arg(name, default=None):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+if __name__ == "__main__":
+    if "--case" in sys.argv:
+        i = sys.argv.index("--case")
+        print(json.dumps(run_case(sys.argv[i + 1], int(sys.argv[i + 2]))))
+        sys.exit(0)
+
+    from streak_standin import BoxStore, start_in_thread
+
+    scales    = [int(s) for s in arg("--scales", ",".join(map(str, SCALES))).split(",")]
+    tolerance = float(arg("--tolerance", TOLERANCE))
+    baseline  = load_baseline()
+    results, failed = {}, []
+
+    print(f"{'case':<16}{'wall s':>10}{'peak MB':>10}{'requests':>10}   baseline")
+    for count in scales:
+        server = start_in_thread(BoxStore(count=count, seed=SEED))
+        try:
+            for case in CASES:
+                name   = f"{case}@{count}"
+                result = results[name] = measure(case, count, server)
+                base   = baseline.get(name, {})
+                failed += regressions(name, result, base, tolerance)
+                ref = f"{base['wall_s']}s / {base['peak_rss_mb']}MB / {base['requests']}" if base else "—"
+                print(f"{name:<16}{result['wall_s']:>10}{result['peak_rss_mb']:>10}{result['requests']:>10}   {ref}")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    if "--save" in sys.argv:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({**baseline, **results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline for {len(results)} case(s) to {os.path.basename(BASELINE_PATH)}")
+    elif failed:
+        print(f"\n{len(failed)} regression(s) beyond {tolerance:.0%} tolerance:")
+        for msg in failed:
+            print(f"  {msg}")
+        sys.exit(1)
+    else:
+        print("\nNo regressions." if baseline else "\nNo baseline yet — run with --save to record one.")
@@ -1,17259 +1,3 @@
 // Auto-generated by update.py on Feb 20, 2026
 // Do not edit manually — run: python3 update.py
-
-const AMPLIFY_DATA = {
-  "lastUpdated": "Feb 20, 2026",
-  "signedCount": 250,
-  "totalSigned": 1119500,
-  "totalPipeline": 1207500,
-  "paid": 648000,
-  "outstanding": 471500,
-  "waitingBilling": 12500,
-  "inKind": 0,
-  "needsInvoice": 23000,
-  "needsInvoiceCount": 5,
-  "inDiscussion": 61000,
-  "inDiscussionCount": 64,
-  "finalFollowUp": 4000,
-  "finalFollowUpCount": 147,
-  "marketingComplete": 12000,
-  "byStage": {
-    "Tier 1": 646500,
-    "Brand Spotlight": 221000,
-    "New Opening": 86000,
-    "Tier 2": 154000,
-    "Marketing Complete": 12000
-  },
-  "countByStage": {
-    "Tier 1": 184,
-    "Brand Spotlight": 26,
-    "New Opening": 15,
-    "Tier 2": 22,
-    "Marketing Complete": 3
-  },
-  "pipelineByStage": {
-    "Needs Invoice": 23000,
-    "In Discussion": 61000,
-    "Final Follow Up": 4000
-  },
-  "pipelineCountByStage": {
-    "Needs Invoice": 5,
-    "In Discussion": 64,
-    "Final Follow Up": 147
-  },
-  "funnel": [
-    {
-      "label": "Signed \u2014 Tier 1",
-      "stageKey": "5014",
-      "count": 184,
-      "value": 646500
-    },
-    {
-      "label": "Signed \u2014 Brand Spotlight",
-      "stageKey": "5016",
-      "count": 26,
-      "value": 221000
-    },
-    {
-      "label": "Signed \u2014 Tier 2",
-      "stageKey": "5015",
-      "count": 22,
-      "value": 154000
-    },
-    {
-      "label": "Signed \u2014 New Opening",
-      "stageKey": "5017",
-      "count": 15,
-      "value": 86000
-    },
-    {
-      "label": "Signed \u2014 Marketing Complete",
-      "stageKey": "5007",
-      "count": 3,
-      "value": 12000
-    },
-    {
-      "label": "Needs Invoice",
-      "stageKey": "5011",
-      "count": 5,
-      "value": 23000
-    },
-    {
-      "label": "In Discussion",
-      "stageKey": "5004",
-      "count": 64,
-      "value": 61000
-    },
-    {
-      "label": "Final Follow Up",
-      "stageKey": "5001",
-      "count": 147,
-      "value": 4000
-    },
-    {
-      "label": "Needs Contact",
-      "stageKey": "5013",
-      "count": 65,
-      "value": 0
-    },
-    {
-      "label": "Needs Review",
-      "stageKey": "5010",
-      "count": 8,
-      "value": 0
-    },
-    {
-      "label": "Declined",
-      "stageKey": "5008",
-      "count": 174,
-      "value": 0
-    },
-    {
-      "label": "Do Not Invite",
-      "stageKey": "5009",
-      "count": 132,
-      "value": 0
-    }
-  ],
-  "signedOverTime": [
-    {
-      "month": "Aug 2025",
-      "count": 13,
-      "value": 30000,
-      "cumCount": 13,
-      "cumValue": 30000
-    },
-    {
-      "month": "Sep 2025",
-      "count": 22,
-      "value": 117000,
-      "cumCount": 35,
-      "cumValue": 147000
-    },
-    {
-      "month": "Oct 2025",
-      "count": 49,
-      "value": 211000,
-      "cumCount": 84,
-      "cumValue": 358000
-    },
-    {
-      "month": "Nov 2025",
-      "count": 40,
-      "value": 177000,
-      "cumCount": 124,
-      "cumValue": 535000
-    },
-    {
-      "month": "Dec 2025",
-      "count": 41,
-      "value": 188000,
-      "cumCount": 165,
-      "cumValue": 723000
-    },
-    {
-      "month": "Jan 2026",
-      "count": 42,
-      "value": 198500,
-      "cumCount": 207,
-      "cumValue": 921500
-    },
-    {
-      "month": "Feb 2026",
-      "count": 43,
-      "value": 198000,
-      "cumCount": 250,
-      "cumValue": 1119500
-    }
-  ],
-  "newThisWeek": [
-    {
-      "name": "Solaz a Luxury Collection Resort Los Cabos",
-      "stage": "Tier 2",
-      "price": 8000
-    },
-    {
-      "name": "South Bank - Grace Bay Resorts",
-      "stage": "Brand Spotlight",
-      "price": 5000
-    },
-    {
-      "name": "Stein Eriksen Lodge Deer Valley",
-      "stage": "Marketing Complete",
-      "price": 5000
-    },
-    {
-      "name": "W Sardinia",
-      "stage": "Tier 1",
-      "price": 4000
-    },
-    {
-      "name": "Terre Blanche H\u00f4tel Spa Golf Resort",
-      "stage": "Tier 1",
-      "price": 4000
-    },
-    {
-      "name": "Fairmont Le Ch\u00e2teau Frontenac",
-      "stage": "Tier 1",
-      "price": 4000
-    },
-    {
-      "name": "Atlantis Bay",
-      "stage": "Tier 1",
-      "price": 3000
-    },
-    {
-      "name": "The Hoxton Florence",
-      "stage": "Tier 1",
-      "price": 3000
-    },
-    {
-      "name": "Mazzaro Sea Palace",
-      "stage": "Tier 1",
-      "price": 3000
-    }
-  ],
-  "features": {
-    "Collection": 196,
-    "Forum": 125,
-    "Newsletter": 123,
-    "Journal Article": 14,
-    "Social Media": 14,
-    "Advisor Assets": 24,
-    "Webinar": 5
-  },
-  "quarters": {
-    "TBD": 97,
-    "Q3": 17,
-    "Q2": 76,
-    "Q4": 4,
-    "Q1": 69
-  },
-  "topCountries": [
-    [
-      "USA",
-      66
-    ],
-    [
-      "Italy",
-      28
-    ],
-    [
-      "Spain",
-      16
-    ],
-    [
-      "Mexico",
-      16
-    ],
-    [
-      "Greece",
-      15
-    ],
-    [
-      "GB",
-      11
-    ],
-    [
-      "Japan",
-      10
-    ],
-    [
-      "Portugal",
-      4
-    ],
-    [
-      "UAE",
-      4
-    ],
-    [
-      "France",
-      4
-    ]
-  ],
-  "topGroups": [
-    [
-      "Marriott International",
-      47
-    ],
-    [
-      "Accor",
-      23
-    ],
-    [
-      "Hyatt Hotels & Resorts",
-      17
-    ],
-    [
-      "Hilton Hotels & Resorts",
-      13
-    ],
-    [
-      "Kerzner International",
-      8
-    ],
-    [
-      "IHG Hotels & Resorts",
-      7
-    ],
-    [
-      "Grecotel",
-      6
-    ],
-    [
-      "Dorchester Collection",
-      5
-    ],
-    [
-      "Mandarin Oriental",
-      5
-    ],
-    [
-      "Katikies",
-      4
-    ]
-  ],
-  "topBrands": [
-    [
-      "Raffles",
-      13
-    ],
-    [
-      "Ritz-Carlton",
-      13
-    ],
-    [
-      "W Hotels",
-      8
-    ],
-    [
-      "Waldorf Astoria",
-      8
-    ],
-    [
-      "Luxury Collection",
-      6
-    ],
-    [
-      "Grecotel",
-      6
-    ],
-    [
-      "St. Regis",
-      6
-    ],
-    [
-      "One&Only",
-      6
-    ],
-    [
-      "Dorchester Collection",
-      5
-    ],
-    [
-      "Mandarin Oriental",
-      5
-    ]
-  ],
-  "partners": [
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECww",
-      "name": "1 Hotel Hanalei Bay",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SS06kGVqrSpNJ57p6Ct3dxm",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "1 Hotels",
-      "group": "Starwood Hotels & Resorts",
-      "email": "wendi.yip@1hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXagdysCgw",
-      "name": "45 Park Lane",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SVagCGVqrSpNJ572chalNMf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "GB",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "susannah.lurie@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXagdysCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefYCQw",
-      "name": "7Pines Resort Ibiza",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJEJ3GVqrSpNJ57PspdA0Nr",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Spain",
-      "brand": "7Pines",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "higeki.urier@lindnerhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefYCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCAw",
-      "name": "7Pines Resort Sardinia",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SZYRsGVqrSpNJ57AvjFAz2r",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "7Pines",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "higeki.urier@lindnerhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICQw",
-      "name": "Acqualina Resort & Residences on the Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SegSXGVqrSpNJ575IXae68f",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "Mauro.Pinho@acqualina.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5CAw",
-      "name": "Alila Mayakoba",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening + Advisor Assets",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShB4IGVqrSpNJ57N9ZnPq79",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Mexico",
-      "brand": "Alila",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "rolando.castillo@alilahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_CQw",
-      "name": "Alila Ventana Big Sur",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SzLQ7GVqrSpNJ57dhi7NsDa",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Alila",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "daniel.strawn@alilahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCww",
-      "name": "Almanac Barcelona",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Spain",
-      "brand": "Almanac",
-      "group": "Almanac Group",
-      "email": "jan.mindermann@almanachotels.com, Alfredo.Martinez@almanachotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXC0-OECww",
-      "name": "Almanac Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 7000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNcT4GVqrSpNJ57S7NRkl10",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "July - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "",
-      "brand": "Almanac",
-      "group": "Almanac Group",
-      "email": "Alfredo.Martinez@almanachotels.com, j.mindermann@wsfgroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXC0-OECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeECQw",
-      "name": "Almanac Palais Vienna",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Austria",
-      "brand": "Almanac",
-      "group": "Almanac Group",
-      "email": "jan.mindermann@almanachotels.com, Alfredo.Martinez@almanachotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeECQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3CQw",
-      "name": "Almanac X Alcron Prague",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Czech Republic",
-      "brand": "Almanac",
-      "group": "Almanac Group",
-      "email": "jan.mindermann@almanachotels.com, Alfredo.Martinez@almanachotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaffCQw",
-      "name": "Amirandes A Grecotel Resort to Live",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 5000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Syyg5GVqrSpNJ57tOWEzZSN",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Greece",
-      "brand": "Grecotel",
-      "group": "Grecotel",
-      "email": "sofia.grigoratou@grecotel.com, Tina.Nykta@grecotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaffCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSeCQw",
-      "name": "Andaz Peninsula Papagayo Resort Costa Rica by Hyatt",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJEOeGVqrSpNJ576LCRq1wL",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "Costa Rica",
-      "brand": "Andaz",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "valdirene.inocencio@andaz.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSeCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JS2CAw",
-      "name": "Arizona Biltmore LXR Hotels & Resorts",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3S7jcLGVqrSpNJ573Nvo49ko",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "LXR",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Tyiesha.Thaxton@ArizonaBiltmore.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JS2CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWgqMTpCQw",
-      "name": "Atlantis",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1S8h9XGVqrSpNJ57Wk596VBi",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Bahamas",
-      "brand": "Atlantis Bahamas",
-      "group": "Atlantis Bahamas",
-      "email": "Megan.Prieto@atlantisparadise.com, Ann-Sofi.Gustafsson@atlantisparadise.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWgqMTpCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbjOfpCww",
-      "name": "Atlantis Bay",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T2Fc7GVqrSpNJ57Crn1GzFO",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "VRetreats",
-      "group": "VRetreats",
-      "email": "laura.osiride@vretreats.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbjOfpCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCAw",
-      "name": "Atlantis The Royal",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SL5LxGVqrSpNJ57dcib9wTG",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "UAE",
-      "brand": "Atlantis",
-      "group": "Kerzner International",
-      "email": "Marcela.Bizachi@atlantisdubai.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSWCww",
-      "name": "Banyan Tree Mayakoba",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SqDSPGVqrSpNJ57DCGOlk12",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Mexico",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "Fernanda.Echavarria@banyantree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSWCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTRCgw",
-      "name": "Beach Enclave",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmHbdGVqrSpNJ57opGDYW1N",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Beach Enclave",
-      "group": "Beach Enclave",
-      "email": "chris.halbauer@beachenclave.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTRCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXx-t2_Cgw",
-      "name": "Bellustar Tokyo",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz1NiGVqrSpNJ57TBDsBDqf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Japan",
-      "brand": "Pan Pacific Hotels",
-      "group": "Pan Pacific",
-      "email": "nonnie.warren@pphg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXx-t2_Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCww",
-      "name": "Beverly Hills Hotel & Bungalows",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SPpUJGVqrSpNJ570qTCvjdX",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "Sylvia.Oken@dorchestercollection.com, Lauren.Todaro@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSOCww",
-      "name": "Borgo Pignano Tuscany",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SI90BGVqrSpNJ571nkPQUWb",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "reservations@borgopignano.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSOCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSGCww",
-      "name": "Borgo Santandrea",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sh9w3GVqrSpNJ57ORkHeyOp",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "a.gatto@borgosantandrea.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSGCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCww",
-      "name": "Buahan A Banyan Tree Escape",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUYeqGVqrSpNJ57UlRocyOC",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Indonesia",
-      "brand": "Banyan Tree",
-      "group": "Accor",
-      "email": "made.yuri@banyantree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCQw",
-      "name": "Bvlgari Hotels & Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SCn69GVqrSpNJ57Ex4gtltQ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "Fabio.peloia@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWwr5XJCgw",
-      "name": "Cape Sounio Grecotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 5000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyyewGVqrSpNJ57Dxw4vS7a",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Greece",
-      "brand": "Grecotel",
-      "group": "Grecotel",
-      "email": "sofia.grigoratou@grecotel.com, Tina.Nykta@grecotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWwr5XJCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHCCQw",
-      "name": "Capella Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SKivOGVqrSpNJ57s9nLY1RX",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Webinar",
-          "timing": "January 2026"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "",
-      "brand": "Capella",
-      "group": "Capella",
-      "email": "jade.woon@capellahotelgroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHCCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dH6Cww",
-      "name": "Carlisle Bay",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SWOnWGVqrSpNJ5734sXsl8o",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Antigua",
-      "brand": "",
-      "group": "",
-      "email": "louisescoto@carlisle-bay.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dH6Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHmCAw",
-      "name": "Carlton Hotel St. Moritz",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SMsxeGVqrSpNJ57ELVQDh2I",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "December - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q4 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q4"
-      ],
-      "country": "Switzerland",
-      "brand": "Tschuggen",
-      "group": "Tschuggen Collection AG",
-      "email": "r.imboden@tschuggencollection.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHmCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHGCQw",
-      "name": "Carmel Valley Ranch",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNHloGVqrSpNJ57vyc77K6P",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Unbound Collection",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "alison.suan@carmelvalleyranch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHGCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGSCQw",
-      "name": "Casa Angelina",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SFuX8GVqrSpNJ57TcY5Nm2I",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "aaprea@casangelina.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGSCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG8CAw",
-      "name": "Castelfalfi",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUYgMGVqrSpNJ57AwqYUbMp",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "alberto.liparoti@castelfalfi.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG8CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6CAw",
-      "name": "Castello Di Reschio (Reschio Hotel)",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SL8W4GVqrSpNJ57phJqcwXW",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Sur-mesure",
-      "group": "Sur-mesure",
-      "email": "florian@reschio.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXq5_vTCgw",
-      "name": "Chapter Chianti Country Resort",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1STCSGGVqrSpNJ57UB0wuvEi",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "eleonora@chapter-italia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXq5_vTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qwCww",
-      "name": "Conrad Fort Lauderdale Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmHScGVqrSpNJ57yKchLlGi",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Conrad",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Lauren.Norwood@WaldorfAstoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qwCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qwCQw",
-      "name": "Conrad Orlando",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3S96K9GVqrSpNJ572lNuwFEN",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Conrad",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Michelle.Dvortsin@conradhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qwCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qACQw",
-      "name": "Conrad Tulum Riviera Maya",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmHUcGVqrSpNJ57GRdMJSOm",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned, September - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned, September - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q3"
-      ],
-      "country": "Mexico",
-      "brand": "Conrad",
-      "group": "Hilton Hotels & Resorts",
-      "email": "oscar.quijano@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qACQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rvCww",
-      "name": "Conrad Washington DC",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmHX8GVqrSpNJ57xFlUiq7r",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "September - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "Conrad",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Hillary.spence@conradhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rvCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-tCgw",
-      "name": "Eau Palm Beach Resort and Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SUV35GVqrSpNJ572Gm2FsdS",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "laura.depalma@eaupalmbeach.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-tCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_rCAw",
-      "name": "Edgewood Tahoe Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SEG9kGVqrSpNJ57xcnlDb9C",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "lepstein@edgewoodtahoe.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_rCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_1CQw",
-      "name": "Equinox Hotel New York City",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUuByGVqrSpNJ57Z12GRI2e",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "Andreas.Caperonis@equinox-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_tCAw",
-      "name": "Excelsior Hotel Gallia A Luxury Collection Hotel Milan",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SLqKsGVqrSpNJ57BVlgMNPQ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "chiara.dallagnola@luxurycollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_tCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_VCgw",
-      "name": "Explora",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz1JLGVqrSpNJ57JvGfW5tf",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Explora Hotels",
-      "group": "Explora",
-      "email": "amvarela@explora.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_VCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCQw",
-      "name": "FH55 Grand Hotel Palatino",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SDnVXGVqrSpNJ57ODh0Rwqy",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "Fh55",
-      "group": "FH55",
-      "email": "f.menchetti@fhhotelgroup.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWECww",
-      "name": "FH55 Hotel Calzaiuoli",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SDnVXGVqrSpNJ57ODh0Rwqy",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "Fh55",
-      "group": "FH55",
-      "email": "f.menchetti@fhhotelgroup.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCAw",
-      "name": "Fairmont Le Ch\u00e2teau Frontenac",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T1tS7GVqrSpNJ57xUCLF0J5",
-      "features": [],
-      "quarters": [],
-      "country": "Canada",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Maxime.Aubin@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_9Cgw",
-      "name": "Fairmont Miramar Hotel & Bungalows",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUZxDGVqrSpNJ57XzWK1bLN",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Danielle.Gambardella@Fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-zCQw",
-      "name": "Fairmont Sonoma Mission Inn & Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJE2hGVqrSpNJ57hNgtlKlZ",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Alicia.Webb@Fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-zCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_DCQw",
-      "name": "Fairmont Tremblant",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SigMXGVqrSpNJ57m48JIp0g",
-      "features": [],
-      "quarters": [],
-      "country": "Canada",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "isabelle.daoust@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_DCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fqCQw",
-      "name": "Four Seasons Astir Palace Hotel Athens",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sg3XOGVqrSpNJ57K5Vwa5ba",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "Nota.Damala@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fqCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fcCAw",
-      "name": "Gansevoort Meatpacking",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShBLbGVqrSpNJ57qCwtVO5V",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "Marketing@theghg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fcCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWivZu5Cgw",
-      "name": "Garrya Mu Cang Chai",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SSifZGVqrSpNJ579Gbz7hNC",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Vietnam",
-      "brand": "Banyan Tree",
-      "group": "Accor",
-      "email": "Xuyen.Nguyen@garrya.com, Ha.Dinh@garrya.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWivZu5Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eCCAw",
-      "name": "Grand Hotel Les Trois Rois",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SGJcVGVqrSpNJ571iaW9v3z",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Switzerland",
-      "brand": "",
-      "group": "",
-      "email": "dennis.deitmers@lestroisrois.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eCCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCAw",
-      "name": "Grand Hyatt Deer Valley & Residences",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SpBfnGVqrSpNJ5721YiwZXW",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Grand Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "kevin.shields@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCgw",
-      "name": "Grand Hyatt Grand Cayman",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/payments/pi_3S6EIGGVqrSpNJ573PjIioSd",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Grand Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "frank.cavella@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fcCQw",
-      "name": "Grand Hyatt Vail",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SZbNvGVqrSpNJ57qiF0nFI5",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Grand Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "Andrea.heffner@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fcCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTdCQw",
-      "name": "Grand Velas Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SRwliGVqrSpNJ576Chs9QVj",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "February - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Mexico",
-      "brand": "Grand Velas Resorts",
-      "group": "Grand Velas Resorts",
-      "email": "dmontesdeoca@velasresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTdCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQvOHvCQw",
-      "name": "Grecotel",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 11000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sx9NsGVqrSpNJ57g4DWx1he",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "January - Planned"
-        },
-        {
-          "name": "Webinar",
-          "timing": "January 2026"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Greece",
-      "brand": "Grecotel",
-      "group": "Grecotel",
-      "email": "sofia.grigoratou@grecotel.com, Tina.Nykta@grecotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQvOHvCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JazCQw",
-      "name": "HOTEL THE MITSUI KYOTO, a Luxury Collection Hotel & Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SGVIJGVqrSpNJ570RWdlCml",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Japan",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "tomo.shinya@hotelthemitsui.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JazCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSDCQw",
-      "name": "Hammock Cove Antigua",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SlA8hGVqrSpNJ571lsq7Dbu",
-      "features": [],
-      "quarters": [],
-      "country": "Antigua",
-      "brand": "",
-      "group": "",
-      "email": "jdeleon@eliteislandresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSDCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTnCgw",
-      "name": "Hotel Arts Barcelona",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJEAQGVqrSpNJ57p946poHf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "September - Planned, February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "September - Planned, February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "February - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1",
-        "Q3"
-      ],
-      "country": "Spain",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "lorenzo.battaini@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTnCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCww",
-      "name": "Hotel Bel Air",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SQcmxGVqrSpNJ573GHm26pY",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "Sylvia.Oken@dorchestercollection.com, Lauren.Todaro@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSrCAw",
-      "name": "Hotel Byron",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SzLMTGVqrSpNJ57QskqX9tb",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "s.madonna@hotelbyron.net",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSrCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTLCgw",
-      "name": "Hotel Caf\u00e9 Royal London",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJEKjGVqrSpNJ57f7sAnaaI",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "GB",
-      "brand": "The Set Collection",
-      "group": "The Set Collection",
-      "email": "yasmeen.sarwar@hotelcaferoyal.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTLCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSdCww",
-      "name": "Hotel Casa del Mar",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SeefVGVqrSpNJ577Yo21QfX",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "ETC Hotels",
-      "group": "",
-      "email": "mperez@etchotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSdCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCQw",
-      "name": "Hotel Chapter Roma",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1STCSuGVqrSpNJ579bAjygRY",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "Chapter",
-      "group": "Chapter",
-      "email": "eleonora@chapter-italia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rNCAw",
-      "name": "Hotel Eden",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SKiNkGVqrSpNJ576YiQNDbh",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "Francesca.bianchi@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rNCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oS7CAw",
-      "name": "Hotel Goldener Hirsch a Luxury Collection Hotel Salzburg",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShDzMGVqrSpNJ579vGgjGb2",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Austria",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "renate.siebenhofer@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oS7CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuHbCww",
-      "name": "Hotel Hermitage Monte-Carlo",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShE8tGVqrSpNJ57F7kspgWd",
-      "features": [],
-      "quarters": [],
-      "country": "Monaco",
-      "brand": "SBM",
-      "group": "SBM",
-      "email": "m.vinciguerra@sbm.mc",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuHbCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGTCgw",
-      "name": "Hotel Plaza e de Russie",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SzLNuGVqrSpNJ57Xr53Mvf6",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Rocco Forte",
-      "group": "Rocco Forte",
-      "email": "s.madonna@plazaederussie.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWzwvvtCAw",
-      "name": "Huntington Hotel",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SzLlpGVqrSpNJ57x6P7IoxJ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "aaron@thehuntingtonhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWzwvvtCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuH7Cww",
-      "name": "Hyatt Regency Kyoto",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://invoice.stripe.com/i/acct_1N83G5GVqrSpNJ57/live_YWNjdF8xTjgzRzVHVnFyU3BOSjU3LF9UMmNKRlFjb1dhU1VLTlJHWUhvU2xFdUFpMk56dFFsLDE0ODIyNDgzMg02000yuCISLl?s=db",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Japan",
-      "brand": "Hyatt Regency",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "kumiko.takahashi@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuH7Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iHCQw",
-      "name": "Ikos Kissamos",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SAutgGVqrSpNJ57gSncnNkU",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "",
-      "group": "",
-      "email": "pmagoulas@saniikos.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iHCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6SzCgw",
-      "name": "InterContinental Presidente Cozumel Resort Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz1E5GVqrSpNJ576vPymoV6",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Mexico",
-      "brand": "InterContinental",
-      "group": "IHG Hotels & Resorts",
-      "email": "carla_durand@grupopresidente.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6SzCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWcCgw",
-      "name": "JW Marriott Marco Island",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SLU86GVqrSpNJ5786rWm9RH",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "JW Marriott",
-      "group": "Marriott International",
-      "email": "jada.shigley@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWcCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWF8KruCww",
-      "name": "JW Marriott Orlando, Grand Lakes",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SopebGVqrSpNJ570Jsj5eXZ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "alissa.perez@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWF8KruCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_tCgw",
-      "name": "Jack's Camp",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SG29aGVqrSpNJ57PIz8JdYi",
-      "features": [],
-      "quarters": [],
-      "country": "Botswana",
-      "brand": "",
-      "group": "",
-      "email": "sallyg@naturalselection.travel",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_tCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_FCQw",
-      "name": "Jumeirah Hotels & Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3S6sCGGVqrSpNJ570fz7zIdQ",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "gregg.nielsen@jumeirah.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_FCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_VCAw",
-      "name": "Kamalaya Koh Samui",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Newsletter + Forum Feature",
-      "price": 2000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz1HWGVqrSpNJ57mksG95Wm",
-      "features": [
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Thailand",
-      "brand": "",
-      "group": "",
-      "email": "dosm@kamalaya.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_VCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXx67f0Cww",
-      "name": "Katikies Chromata",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1StrCTGVqrSpNJ57LuPcv9Yf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "Katikies",
-      "group": "Katikies",
-      "email": "e.papageorgiou@katikies.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXx67f0Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-lCgw",
-      "name": "Katikies Garden",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1StrCTGVqrSpNJ57LuPcv9Yf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "Katikies",
-      "group": "Katikies",
-      "email": "d.passa@katikies.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-lCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCAw",
-      "name": "Katikies Kirini Santorini",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1StrCTGVqrSpNJ57LuPcv9Yf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "Katikies",
-      "group": "Katikies",
-      "email": "d.passa@katikies.com, e.papageorgiou@katikies.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCQw",
-      "name": "Katikies\u00a0Mykonos",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1StrCTGVqrSpNJ57LuPcv9Yf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "Katikies",
-      "group": "Katikies",
-      "email": "reservations@katikies.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWT8qrICAw",
-      "name": "Kempinski Germany: Hotel Adlon & Hotel Vier Jahreszeiten",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Bespoke Kempinski",
-      "price": 25000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyzwaGVqrSpNJ57prEmn5v7",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned, May - Planned, June - Planned, July - Planned, August - Planned, September - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned, April - Planned, May - Planned, July - Planned, August - Planned, September - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q3",
-        "Q4"
-      ],
-      "country": "Germany",
-      "brand": "",
-      "group": "Kempinski",
-      "email": "francesca.caraffi@kempinski.com, taryn.wolt@kempinski.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWT8qrICAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCww",
-      "name": "Kerzner",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SPVOIGVqrSpNJ579B9LF7Sp",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "February - Planned"
-        },
-        {
-          "name": "Webinar",
-          "timing": "February 2026"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "",
-      "brand": "Kerzner",
-      "group": "Kerzner International",
-      "email": "michael.foley@kerzner.com,  luciana.barbosa@kerzner.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6S1CQw",
-      "name": "Kimpton Aysla Mallorca",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmEzlGVqrSpNJ57NQ3Y9H1X",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "Gerard.Arazo1@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6S1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6TVCgw",
-      "name": "Kimpton Los Monteros Marbella",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmEzlGVqrSpNJ57NQ3Y9H1X",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "Esperanza.Gonzalez1@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6TVCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWeqau2Cww",
-      "name": "Kimpton Shinjuku Tokyo",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SagVhGVqrSpNJ57oRivtV1L",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Japan",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "Nami.Ishizaki@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWeqau2Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qPECww",
-      "name": "Kimpton Vividora Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmEzlGVqrSpNJ57NQ3Y9H1X",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "david.rubio@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qPECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0Cgw",
-      "name": "L'oscar London",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SxQU0GVqrSpNJ570khlzN3L",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "GB",
-      "brand": "Michael Reybier Group",
-      "group": "Michael Reybier Group",
-      "email": "sbuchanan@loscarlondon.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWmuoTdCgw",
-      "name": "La Zambra",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmGtlhttps://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sot7iGVqrSpNJ57KPgM8gbw",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Unbound Collection",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "carla.rodriguez2@lazambrahotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWmuoTdCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_pCQw",
-      "name": "Ladera Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SO2tJGVqrSpNJ57P2LJkuq4",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "St Lucia",
-      "brand": "",
-      "group": "",
-      "email": "shay@ladera.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_pCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCAw",
-      "name": "Le Royal Monceau - Raffles Paris",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0YkGVqrSpNJ57IWXsR4jM",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "pauline.ehrhart@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjCCAw",
-      "name": "Les Roches Blanches",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShBP8GVqrSpNJ57JozsVa4q",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "France",
-      "brand": "",
-      "group": "",
-      "email": "c.morinaux@roches-blanches-cassis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjCCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXCgYG0CAw",
-      "name": "Lignee Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 7500,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sg3fMGVqrSpNJ57eP0cHLxv",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "February - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "",
-      "brand": "",
-      "group": "Lignee Hotels",
-      "email": "delphine.fangier@lignee-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXCgYG0CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOisCgw",
-      "name": "Maison M\u00e9tier",
-      "stage": "Marketing Complete",
-      "stageKey": "5007",
-      "package": "New Opening",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Social Media",
-          "timing": "January - Completed"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Unbound Collection",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "kledoux@fulcrumhospitality.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOisCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjiCQw",
-      "name": "Malliouhana Anguilla",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SL8PSGVqrSpNJ578HIK2qPZ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Anguilla",
-      "brand": "Storey Hotel Management",
-      "group": "Storey Hotel Management",
-      "email": "Marycarmen.Garcia@malliouhana.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjiCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjSCQw",
-      "name": "Mandarin Oriental Geneva",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SGGwHGVqrSpNJ5712i2CfuM",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Switzerland",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "laubier@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjSCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCgw",
-      "name": "Mandarin Oriental Hyde Park London",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SXQ6OGVqrSpNJ570pX5U4Ga",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "GB",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "svega@mohg.com, nmin@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiKCgw",
-      "name": "Mandarin Oriental Munich",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SNDPcGVqrSpNJ572hbbi6jY",
-      "features": [],
-      "quarters": [],
-      "country": "Germany",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "hbisetti@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiKCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOisCww",
-      "name": "Mandarin Oriental New York",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SQaIJGVqrSpNJ573pKsNzZe",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "alavalle@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOisCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiMCAw",
-      "name": "Mandarin Oriental Paris",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SKMsfGVqrSpNJ57bIYMN8tB",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "fmarongiu@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiMCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jFCww",
-      "name": "Mauna Lani, Auberge Collection",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQ8jRGVqrSpNJ57b058BqEa",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Auberge Resort",
-      "group": "Auberge Resorts Collection",
-      "email": "conlee.butler@aubergeresorts.com, Meredith.Miller@aubergeresorts.com, merygrei.montilla@aubergeresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jFCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9itCww",
-      "name": "Mazzaro Sea Palace",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T2Fc7GVqrSpNJ57Crn1GzFO",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "alessandra.rollini@vretreats.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9itCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9itCAw",
-      "name": "Mission Pacific Beach Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUTrxGVqrSpNJ57SRPUGYvI",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "JdV by Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "melisa.lindley@destinationhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9itCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCAw",
-      "name": "Mondrian Ibiza",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1S7doTGVqrSpNJ5704UyiQya",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Mondrian",
-      "group": "Accor",
-      "email": "paulo.deassis@mondrianhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j9Cgw",
-      "name": "Montage International",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ScBAXGVqrSpNJ57a1w2xG8e",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage International",
-      "group": "Montage International",
-      "email": "peter.schratz@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWBrL_7CAw",
-      "name": "Monte-Carlo Bay Hotel & Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShE8tGVqrSpNJ57F7kspgWd",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Monaco",
-      "brand": "SBM",
-      "group": "SBM",
-      "email": "m.vinciguerra@sbm.mc",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWBrL_7CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iFCQw",
-      "name": "Monte-Carlo Beach",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShE8tGVqrSpNJ57F7kspgWd",
-      "features": [],
-      "quarters": [],
-      "country": "Monaco",
-      "brand": "SBM",
-      "group": "SBM",
-      "email": "m.vinciguerra@sbm.mc",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iFCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j5Cww",
-      "name": "Mykonos Blu ",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 5000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyyccGVqrSpNJ57bI3bZv4N",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Greece",
-      "brand": "Grecotel",
-      "group": "Grecotel",
-      "email": "sofia.grigoratou@grecotel.com, Tina.Nykta@grecotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j5Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j1CQw",
-      "name": "Nantipa - A Tico Beach Experience",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SNfLiGVqrSpNJ573aCW1Z1o",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Costa Rica",
-      "brand": "",
-      "group": "",
-      "email": "mmikowski@nantipa.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWCjrmCCww",
-      "name": "Nanuku Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SL8PSGVqrSpNJ578HIK2qPZ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Fiji",
-      "brand": "Storey Hotel Management",
-      "group": "Storey Hotel Management",
-      "email": "marycarmen.garcia@storeyhotelgroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWCjrmCCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9idCAw",
-      "name": "Naples Grande Beach Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SNcyoGVqrSpNJ570f8G3vCE",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "aallen@naplesgrande.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9idCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ipCww",
-      "name": "Nekajui a Ritz-Carlton Reserve",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SsQN2GVqrSpNJ57qTRBj5Xu",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Costa Rica",
-      "brand": "Ritz-Carlton Reserve",
-      "group": "Marriott International",
-      "email": "karen.giordano@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ipCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iNCgw",
-      "name": "Nihi Sumba",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJDzEGVqrSpNJ57UuTkSvaO",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Indonesia",
-      "brand": "",
-      "group": "",
-      "email": "galit@nihi.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iNCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iZCww",
-      "name": "NoMad London",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJEW2GVqrSpNJ5774hwW7Vg",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "GB",
-      "brand": "NoMad",
-      "group": "Sydell Group",
-      "email": "azdunek@thenomadhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iZCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iNCww",
-      "name": "Noble House Hotels & Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SpBbNGVqrSpNJ57dXHq8kZz",
-      "features": [],
-      "quarters": [],
-      "country": "USA, Mexico",
-      "brand": "Noble House",
-      "group": "Noble House",
-      "email": "msehulster@noblehousehotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iNCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jNCAw",
-      "name": "Nobu Hotel Marbella",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SwQ2yGVqrSpNJ57f7SOCeIa",
-      "features": [],
-      "quarters": [],
-      "country": "Spain",
-      "brand": "Nobu",
-      "group": "AIC Hotel Group",
-      "email": "acastellano@nobuhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jNCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWahYSuCQw",
-      "name": "Nomade Ibiza",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 4500,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SuwISGVqrSpNJ57NW4LiaJq",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Nomade",
-      "group": "Nomade",
-      "email": "patricia@nomadepeople.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWahYSuCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWq04b6CAw",
-      "name": "Nomade Temple Madrid",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 4500,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SuwFfGVqrSpNJ572D5uhWAW",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Nomade",
-      "group": "Nomade",
-      "email": "patricia@nomadepeople.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWq04b6CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb7CQw",
-      "name": "Omni Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight + Additional Webinar",
-      "price": 10000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SqIE1GVqrSpNJ57IRKMgf7T",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Omni Hotels",
-      "group": "Omni Hotels",
-      "email": "jjorgensen@omnihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb7CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWN5uCfCgw",
-      "name": "One Aldwych",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SQXDaGVqrSpNJ571VpMhIe9",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "July - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "GB",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWN5uCfCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePzCQw",
-      "name": "One&Only Aesthesis",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQ8SrGVqrSpNJ57B9FknE0v",
-      "features": [],
-      "quarters": [],
-      "country": "Greece",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "nota.damala@oneandonlyresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePzCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOTCAw",
-      "name": "One&Only K\u00e9a Island",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SZYooGVqrSpNJ57s6m3RL9Z",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "joanna.zografaki@oneandonlykeaisland.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOTCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO7Cww",
-      "name": "One&Only Mandarina",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0SNGVqrSpNJ57rHfzu4xL",
-      "features": [],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "liliana.reed@kerzner.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO7Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePTCQw",
-      "name": "One&Only One Za\u2019abeel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SpVy3GVqrSpNJ57BMkINsfI",
-      "features": [],
-      "quarters": [],
-      "country": "UAE",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "Rita.Neves@oneandonlyonezaabeel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePTCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePzCAw",
-      "name": "One&Only Palmilla",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0UGGVqrSpNJ57LU7tFYJN/edit",
-      "features": [],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "liliana.reed@kerzner.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePzCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeONCQw",
-      "name": "One&Only Reethi Rah",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SAvkUGVqrSpNJ57W3l3UQxB",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Maldives",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "Antonio.Gracio@oneandonlyreethirah.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeONCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXUCAw",
-      "name": "PGA National Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQA1ZGVqrSpNJ57rRAwkHbV",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Salamander",
-      "group": "Salamander",
-      "email": "Michelle.Hawthorn@pgaresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXUCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWcCQw",
-      "name": "Palacio do Governador, SLH",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1STChVGVqrSpNJ57XmYkMqiP",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Portugal",
-      "brand": "",
-      "group": "",
-      "email": "luis.benedito@highgateportugal.pt",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWcCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePtCww",
-      "name": "Palmaia - The House of AiA",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SRztvGVqrSpNJ57sQzhvbHe",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned, February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned, March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1",
-        "Q2"
-      ],
-      "country": "Mexico",
-      "brand": "",
-      "group": "",
-      "email": "mortiz@thehouseofaia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePtCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX05rThCww",
-      "name": "Pan Pacific Hotel Group",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz1NiGVqrSpNJ57TBDsBDqf",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "",
-      "brand": "Pan Pacific",
-      "group": "Pan Pacific",
-      "email": "nonnie.warren@pphg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX05rThCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOdCAw",
-      "name": "Park Hyatt Bangkok",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmHMmGVqrSpNJ573hefaYpr",
-      "features": [],
-      "quarters": [],
-      "country": "Thailand",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "jiraporn.prasert@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOdCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOzCQw",
-      "name": "Park Hyatt Beaver Creek Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SZbMXGVqrSpNJ574ISe3Aet",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "krystal.ettawil@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOzCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXa1Nv9Cww",
-      "name": "Pazziella, a Luxury Collection Hotel, Capri",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUYYYGVqrSpNJ575N675OC2",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "d.moresi@grandhotelflora.net",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXa1Nv9Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX2t4rSCgw",
-      "name": "Pearl Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SpBXdGVqrSpNJ573RbwOipQ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "July - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "French Polynesia/Tahiti",
-      "brand": "Pearl Resorts",
-      "group": "Pearl Resorts",
-      "email": "dave@moanamarketing.com, loic.troupel@pearlresortsoftahiti.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX2t4rSCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWumeniCww",
-      "name": "Pendry Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ScBAXGVqrSpNJ57a1w2xG8e",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "peter.schratz@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWumeniCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbzCAw",
-      "name": "Peninsula Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SieipGVqrSpNJ57dJM5A9ev",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Multiple Countries",
-      "brand": "Peninsula",
-      "group": "Peninsula",
-      "email": "carolinegoux@peninsula.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbzCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWmCAw",
-      "name": "Phaea Blue Elounda Crete",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SeeU2GVqrSpNJ57r8d9ym4T",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Greece",
-      "brand": "",
-      "group": "",
-      "email": "christina.krey@phaea.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWmCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaTCAw",
-      "name": "Proper",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "",
-      "brand": "Proper",
-      "group": "Proper",
-      "email": "alyssa.uslaner@properhotel.com, rowan.hand@properhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaTCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCgw",
-      "name": "Puente Romano Beach Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SVCyJGVqrSpNJ57JZsokF73",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "Querido",
-      "group": "",
-      "email": "acastellano@puenteromano.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW-gOOqCAw",
-      "name": "Raffles",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 7500,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmGrYGVqrSpNJ57xKJXQmX3",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Multiple Countries",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "Tina.gassert@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW-gOOqCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6Cww",
-      "name": "Raffles Bali",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0C7GVqrSpNJ574IKCRQIz",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Indonesia",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "Melinda.Taylor@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6Cgw",
-      "name": "Raffles Boston",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0HIGVqrSpNJ577kziqI0Q",
-      "features": [
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "brandon.wan@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW8CQw",
-      "name": "Raffles Doha",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0PfGVqrSpNJ57eBm0fgOx",
-      "features": [],
-      "quarters": [],
-      "country": "Qatar",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "alison.marcoz@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW8CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCww",
-      "name": "Raffles Dubai",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0IGGVqrSpNJ57WxANjRFt",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "UAE",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "anoud.chehade@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCww",
-      "name": "Raffles Europejski Warsaw",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sg3TxGVqrSpNJ57Mf7FnCIF",
-      "features": [],
-      "quarters": [],
-      "country": "Poland",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "anna.czajkowska@raffles.com, tina.gassert@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWmCQw",
-      "name": "Raffles Istanbul",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0AoGVqrSpNJ57RrPHCVQV",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Turkey",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "alparslan.adiyaman@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWmCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCAw",
-      "name": "Raffles London at The OWO",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0LlGVqrSpNJ575O2uvu4e",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "GB",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "perry.petrou@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWTuOyjCAw",
-      "name": "Raffles Sentosa Singapore",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz022GVqrSpNJ57AF3npB5y",
-      "features": [],
-      "quarters": [],
-      "country": "Singapore",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "michael.parsons@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWTuOyjCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW2Cgw",
-      "name": "Raffles Seychelles",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz06YGVqrSpNJ57zcmjYkKs",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "July - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "Seychelles",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "valentina.sobeshchuk@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW2Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCAw",
-      "name": "Raffles Singapore",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz0NtGVqrSpNJ57pgeBgkAz",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Singapore",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "janielle.toh@raffles.com\nleenu.tarani@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWWCww",
-      "name": "Raffles The Palm Dubai",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz088GVqrSpNJ57q8TWDcsH",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "UAE",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "zeynep.peker@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWWCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOsCgw",
-      "name": "Regent Hong Kong",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SeereGVqrSpNJ5790P0qx46",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Hong Kong",
-      "brand": "Regent",
-      "group": "IHG Hotels & Resorts",
-      "email": "lolita.wong1@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOsCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXJs8eDCgw",
-      "name": "Ritz-Carlton Japan",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Japan",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "pouya.jalali@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXJs8eDCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECAw",
-      "name": "Rivoli Boutique Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNEgNGVqrSpNJ57qZpRhP79",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "tbalducci@arscollection.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWKCAw",
-      "name": "Rocco Forte Hotels",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Suw4kGVqrSpNJ57b3JNiNjU\nhttps://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Suw6aGVqrSpNJ57kOtqfqt2\nhttps://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Suw7sGVqrSpNJ57MN2L0car\nhttps://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Suw8vGVqrSpNJ57AJ6YvaKW",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "",
-      "brand": "Rocco Forte",
-      "group": "Rocco Forte",
-      "email": "lbalog@roccofortehotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWKCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-i_CQw",
-      "name": "Royal Hotel Sanremo",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SG0QPGVqrSpNJ57G3mXBgWF",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "marianne.dorsch@royalhotelsanremo.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-i_CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5igCgw",
-      "name": "Royal Mansour Casablanca",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNDgHGVqrSpNJ57Hrn80qL6",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Morocco",
-      "brand": "",
-      "group": "",
-      "email": "mmajdoubi@royalmansour.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5igCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCAw",
-      "name": "SLS Barcelona",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SpWThGVqrSpNJ57UwZk8Ydm",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "SLS",
-      "group": "Accor",
-      "email": "Carolina.HURTADO@slshotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCww",
-      "name": "SUMAQ Machu Picchu Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SLOm3GVqrSpNJ571itWeZkA",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Peru",
-      "brand": "",
-      "group": "",
-      "email": "angiecb@sumaqhotelperu.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-inCgw",
-      "name": "Salamander Middleburg",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SUuQ2GVqrSpNJ573wdn5NM2",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Salamander",
-      "group": "Salamander",
-      "email": "awishart@salamanderresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-inCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCww",
-      "name": "San Clemente Palace Venice",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SFFQBGVqrSpNJ5771kr65Ka",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "sales@sanclementepalace.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jgCgw",
-      "name": "Shangri-La Tokyo",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Ss9DgGVqrSpNJ57qJIynaY7",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Japan",
-      "brand": "Shangri-La",
-      "group": "Shangri-La",
-      "email": "anita.y@shangri-la.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jgCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCww",
-      "name": "Sheraton Maui Resort & Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SBQ2aGVqrSpNJ571hYI2qGY",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Hawaii",
-      "brand": "Sheraton",
-      "group": "Marriott International",
-      "email": "Joanna.Nakihei@sheraton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCgw",
-      "name": "Shutters on the Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SeedWGVqrSpNJ57MUIfx0GC",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "ETC Hotels",
-      "group": "ETC Hotels",
-      "email": "mperez@etchotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5igCAw",
-      "name": "Siari a Ritz-Carlton Reserve",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNCyGGVqrSpNJ57AgXgufUK",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Mexico",
-      "brand": "Ritz-Carlton Reserve",
-      "group": "Marriott International",
-      "email": "Marcos.GuerreroGonzalez@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5igCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-j3CQw",
-      "name": "Silversands Grenada",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1STNR6GVqrSpNJ57gMJzzyF4",
-      "features": [],
-      "quarters": [],
-      "country": "Grenada",
-      "brand": "",
-      "group": "",
-      "email": "mjhooper@silversandsgrenada.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-j3CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ivCQw",
-      "name": "Singer Palace Hotel Roma",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3S7ftkGVqrSpNJ570cxOZKMT",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "",
-      "group": "",
-      "email": "mmola@singerpalacehotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ivCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS2Cgw",
-      "name": "Sofitel Kia Ora Moorea Beach Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz03eGVqrSpNJ57mLgnBwGP",
-      "features": [],
-      "quarters": [],
-      "country": "French Polynesia",
-      "brand": "Sofitel",
-      "group": "Accor",
-      "email": "debora@robertsrepresentation.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS2Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSuCww",
-      "name": "Solaz a Luxury Collection Resort Los Cabos",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T2Z50GVqrSpNJ57yVktc7dW",
-      "features": [],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "Stephany.morales@luxurycollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSuCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWrjYjaCQw",
-      "name": "South Bank - Grace Bay Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 5000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T2Yz3GVqrSpNJ571P4dqKhM",
-      "features": [],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "Turks and Caicos",
-      "brand": "Grace Bay Resorts",
-      "group": "Grace Bay Resorts",
-      "email": "sara.archibald@gracebayresorts.com , scott.khile@gracebayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWrjYjaCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTuCww",
-      "name": "Southall Farm & Inn",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SOJ15GVqrSpNJ572SlZcMtA",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "twaslewski@southalltn.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTuCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTWCgw",
-      "name": "Stein Eriksen Lodge Deer Valley",
-      "stage": "Marketing Complete",
-      "stageKey": "5007",
-      "package": "Wedding Ad",
-      "price": 5000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T2Z0aGVqrSpNJ57y2OZbyqt",
-      "features": [],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Stein Eriksen",
-      "group": "Stein Eriksen",
-      "email": "acrider@steinlodge.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTWCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCww",
-      "name": "StolenTime Saint Lucia",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SCoKpGVqrSpNJ57BiSrp3xc",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "St Lucia",
-      "brand": "Hidden Doorways",
-      "group": "",
-      "email": "armin@sunsweptresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-ECQw",
-      "name": "THE DOLLI at Acropolis",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1S6XbhGVqrSpNJ57VGGWoEew",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Greece",
-      "brand": "Grecotel",
-      "group": "Grecotel",
-      "email": "maria.katsikea@grecotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-ECQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-KCAw",
-      "name": "Tanzerra Resorts",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 5000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SnKGcGVqrSpNJ572FhaprRs",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Multiple Countries",
-      "brand": "Tanzerra Resorts",
-      "group": "Tanzerra Resorts",
-      "email": "Linda.Schilling@Tanzerra.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-KCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCAw",
-      "name": "Terranea Resort",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmLTXGVqrSpNJ57X7pMZhKn",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Independent",
-      "group": "Independent",
-      "email": "leisuresales@terranea.com, cgale@terranea.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSGCww",
-      "name": "Terre Blanche H\u00f4tel Spa Golf Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T1SqsGVqrSpNJ5719iLLEe8",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "",
-      "group": "",
-      "email": "msalice@terre-blanche.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSGCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCgw",
-      "name": "The Barcelona EDITION",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "alessandro.ilardi@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCAw",
-      "name": "The BoTree",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SSRKyGVqrSpNJ572wD0DAv7",
-      "features": [],
-      "quarters": [],
-      "country": "GB",
-      "brand": "",
-      "group": "",
-      "email": "jeroen.suijker@thebotree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCgw",
-      "name": "The Breakers Palm Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SJFU6GVqrSpNJ57wsLWyMGU",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "tiffany.eckes@thebreakers.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-CCgw",
-      "name": "The Cape a Thompson Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Mexico",
-      "brand": "Thompson",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "kristin.neibergs@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-CCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCww",
-      "name": "The Cove at Atlantis",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1S8h9XGVqrSpNJ57Wk596VBi",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Bahamas",
-      "brand": "Atlantis Bahamas",
-      "group": "Atlantis Bahamas",
-      "email": "Megan.Prieto@atlantisparadise.com, Ann-Sofi.Gustafsson@atlantisparadise.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCAw",
-      "name": "The Dorchester",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SVahaGVqrSpNJ572sShbBQT",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "GB",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "susannah.lurie@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXIxIyTCgw",
-      "name": "The Excellence Collection",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQVGVGVqrSpNJ570L3G1EUr",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "January - Planned"
-        },
-        {
-          "name": "Webinar",
-          "timing": "January 2026"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "",
-      "brand": "Excellence Collection",
-      "group": "The Excellence Collection",
-      "email": "affiliates1@theexcellencecollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXIxIyTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-iCww",
-      "name": "The Excelsior a Luxury Collection Hotel Florence",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyylEGVqrSpNJ57YoDjH6jJ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "giampaolo.ugolini@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-iCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-iCAw",
-      "name": "The Fifth Avenue Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SBdMDGVqrSpNJ57V54JFeTa",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "mlauture@thefifthavenuehotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-iCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-cCgw",
-      "name": "The Global Ambassador",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SRwWVGVqrSpNJ57eiUkmL1j",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "kwesthoff@globalambassadorhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-cCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCQw",
-      "name": "The Hari",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SVHftGVqrSpNJ577GbVyEJE",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "GB",
-      "brand": "Hari Hotels",
-      "group": "",
-      "email": "kerstin.remy@thehari.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaTCQw",
-      "name": "The Hoxton Florence",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T0U0rGVqrSpNJ57jYvQ2iOL",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Hoxton",
-      "group": "Accor",
-      "email": "sophia.aitken@thehox.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaTCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbnCww",
-      "name": "The Lake Como EDITION",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUYciGVqrSpNJ57WAcbeYYw",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Italy",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "michela.celena@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbnCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NznCww",
-      "name": "The Loren at Pink Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SeffMGVqrSpNJ57vJvYJPs0",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Bermuda",
-      "brand": "",
-      "group": "",
-      "email": "rebecca@thelorenhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NznCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rpCgw",
-      "name": "The Newman",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "February - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "February - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "GB",
-      "brand": "",
-      "group": "",
-      "email": "alex@thenewman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rpCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW1nY-XCAw",
-      "name": "The Parker Palm Springs",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned, August - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned, August - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1",
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW1nY-XCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWMCQw",
-      "name": "The Ranch Malibu & The Ranch Hudson Valley",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUYa6GVqrSpNJ57Rtn2OIer",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "The Ranch",
-      "group": "The Ranch",
-      "email": "chrisr@theranchlife.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWMCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyHCAw",
-      "name": "The Ranch at Laguna Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SFjIjGVqrSpNJ571oyBu7Ff",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "carissa@ranchlb.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyHCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz7Cgw",
-      "name": "The Ritz-Carlton Bacara Santa Barbara",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SD7c1GVqrSpNJ5738Re1MB3",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "peter.mack@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz7Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XECww",
-      "name": "The Ritz-Carlton Kyoto",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2500,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sjl6qGVqrSpNJ575jDBAd4t",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Japan",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "pouya.jalali@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzPCgw",
-      "name": "The Ritz-Carlton Maui Kapalua",
-      "stage": "Brand Spotlight",
-      "stageKey": "5016",
-      "package": "Brand Spotlight",
-      "price": 5000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1Nhttps://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SomoLGVqrSpNJ57DjXJmC8Q",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Webinar",
-          "timing": "February 2026"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Aulani.Kealoha@ritzcarlton.com, Megan.Sayegh@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzPCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XkCQw",
-      "name": "The Ritz-Carlton Nikko",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2500,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sjl4PGVqrSpNJ57tl2HXPbP",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Japan",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "eri.sugimoto@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XkCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyzCww",
-      "name": "The Ritz-Carlton Oahu Turtle Bay",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SefhwGVqrSpNJ57vw79P87k",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Fabiola.Sotomayor@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyzCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzHCQw",
-      "name": "The Ritz-Carlton Orlando Grande Lakes",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SopebGVqrSpNJ570Jsj5eXZ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Thomas.Pfordresher@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzHCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XoCQw",
-      "name": "The Ritz-Carlton Rancho Mirage",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmH4fGVqrSpNJ57eaGBwvXW",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "tyler.j.landers@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XoCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzXCQw",
-      "name": "The Ritz-Carlton Residences Waikiki Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 5000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SomvBGVqrSpNJ57rJlYzvcT\nhttps://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3Sn3W1GVqrSpNJ571LnqS133",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Keenan.Rothenborg@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzXCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X0Cww",
-      "name": "The Ritz-Carlton Sarasota",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SuwCbGVqrSpNJ578VYFUAv9",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "peter.francis@marriottluxurybrands.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X0Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICww",
-      "name": "The Ritz-Carlton Tokyo",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 2500,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sjl8QGVqrSpNJ574VSJB7si",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        }
-      ],
-      "quarters": [],
-      "country": "Japan",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "pouya.jalali@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XgCgw",
-      "name": "The Riviera Maya EDITION",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmH8BGVqrSpNJ572palqiIj",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed, August - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "Alejandro.Rivera@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XgCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWw4uOnCgw",
-      "name": "The Roc ",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 0,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1S6XbhGVqrSpNJ57VGGWoEew",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Greece",
-      "brand": "Grecotel",
-      "group": "Grecotel",
-      "email": "sofia.grigoratou@grecotel.com, Chrysavgi.Anagnostopoulou@grecotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWw4uOnCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XYCQw",
-      "name": "The Roosevelt New Orleans A Waldorf Astoria Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SUwHrGVqrSpNJ570ctOkwxH",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "nicki.fourroux@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XYCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCAw",
-      "name": "The Seabird Ocean Resort & Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUTrxGVqrSpNJ57SRPUGYvI",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Destination by Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "melisa.lindley@destinationhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCgw",
-      "name": "The Shelbourne",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 0,
-      "invoiceStatus": "In Kind Sponsorship",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Proper",
-      "group": "Proper",
-      "email": "rowan.hand@properhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XYCgw",
-      "name": "The St. Regis Deer Valley",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SeebiGVqrSpNJ57i4M9JENZ",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed, November - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q4 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q4"
-      ],
-      "country": "USA",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "john.bagley@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XYCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W4Cww",
-      "name": "The St. Regis Florence",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyymyGVqrSpNJ57HLIyiEWf",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "giampaolo.ugolini@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XgCAw",
-      "name": "The St. Regis Kanai Resort Riviera Maya",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmHIhGVqrSpNJ57buoztbpw",
-      "features": [],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "alejandro.rivera@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XgCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XQCww",
-      "name": "The St. Regis Maldives Vommuli Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SUaYgGVqrSpNJ57ChhWRXBE",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Maldives",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "Zhilah.Vego@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XQCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WwCQw",
-      "name": "The St. Regis Mardavall Mallorca Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNEkiGVqrSpNJ572MpaDltI",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Spain",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "angelica.osoriocollazos@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WwCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WECQw",
-      "name": "The St. Regis Punta Mita Resort",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3S6gYjGVqrSpNJ57246iIgXM",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Mexico",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "nicholas.lobberecht@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WECQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCQw",
-      "name": "The Strand Turks & Caicos",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyzIiGVqrSpNJ57k4pYpbse",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Independent",
-      "group": "Independent",
-      "email": "lindsey@destinationsofdistinction.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICAw",
-      "name": "The Surrey A Corinthia Hotel",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmH6RGVqrSpNJ57P0TO5Kft",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned, July - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned, July - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Corinthia",
-      "group": "Corinthia",
-      "email": "shane.mills@corinthia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0CQw",
-      "name": "The Tampa EDITION",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sht9oGVqrSpNJ57AeSrak4a",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned, August - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned, August - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "Mohammed.Daod@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP8Cww",
-      "name": "The Towers at Lotte New York Palace",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SCm57GVqrSpNJ57lLlw4T1w",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "September - Planned, February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "September - Planned, February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "February - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1",
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "Lotte",
-      "group": "Lotte",
-      "email": "mnagle@lottenypalace.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP8Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWT19jVCww",
-      "name": "The Westerly at Hilton Aruba Caribbean Resort",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SyzuDGVqrSpNJ57uOvFAYBB",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Aruba",
-      "brand": "Hilton",
-      "group": "Hilton",
-      "email": "Jeanine.Gilchrist@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWT19jVCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX-vPPWCgw",
-      "name": "The Westin Dragonara Resort - Malta",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShBEPGVqrSpNJ574IRDloZd",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Malta",
-      "brand": "Westin",
-      "group": "Marriott International",
-      "email": "Sherilyn.Micallef@westin.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX-vPPWCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWj4eCPCww",
-      "name": "The Westin Grand Cayman Seven Mile Beach Resort & Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sz00LGVqrSpNJ572X6Nspti",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Cayman Islands",
-      "brand": "Westin",
-      "group": "Marriott International",
-      "email": "ayu.purbasanti@pyramidglobal.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWj4eCPCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1Cgw",
-      "name": "Tivoli Kopke Porto Gaia Hotel",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SuwLcGVqrSpNJ57T4rLqFC3",
-      "features": [],
-      "quarters": [],
-      "country": "Portugal",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "j.belchior@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPsCww",
-      "name": "Tortuga Bay Puntacana",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SPVQjGVqrSpNJ570MLyiVig",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned, February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned, February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "February - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q1"
-      ],
-      "country": "Dominican Republic",
-      "brand": "",
-      "group": "",
-      "email": "kpeguero@puntacana.com, alegarcia@puntacana.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPsCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPECgw",
-      "name": "Viceroy at Ombria Algarve",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQ8rzGVqrSpNJ57Cwk7Po8g",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Portugal",
-      "brand": "Viceroy",
-      "group": "Viceroy",
-      "email": "joao.silva@viceroy.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPECgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qPUCQw",
-      "name": "Vignette Collection Dinso Resort & Villas Ko Chang",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SZbIWGVqrSpNJ57hpVHldC8",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Thailand",
-      "brand": "Vignette",
-      "group": "IHG Hotels & Resorts",
-      "email": "phanarat.neawphanassawa@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qPUCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPMCgw",
-      "name": "Villa Dubrovnik",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ST1n8GVqrSpNJ57cdbb9It0",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "June - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Croatia",
-      "brand": "",
-      "group": "",
-      "email": "igajic@villa-dubrovnik.hr",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPMCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rpCww",
-      "name": "Villa San Michele, a Belmond Hotel, Florence",
-      "stage": "New Opening",
-      "stageKey": "5017",
-      "package": "New Opening",
-      "price": 5000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQA8zGVqrSpNJ57AAZTEQbp",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Journal Article",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Social Media",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "Belmond",
-      "group": "Belmond Ltd",
-      "email": "andrea.gervasoni@belmond.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rpCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOECQw",
-      "name": "W Algarve",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQRh1GVqrSpNJ57J6lVmcIG",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Portugal",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "ricardo.gomes@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOECQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOSCAw",
-      "name": "W Aspen & The Sky Residences at W Aspen",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmH2DGVqrSpNJ57rYCmeQ8z",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "October - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "barbara.anderson@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOSCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfxCgw",
-      "name": "W Barcelona",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SnKwWGVqrSpNJ57eYrlti9v",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Spain",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "julia.tolosa@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfxCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWsCgw",
-      "name": "W Fort Lauderdale",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SnKtdGVqrSpNJ57g0IUZZz3/edit",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "July - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "liza.vecino-castro@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWsCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWK2JT-Cww",
-      "name": "W Muscat",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SQV1BGVqrSpNJ57EwXdFbAL",
-      "features": [],
-      "quarters": [],
-      "country": "Oman",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "Romano.Hoffman@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWK2JT-Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXMCAw",
-      "name": "W Punta Cana",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SVd2DGVqrSpNJ57eEFYhKW5",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Dominican Republic",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "luz.g.alvarado@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXMCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXzw5bPCgw",
-      "name": "W Sardinia",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1T1t8yGVqrSpNJ57EV8o27IM",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q1 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "Italy",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "Ilaria.Zambelli@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXzw5bPCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycexCgw",
-      "name": "W South Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1ShBJaGVqrSpNJ570MR4D1Jk",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "February - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "isabel.gracia@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycexCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCgw",
-      "name": "Wailea Beach Resort, Marriott Maui",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNGoAGVqrSpNJ57lKnTnujq",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Marriott International",
-      "group": "Marriott International",
-      "email": "ashley.carroll@waileabeachresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceuCww",
-      "name": "Waldorf Astoria Chicago",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SO18BGVqrSpNJ57AJyvscfO",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "March - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Leslie.Vosburgh@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceuCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfOCQw",
-      "name": "Waldorf Astoria Los Cabos Pedregal",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3ShbmsGVqrSpNJ570xe9CNEw",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "August - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q3 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "Mexico",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Jenny.Debonis2@Hilton.com Patti.Perez@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfOCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycehCww",
-      "name": "Waldorf Astoria Monarch Beach",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Sc6tqGVqrSpNJ579efn1GqS",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Molly.Sanborn@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycehCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceRCAw",
-      "name": "Waldorf Astoria Osaka",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1Ss98wGVqrSpNJ57NUrtMbkl",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned, September - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "February - Planned, October - Planned"
-        }
-      ],
-      "quarters": [],
-      "country": "Japan",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Constantin.Benesch@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceRCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfeCww",
-      "name": "Waldorf Astoria Park City",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SmGyJGVqrSpNJ57PxNuO5BN",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "October - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "March - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q4 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q4"
-      ],
-      "country": "USA",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "lauren.norwood@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfeCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyce-CQw",
-      "name": "Waldorf Astoria Riviera Maya",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SBcu8GVqrSpNJ573i3zyxfB",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned, September - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "May - Planned, September - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "May - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q3"
-      ],
-      "country": "Mexico",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "oscar.quijano@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyce-CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceBCQw",
-      "name": "Waldorf Astoria Washington DC",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Outstanding",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SrMoqGVqrSpNJ578CeVfcuj",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "May - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "June - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2"
-      ],
-      "country": "USA",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "stephanie.bernazard@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceBCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCQw",
-      "name": "Westin Maui Resort and Spa",
-      "stage": "Tier 1",
-      "stageKey": "5014",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/invoices/in_1SNzlmGVqrSpNJ57BfSmM2w4",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Westin",
-      "group": "Marriott International",
-      "email": "libby.child@westin.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyce-Cgw",
-      "name": "Yacht Club at The Boca Raton",
-      "stage": "Tier 2",
-      "stageKey": "5015",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/payments/pi_3S5qSNGVqrSpNJ5721Oz0W0J",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "April - Planned, October - Planned"
-        },
-        {
-          "name": "Forum",
-          "timing": "April - Planned, October - Planned"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "Q2 - Planned"
-        },
-        {
-          "name": "Advisor Assets",
-          "timing": "April - Planned"
-        }
-      ],
-      "quarters": [
-        "Q2",
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "Boca Raton",
-      "group": "Boca Raton",
-      "email": "Dward@TheBocaRaton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyce-Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfhCww",
-      "name": "Zad\u00fan a Ritz-Carlton Reserve Los Cabos",
-      "stage": "Marketing Complete",
-      "stageKey": "5007",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Paid",
-      "invoiceUrl": "https://dashboard.stripe.com/acct_1N83G5GVqrSpNJ57/payments/pi_3SEAiGGVqrSpNJ572qC4bhy6",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Forum",
-          "timing": "January - Completed"
-        },
-        {
-          "name": "Newsletter",
-          "timing": "January - Completed"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Ritz-Carlton Reserve",
-      "group": "Marriott International",
-      "email": "JoseAntonio.Rodriguez@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfhCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeYCww",
-      "name": "1 Hotel South Beach",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Starwood Hotels",
-      "group": "Starwood Hotels & Resorts",
-      "email": "jolyon.hyne@1hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeYCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACQw",
-      "name": "Airelles Venezia",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "New Opening",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Airelles",
-      "group": "Airelles",
-      "email": "e.petitpez@airelles.com c.galan@airelles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACgw",
-      "name": "Al Maha a Luxury Collection Desert Resort & Spa Dubai",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "alma.gandhi@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeekCAw",
-      "name": "Anantara Al Jabal Al Akhdar Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "lcruz@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeekCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafPCgw",
-      "name": "Anantara Chiang Mai Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "kamutporn_ch@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafPCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeICww",
-      "name": "Anantara Convento di Amalfi Grand Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "f.ayala@anantara-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeICww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCAw",
-      "name": "Anantara Desaru Coast Resort & Villas",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "znoor@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefYCgw",
-      "name": "Anantara Golden Triangle Elephant Camp & Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "rojjirat_op@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefYCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zae_Cww",
-      "name": "Anantara Hoi An Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "lbui@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zae_Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefwCQw",
-      "name": "Anantara Kihavah Maldives Villas",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "lcruz@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefwCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefoCww",
-      "name": "Anantara Koh Yao Yai Resort & Villas",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "karun_co@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefoCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeYCQw",
-      "name": "Anantara Lawana Koh Samui Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "fkolde@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeYCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeewCAw",
-      "name": "Anantara Layan Phuket Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "sales.apk@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeewCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_Cww",
-      "name": "Anantara Mai Khao Phuket Villas",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "sales.apk@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaevCgw",
-      "name": "Anantara Mina Ras Al Khaimah Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "shammond@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaevCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICww",
-      "name": "Anantara Palais Hansen Vienna Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "v.bakovic@anantara-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACAw",
-      "name": "Anantara Palazzo Naiadi Rome",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "f.ayala@anantara-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACww",
-      "name": "Anantara Peace Haven Tangalle Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "dfernando@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeACww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefgCgw",
-      "name": "Anantara Quy Nhon Villas",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "lbui@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefgCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCgw",
-      "name": "Anantara Rasananda Koh Phangan Villas",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "amorn_be@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeICAw",
-      "name": "Anantara Siam Bangkok Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "solos_fa@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeICAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTWCww",
-      "name": "Anantara Ubud Bali Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "lcruz@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTWCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSBCAw",
-      "name": "Anantara Villa Padierna Palace - Benahavis Marbella Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "Lcruz@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSBCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JT2Cgw",
-      "name": "Anantara World Islands Dubai Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "Lcruz@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JT2Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSuCQw",
-      "name": "Andaz Scottsdale Resort & Bungalows",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Andaz",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "kathryn.carlton@andaz.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSuCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JT2CAw",
-      "name": "Angsana Corfu Resort & Spa",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Angsana",
-      "group": "Accor",
-      "email": "leisure-sales@angsana.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JT2CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWs1IW8Cww",
-      "name": "Aspen Meadows Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Ashley.Mcgee@aspenmeadows.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWs1IW8Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qZCgw",
-      "name": "Avani+ Fares Maldives Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "ksiva@avanihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qZCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSxCww",
-      "name": "BLESS Hotel Madrid",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "BLESS",
-      "group": "Palladium",
-      "email": "malena.hohn@blesscollectionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSxCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWEgZylCgw",
-      "name": "Banyan Tree",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "",
-      "email": "Katrina.gomez@groupbanyan.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWEgZylCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSuCgw",
-      "name": "Beau-Rivage Geneva",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Marugal",
-      "group": "Marugal",
-      "email": "stephanie.myter@beau-rivage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSuCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSWCQw",
-      "name": "Bellevue Palace",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Michel Reybier Group",
-      "group": "Michel Reybier Group",
-      "email": "j.alonso@bellevue-palace.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSWCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGqCgw",
-      "name": "Brunelleschi Hotel",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Collezione Em",
-      "group": "",
-      "email": "abargigli@collezioneem.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGqCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGiCgw",
-      "name": "Canyon Ranch Resorts",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Canyon Ranch",
-      "group": "Canyon Ranch",
-      "email": "mcasas@canyonranch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGiCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHWCQw",
-      "name": "Casa de Campo Resort & Villas",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "jane@ccampo.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHWCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG8Cww",
-      "name": "Chabl\u00e9 Maroma",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Chable",
-      "group": "Chable Group",
-      "email": "daniel.ceballos@chablehotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG8Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW54oSoCQw",
-      "name": "Conrad Koh Samui",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Tier 1",
-      "price": 3000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Conrad",
-      "group": "Hilton Hotels & Resorts",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW54oSoCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCAw",
-      "name": "Conservatorium Hotel Amsterdam",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "akrausz@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66q_Cgw",
-      "name": "Coquillade Provence",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "",
-      "group": "",
-      "email": "francois.gelly@coquillade.fr",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66q_Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qECgw",
-      "name": "D Maris Bay",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "esra.arpat@dmarisbay.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qECgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rYCQw",
-      "name": "Delamar Greenwich Harbor",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Delamar",
-      "group": "Delamar",
-      "email": "kpixley@thedelamar.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rYCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rQCAw",
-      "name": "Delano Miami Beach",
-      "stage": "Needs Invoice",
-      "stageKey": "5011",
-      "package": "New Opening",
-      "price": 4500,
-      "invoiceStatus": "To Invoice",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "USA",
-      "brand": "Delano",
-      "group": "Accor",
-      "email": "Ligy.ALARCON@delanohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rQCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rYCgw",
-      "name": "Domes Zeen A Luxury Collection Resort Chania",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "angelique.johns@domesresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rYCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-DCgw",
-      "name": "Dunton Hot Springs",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "erossi@duntonmanagement.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-DCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-rCQw",
-      "name": "Eden Roc Cap Cana",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "p.castillo@edenroccapcana.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-rCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXhhpXACww",
-      "name": "El Encanto",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "",
-      "group": "",
-      "email": "Andrew.Jeffries@elencanto.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXhhpXACww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_NCQw",
-      "name": "Esprit Saint Germain",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "francois@espritsaintgermain.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_NCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbo4W4Cww",
-      "name": "Explora El Calafate",
-      "stage": "Needs Invoice",
-      "stageKey": "5011",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "To Invoice",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Explora",
-      "group": "Explora",
-      "email": "wzappelli@explora.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbo4W4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qZCAw",
-      "name": "FCC Angkor by Avani",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "lma@fccangkor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qZCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-LCQw",
-      "name": "Faena Miami Beach",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Faena",
-      "group": "Accor",
-      "email": "aschneider@faena.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-LCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-9Cgw",
-      "name": "Faena New York",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Faena",
-      "group": "Accor",
-      "email": "aschneider@faena.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_DCAw",
-      "name": "Fairmont Copley Plaza",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Joseph.Lincoln@Fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_DCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-TCww",
-      "name": "Fairmont El San Juan Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "eunice.vargas@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-TCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_jCww",
-      "name": "Fairmont Scottsdale Princess",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Sonja.Nelson@Fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_jCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_TCAw",
-      "name": "Fairmont Tokyo",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "ihoko.noda@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_TCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_dCQw",
-      "name": "Farmhouse Inn",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Foley Entertainment Group",
-      "group": "Foley Entertainment Group",
-      "email": "kwhite@foleyentertainmentgroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_dCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_lCAw",
-      "name": "Fasano Punta del Este",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_lCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eqCQw",
-      "name": "Fontainebleau Las Vegas",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fontainebleau",
-      "group": "Fontainebleau",
-      "email": "jenny.gasalao@fblasvegas.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eqCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-ecCQw",
-      "name": "Four Seasons Hotel Cairo at The First Residence",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Egypt",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "Ahmad.abdullatif@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-ecCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y3zCgw",
-      "name": "Four Seasons Resort Dubai at Jumeirah Beach",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "UAE",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "Anel.Sergazina@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y3zCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eCCww",
-      "name": "Furore Grand Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "fabiana.pellone@furoregrandhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eCCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fMCgw",
-      "name": "Giza Palace",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "stefan.fuchs@gizapalace.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fMCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qZCww",
-      "name": "Grand Hotel Belvedere",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Suzanne@corbocollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qZCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fMCAw",
-      "name": "Grand Hotel Minerva",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Brand Spotlight",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Collezione EM",
-      "group": "Collezione EM",
-      "email": "abargigli@collezioneem.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fMCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eaCgw",
-      "name": "Grand Hotel des Bains Kempinski St Moritz",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Kempinski",
-      "group": "Kempinski",
-      "email": "morgane.doucey@kempinski.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eaCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXSzprXCww",
-      "name": "Grand Hyatt Scottsdale",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Grand Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "jason.perone@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXSzprXCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX8xrTMCgw",
-      "name": "HIlton Sorrento Palace",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hilton",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Daniela.Palomba@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX8xrTMCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSTCAw",
-      "name": "Hospes Palacio del Bailio",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "isales@hospes.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSTCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTbCQw",
-      "name": "Hotel Bardo Savannah",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mitzi@staybardo.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTbCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTTCgw",
-      "name": "Hotel Californian",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Foley Entertainment Group",
-      "group": "Foley Entertainment Group",
-      "email": "kwhite@FoleyEntertainmentGroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXUCww",
-      "name": "Hotel Eldorado Paris",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "pauline@paulinederamond.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXUCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTTCww",
-      "name": "Hotel Fasano Angra dos Reis",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTTCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTXCAw",
-      "name": "Hotel Fasano Boa Vista",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTXCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTnCww",
-      "name": "Hotel Fasano Rio de Janeiro",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTnCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTjCQw",
-      "name": "Hotel Fasano Salvador",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTjCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTDCgw",
-      "name": "Hotel Fasano Sao Paulo",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTDCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oT7Cgw",
-      "name": "Hotel Fasano Sao Paulo Itaim",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oT7Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSTCgw",
-      "name": "Hotel Fasano Trancoso",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fasano",
-      "group": "Fasano",
-      "email": "ricardo.gilber@fasano.com.br",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGLCww",
-      "name": "Hotel Grande Bretagne a Luxury Collection Hotel Athens",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "tania.mastrantoni@luxurycollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGLCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qFCgw",
-      "name": "Hotel Seville NoMad - Unbound Collection by Hyatt",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Unbound Collection",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "marcus.ong@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qFCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSzCww",
-      "name": "Hotel de Paris Monte-Carlo",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Monaco",
-      "brand": "SBM",
-      "group": "SBM",
-      "email": "m.vinciguerra@sbm.mc",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSzCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSbCgw",
-      "name": "Hotel de Toiras",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "nkundoo@once-lifetime.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSbCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0Cww",
-      "name": "H\u00f4tel Plaza Ath\u00e9n\u00e9e",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "joanna.joussemet@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSrCQw",
-      "name": "H\u00f4tel du Couvent Luxury Collection Hotel",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "Mt@hotelducouvent.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSrCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGHCww",
-      "name": "Inkaterra Hacienda Urubamba",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Inkaterra",
-      "group": "Inkaterra",
-      "email": "virtuoso@inkaterra.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGHCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX6lNqyCww",
-      "name": "InterContinental Dubai Festival City",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "United Arab Emirates",
-      "brand": "InterContinental",
-      "group": "IHG Hotels & Resorts",
-      "email": "Justine.Bockenmeyer@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX6lNqyCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX6lNrKCQw",
-      "name": "InterContinental Halong Bay Resort",
-      "stage": "Needs Invoice",
-      "stageKey": "5011",
-      "package": "New Opening",
-      "price": 4500,
-      "invoiceStatus": "Waiting for billing details",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Vietnam",
-      "brand": "InterContinental",
-      "group": "IHG Hotels & Resorts",
-      "email": "Ngoc.Ngo1@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX6lNrKCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX6lNqSCQw",
-      "name": "InterContinental London Park Lane",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "United Kingdom",
-      "brand": "InterContinental",
-      "group": "IHG Hotels & Resorts",
-      "email": "Sarah.BorgesdeSousa@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX6lNqSCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuHzCAw",
-      "name": "Isle of Eriska Hotel",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Jgreen@jg-collection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuHzCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWUwoj1CQw",
-      "name": "JW Marriott Orlando Bonnet Creek",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "JW Marriott",
-      "group": "Marriott International",
-      "email": "Linda.B.Miller@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWUwoj1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWF77aXCQw",
-      "name": "JW Marriott Reston Station Hotel",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "JW Marriott",
-      "group": "Marriott International",
-      "email": "NTan@jwreston.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWF77aXCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-pCgw",
-      "name": "Kempinski The Boulevard Dubai",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Kempinski",
-      "group": "Kempinski",
-      "email": "Jonathan.Gonzalez@adnhmc.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-pCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6T9CQw",
-      "name": "Kimpton Fitzroy London",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "United Kingdom",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "Rebecca.Kircos@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6T9CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-1CQw",
-      "name": "Kimpton Grand Roatan Resort and Spa",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "Whitney.Dang@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-VCgw",
-      "name": "King George a Luxury Collection Hotel Athens",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "tania.mastrantoni@luxurycollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-VCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-NCQw",
-      "name": "Kura Boutique Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Cayuga Collection",
-      "group": "Cayuga Collection",
-      "email": "turney@clarkkotula.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-NCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW8sJGjCgw",
-      "name": "La Concha Resort Puerto Rico",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "Marriott International",
-      "email": "lgonzalez@laconcharesort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW8sJGjCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_VCgw",
-      "name": "LaPlaya Beach & Golf Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Noble House",
-      "group": "Noble House",
-      "email": "msehulster@noblehousehotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_VCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-tCAw",
-      "name": "Lake Nona Wave Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "CoralTree Hotels",
-      "group": "CoralTree Hospitality",
-      "email": "dkasprzak@lakenonahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-tCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_5Cww",
-      "name": "Las Alcobas a Luxury Collection Hotel Mexico City",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "mchiche@lasalcobas.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_5Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCgw",
-      "name": "Layan Residences by Anantara",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "duangchompoo_po@anantara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWECgw",
-      "name": "Le Meurice",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "joanna.joussemet@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWECgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjiCgw",
-      "name": "Lefay Resort & SPA Dolomiti",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Lefay",
-      "group": "Lefay Resorts",
-      "email": "m.fresta@lefayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjiCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiCCAw",
-      "name": "Lefay Resort & SPA Lago di Garda",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Lefay",
-      "group": "Lefay Resorts",
-      "email": "m.fresta@lefayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiCCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW4utuFCgw",
-      "name": "Les Hotels Baverez",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Audrey.Arnaud@hotels-baverez.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW4utuFCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOj0CQw",
-      "name": "Les Sources de Caudalie",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Les Sources",
-      "group": "Les Sources",
-      "email": "helene.huang@sources-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOj0CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iZCQw",
-      "name": "ME Ibiza",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Melia",
-      "group": "Meli\u00e1",
-      "email": "julia.buisan@melia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iZCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1CQw",
-      "name": "ME Malta",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Melia",
-      "group": "Meli\u00e1",
-      "email": "valentina.mizzi@melia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ijCAw",
-      "name": "MGM Resorts International Operations Inc.",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "MGM",
-      "group": "MGM",
-      "email": "luxuryreservations@mgmresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ijCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOi8CAw",
-      "name": "MacArthur Place Hotel & Spa",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Foley Entertainment Group",
-      "group": "Foley Entertainment Group",
-      "email": "kwhite@FoleyEntertainmentGroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOi8CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOj4Cww",
-      "name": "Macakizi",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Macakizi",
-      "group": "Macakizi",
-      "email": "hazel@macakizi.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOj4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWAiKm9Cgw",
-      "name": "Maison Bauchart",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Barnes Hospitality",
-      "group": "",
-      "email": "d.chernov@maisonbarnes.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWAiKm9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWilfnqCAw",
-      "name": "Makeready",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "SDavenport@makereadyexperience.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWilfnqCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjMCgw",
-      "name": "Malibu Beach Inn",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Catrinel@manibrothers.com, od@malibubeachinn.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjMCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCQw",
-      "name": "Mandarin Oriental Canouan",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "nking@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb3Cgw",
-      "name": "Mandarin Oriental Lutetia Paris",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "julien.guillon@hotellutetia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb3Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQ2qS2Cgw",
-      "name": "Marriott Hawaii",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Brand Spotlight + Additional Webinar",
-      "price": 10000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Marriott International",
-      "group": "Marriott International",
-      "email": "Deaner.snively@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQ2qS2Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jNCQw",
-      "name": "Masseria Torre Maizza a Rocco Forte hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "fpretin@roccofortehotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jNCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5Cgw",
-      "name": "Me Malaga",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Melia",
-      "group": "Meli\u00e1",
-      "email": "cristina.rio@melia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rZCww",
-      "name": "Me Marbella",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Melia",
-      "group": "Meli\u00e1",
-      "email": "cristina.rio@melia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rZCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ilCQw",
-      "name": "Meadowood Napa Valley",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dlucas@meadowood.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ilCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iVCQw",
-      "name": "Miraval Austin",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Miraval",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "marissa.halberstadt@miravalresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iVCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9i5CQw",
-      "name": "Montage Deer Valley",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "Trisha.Welsby@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9i5CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rZCAw",
-      "name": "NH Collection Fori Imperiali",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "s.gregori@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rZCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCgw",
-      "name": "NH Collection Palazzo Sitano",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "s.gregori@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rVCAw",
-      "name": "NH Collection Porta Rossa",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "s.gregori@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rVCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCgw",
-      "name": "NH Collection Taormina",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "s.gregori@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXWy9u4CQw",
-      "name": "Na Praia",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Portugal",
-      "brand": "",
-      "group": "",
-      "email": "jgaiao@napraia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXWy9u4CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWykp2DCAw",
-      "name": "Nomade People",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Spain",
-      "brand": "",
-      "group": "",
-      "email": "patricia@nomadepeople.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWykp2DCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECww",
-      "name": "Nomade Tulum",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Nomade",
-      "group": "Nomade",
-      "email": "ursula.nicholas@nomadepeople.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePdCww",
-      "name": "One&Only Moonlight Basin",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "One&Only",
-      "group": "Kerzner International",
-      "email": "zachary.burns@oneandonlyresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePdCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOrCww",
-      "name": "Park Hotel Vitznau",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "c.celik@phv.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOrCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECgw",
-      "name": "Park Hyatt Aviara Resort, Golf Club & Spa",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "karina.gaughran@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qFCww",
-      "name": "Park Hyatt Johannesburg",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "charmaine.chinappan@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qFCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO9Cgw",
-      "name": "Park Hyatt St. Kitts",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "cari.abonador-alexander@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW8Cgw",
-      "name": "Pier Sixty-Six",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "CoralTree Hotels",
-      "group": "CoralTree Hospitality",
-      "email": "emacho@piersixtysixresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW8Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCQw",
-      "name": "Portrait Firenze",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Lungarno Collection",
-      "group": "Lungarno Collection",
-      "email": "f.martini@lungarnocollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXqCQw",
-      "name": "Portrait Milano",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Lungarno Collection",
-      "group": "Lungarno Collection",
-      "email": "f.martini@lungarnocollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXqCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXaCAw",
-      "name": "Portrait Roma",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Lungarno Collection",
-      "group": "Lungarno Collection",
-      "email": "f.martini@lungarnocollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXaCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXiCgw",
-      "name": "Pousada de Lisboa - Praca do Comercio",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "ana.amorim@pestana.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXiCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja7Cgw",
-      "name": "Prince Resorts - Mauna Kea Beach Autograph Collection",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Autograph Collection",
-      "group": "Marriott International",
-      "email": "c.schooss@princehawaii.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja7Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWZ84brCQw",
-      "name": "Rixos Premium Saadiyat Island",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "UAE",
-      "brand": "Rixos",
-      "group": "Accor",
-      "email": "Petr.VANICEK@rixos.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWZ84brCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWyCQw",
-      "name": "Rocpool Reserve",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "jgreen@jg-collection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWyCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCQw",
-      "name": "Rosewood Baha Mar",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Rosewood",
-      "group": "Rosewood Hotels & Resorts",
-      "email": "shaylyn.riley@rosewoodhotels.com, oriane.gurland@rosewoodhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTRCww",
-      "name": "SO/ Paris",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "SO/",
-      "group": "Accor",
-      "email": "Emeline.VIGUIE@so-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTRCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iPCww",
-      "name": "Salamander Collection",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Salamander",
-      "group": "Salamander",
-      "email": "ccox@salamanderhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iPCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iQCww",
-      "name": "Salamander Washington DC",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Salamander",
-      "group": "Salamander",
-      "email": "mwright@salamanderhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iQCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iACQw",
-      "name": "San Canzian Hotel & Residences",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dolores@san-canzian.hr",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iACQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jfCww",
-      "name": "Sanctuary Camelback Mountain Resort and Spa",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Gurney's",
-      "group": "Gurney's Resorts",
-      "email": "debra.reasy@sanctuaryaz.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jfCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iICQw",
-      "name": "Santa Monica Proper",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Proper",
-      "group": "Proper",
-      "email": "alyssa.uslaner@properhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iICQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iXCgw",
-      "name": "Secret Bay Resort",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "almer@secretbay.dm",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iXCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ivCgw",
-      "name": "Siam Kempinski Hotel Bangkok",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Kempinski",
-      "group": "Kempinski",
-      "email": "taryn.wolt@kempinski.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ivCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iICgw",
-      "name": "Silversands Mykonos",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mcarrillo@silversandsgrenada.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iICgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qO0CAw",
-      "name": "Six Senses Kaplankaya",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Turkey",
-      "brand": "Six Senses",
-      "group": "IHG Hotels & Resorts",
-      "email": "Gamze.buyuksariyildiz@sixsenses.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qO0CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOECQw",
-      "name": "Six Senses La Sagesse Grenada",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Grenada",
-      "brand": "Six Senses",
-      "group": "IHG Hotels & Resorts",
-      "email": "Maria.Daniel@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOECQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qP0CQw",
-      "name": "Six Senses London",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "United Kingdom",
-      "brand": "Six Senses",
-      "group": "IHG Hotels & Resorts",
-      "email": "stefan.mueller@sixsenses.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qP0CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCQw",
-      "name": "Sofitel Mexico City Reforma",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Sofitel",
-      "group": "Accor",
-      "email": "Michell.JUAREZH@sofitel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXLo_voCgw",
-      "name": "Sofitel New York",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Sofitel",
-      "group": "Accor",
-      "email": "Elena.Lecca@sofitel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXLo_voCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCgw",
-      "name": "Steigenberger Icon Frankfurter Hof",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Steigenberger",
-      "group": "Deutsche Hospitality",
-      "email": "luisa.lautner@deutschehospitality.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSxCAw",
-      "name": "The Beekman A Thompson Hotel",
-      "stage": "Needs Invoice",
-      "stageKey": "5011",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Waiting for billing details",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "USA",
-      "brand": "Thompson",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "sean.cordasco@thompsonhotels.com, john.seaborne@thompsonhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSxCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXE-dSQCQw",
-      "name": "The Belize Collection",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "The Belize Collection",
-      "group": "",
-      "email": "julie@thebelizecollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXE-dSQCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTmCgw",
-      "name": "The Berkeley London",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Maybourne",
-      "group": "Maybourne",
-      "email": "pantille@maybourne.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTmCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS2CQw",
-      "name": "The Bodrum EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "soner.komur@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS2CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSuCAw",
-      "name": "The Brando",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "haddy.wong@thebrando.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSuCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-KCww",
-      "name": "The Carlyle A Rosewood Hotel",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Rosewood",
-      "group": "Rosewood Hotels & Resorts",
-      "email": "lara.mayer@rosewoodhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-KCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_SCww",
-      "name": "The Chedi Andermatt",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "The Chedi",
-      "group": "GHM Hotels",
-      "email": "amorais@chediandermatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_SCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_CCww",
-      "name": "The Connaught London",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Maybourne",
-      "group": "Maybourne",
-      "email": "pantille@maybourne.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_CCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXThsirCgw",
-      "name": "The Doyle Collection",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "The Doyle Collection",
-      "group": "The Doyle Collection",
-      "email": "Katherine_Gordon@doylecollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXThsirCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_UCQw",
-      "name": "The Dupont Circle",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Doyle Collection",
-      "group": "The Doyle Collection",
-      "email": "Janet_Scanlon@Doylecollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_UCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-MCww",
-      "name": "The Europe Hotel & Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "NPayne@ptgconsulting.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-MCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbrCww",
-      "name": "The Hoxton Edinburgh",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hoxton",
-      "group": "Accor",
-      "email": "Lee.scott@thehox.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbrCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-sCww",
-      "name": "The Inn of the Five Graces",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "s.sims@fivegraces.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-sCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0CQw",
-      "name": "The Lana Dubai",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "UAE",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "nicole.anton@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz7CQw",
-      "name": "The London EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "VICTORIA.SULLIVAN@EDITIONHOTELS.COM",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz7CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NynCQw",
-      "name": "The Madrid EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Spain",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "ciro.borrelli@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NynCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NybCww",
-      "name": "The Mark",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "Michel.Heredia@themarkhotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NybCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyzCQw",
-      "name": "The Maybourne Beverly Hills",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Maybourne",
-      "group": "Maybourne",
-      "email": "MCalvert@maybourne.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyzCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Ny_Cgw",
-      "name": "The Miami Beach EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "patrick.kelly@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Ny_Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzfCAw",
-      "name": "The Ned London",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ned",
-      "group": "Soho House",
-      "email": "nicola.lee@thened.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzfCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzHCgw",
-      "name": "The New York EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "Giancarlo.Almonacid@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzHCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyrCQw",
-      "name": "The Oberoi Marrakech",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Oberoi",
-      "group": "The Oberoi Group",
-      "email": "samantha.steckbeck@oberoigroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyrCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qNCQw",
-      "name": "The Palace, A Luxury Collection Hotel, Madrid",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "nancy.getlan@thepalacemadrid.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qNCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCgw",
-      "name": "The Resort At Paws Up",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "tmartin@pawsup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz3CAw",
-      "name": "The Reykjavik EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "katrin.b.sigurdardottir@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz3CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzrCAw",
-      "name": "The Ritz-Carlton Bangkok",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Yanawut.Suksawat@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzrCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XUCww",
-      "name": "The Ritz-Carlton Grand Cayman",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [
-        {
-          "name": "Collection",
-          "timing": "January - Planned"
-        }
-      ],
-      "quarters": [
-        "Q1"
-      ],
-      "country": "Grand Cayman",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Inessa.Tsavaris@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XUCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0Cww",
-      "name": "The Ritz-Carlton Istanbul",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "burcin.toros@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WMCAw",
-      "name": "The Ritz-Carlton Lake Tahoe",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Melinda.easley@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WMCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WoCAw",
-      "name": "The Ritz-Carlton Melbourne",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Eloise.Engomites@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WoCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WkCgw",
-      "name": "The Rome EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "federica.oriente@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WkCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W4CAw",
-      "name": "The Sanctuary at Kiawah Island Golf Resort",
-      "stage": "Needs Invoice",
-      "stageKey": "5011",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "Waiting for billing details",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Kiawah Resort",
-      "group": "Kiawah Resort",
-      "email": "smanise@danacommunications.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W4CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja7CAw",
-      "name": "The Sanderling Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EOS",
-      "group": "",
-      "email": "chemming@eoshospitality.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja7CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XECAw",
-      "name": "The Sebastian - Vail - A Timbers Resort",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "calves@thesebastianvail.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XECAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WQCww",
-      "name": "The Singapore EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "Parveender.Kaur@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WQCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XICQw",
-      "name": "The St. Regis New York",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Tier 2",
-      "price": 8000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XICQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X4Cww",
-      "name": "The Stafford London",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "The Stafford",
-      "group": "The Stafford",
-      "email": "Erik.concha@thestaffordlondon.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X4CAw",
-      "name": "The Times Square EDITION",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "Emily.Muniz@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X4CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICgw",
-      "name": "The Tokyo EDITION Toranomon",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "gorka.zubiete@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPUCAw",
-      "name": "Thompson Savannah",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Thompson",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "anthony.morreale@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPUCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPkCww",
-      "name": "Tivoli Avenida Liberdade Lisbon",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Tivoli",
-      "group": "Minor Hotels",
-      "email": "s.marques@tivoli-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPkCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rVCQw",
-      "name": "Tivoli Kopke Porto Gaia",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "mi.cunha@tivoli-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rVCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5Cww",
-      "name": "Tivoli Portopiccolo Sistiana Wellness Resort & Spa",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "s.gregori@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCww",
-      "name": "Tivoli President Milano Hotel",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "s.gregori@minor-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rdCww",
-      "name": "Torel Boutiques",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sandra.ramos@torelboutiques.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rdCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOiCww",
-      "name": "Tutka Bay Lodge - Within the Wild",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "kirsten@withinthewild.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOiCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbbCAw",
-      "name": "Viceroy",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Viceroy",
-      "group": "Viceroy",
-      "email": "sam.torgerson@viceroy.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbbCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOsCAw",
-      "name": "Villa Cora",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "ariela.duina@villacora.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOsCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP0Cww",
-      "name": "Villa Dagmar",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "filippa.henningsson@thediplomatcollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP0Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOiCgw",
-      "name": "Villa Roma Imperiale",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Brand Spotlight",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Collezione EM",
-      "group": "Collezione EM",
-      "email": "abargigli@grandhotelminerva.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOiCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP4Cgw",
-      "name": "Villa e Palazzo Aminta",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "d.zanetta@villa-aminta.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP4Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO4CQw",
-      "name": "Violino d'Oro",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "Brand Spotlight",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Italy",
-      "brand": "Collezione EM",
-      "group": "Collezione EM",
-      "email": "abargigli@collezioneem.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO4CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWwl6ycCAw",
-      "name": "W Dubai The Palm",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "UAE",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWwl6ycCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXm0Nr1Cww",
-      "name": "W Los Angeles - West Beverly Hills",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "W Hotels",
-      "group": "Marriott",
-      "email": "Rekia.Spencer@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXm0Nr1Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfRCgw",
-      "name": "Waldorf Astoria Jerusalem",
-      "stage": "Final Follow Up",
-      "stageKey": "5001",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Rotem.Refael@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfRCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXruOamCAw",
-      "name": "Waldorf Astoria London - Admiralty Arch",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "New Opening",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [
-        "Q3"
-      ],
-      "country": "GB",
-      "brand": "Waldorf Astoria",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Kane.Savage@waldorfastoria.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXruOamCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXjguDfCQw",
-      "name": "Windjammer Landing",
-      "stage": "In Discussion",
-      "stageKey": "5004",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "St Lucia",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXjguDfCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeYCAw",
-      "name": "1 Hotel Toronto",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "1 Hotels",
-      "group": "Starwood",
-      "email": "mitja.dobaja@1hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeYCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefoCgw",
-      "name": "Address Downtown",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Address",
-      "group": "Emaar Hospitality Group",
-      "email": "carinap@emaar.ae",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefoCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCQw",
-      "name": "Adventure Life",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaevCAw",
-      "name": "Alila Marea Beach Resort",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Alila",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "Alyson.Heidesch@AlilaHotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaevCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCQw",
-      "name": "Alila Napa Valley",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Alila",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "alyson.heidesch@alilahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeegCgw",
-      "name": "Alila Villas Uluwatu",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Alila",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "taufik.rahman@alilahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeegCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9Cgw",
-      "name": "AmaWaterways",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "columba@amawaterways.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9CQw",
-      "name": "Amadeus River Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECgw",
-      "name": "Aman",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "Brand Spotlight + Newsletter",
-      "price": 15000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "kburaye@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECAw",
-      "name": "Aman Kyoto",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "hmorito@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafvCQw",
-      "name": "Aman Nai Lert Bangkok",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "chouplain@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafvCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeegCAw",
-      "name": "Aman Rosa Alpina",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "edenicolo@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeegCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaefCQw",
-      "name": "Aman Summer Palace",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "fliu@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaefCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeegCQw",
-      "name": "Aman Tokyo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "jvargas@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeegCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaefCAw",
-      "name": "Aman Venice",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "adfruscia@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaefCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefoCAw",
-      "name": "Aman-i-Khas",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "msharma@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefoCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zef4CAw",
-      "name": "Amanbagh",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "msharma@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zef4CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zee4CQw",
-      "name": "Amandari",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "bputri@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zee4CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafPCQw",
-      "name": "Amandayan",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "amandayan.dosm@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafPCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_CAw",
-      "name": "Amanemu",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "esugimoto@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefwCww",
-      "name": "Amanera",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "carrindell@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefwCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICAw",
-      "name": "Amanfayun",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "kburaye@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCQw",
-      "name": "Amangalla",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "msharma@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefACww",
-      "name": "Amangani",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "jpayne@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefACww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeECww",
-      "name": "Amangiri",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "jwalker@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeECww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zee4Cww",
-      "name": "Amanjena",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "kboukaid@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zee4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefgCAw",
-      "name": "Amanjiwo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "bputri@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefgCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICgw",
-      "name": "Amankila",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "bputri@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeQCww",
-      "name": "Amankora",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "msharma@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeQCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zee4Cgw",
-      "name": "Amanoi",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "qhuynh@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zee4Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafvCww",
-      "name": "Amanpulo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "kburaye@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafvCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafvCAw",
-      "name": "Amanpuri",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "evandervoort@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zafvCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zae_CAw",
-      "name": "Amanruya",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "otektas@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zae_CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zef4Cww",
-      "name": "Amansara",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "evandervoort@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zef4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zae_CQw",
-      "name": "Amantaka",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "evandervoort@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zae_CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaffCgw",
-      "name": "Amanwana",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "kburaye@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaffCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefwCgw",
-      "name": "Amanwella",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "msharma@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefwCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefACQw",
-      "name": "Amanyangyun",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "Wendy.pan@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefACQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCww",
-      "name": "Amanyara",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "tsvetich@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeoCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeQCgw",
-      "name": "Amanzoe",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "kburaye@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeQCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCgw",
-      "name": "American Cruise Lines",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "april.piazza@americancruiselines.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaefCgw",
-      "name": "Anantara Bazaruto Island Resort",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "Minor Hotels",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaefCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWC94--Cgw",
-      "name": "Anantara Bophut Koh Samui",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "rpiasecki@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWC94--Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWj_NHGCww",
-      "name": "Anantara the Marker",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Ireland",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "e.dunne@anantara-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWj_NHGCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSBCww",
-      "name": "Andaz Prague",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Andaz",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "lenka.fabian@andaz.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSBCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCQw",
-      "name": "Antarctica21",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCQw",
-      "name": "Aqua Expeditions",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mweinsoft@aquaexpeditions.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCAw",
-      "name": "Aranui",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCww",
-      "name": "Aria Amazon",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXogYCrCAw",
-      "name": "Associated Luxury Hotels International",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dmiller@alhi.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXogYCrCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9Cww",
-      "name": "Atlas Ocean Voyages",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "anthony@atlasoceanvoyages.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbTCgw",
-      "name": "Atua Enkop Luxury Camps",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JT6CAw",
-      "name": "Auberge Resorts Collection",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Auberge",
-      "group": "Auberge Resorts Collection",
-      "email": "sam.mcdiarmid@aubergeresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JT6CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSRCAw",
-      "name": "Auberge du Jeu de Paume Chantilly Relais & Ch\u00e2teaux",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "nicole.wilms@aubergedujeudepaume.fr",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSRCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCgw",
-      "name": "Australis Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCAw",
-      "name": "Avalon Waterways",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JanCww",
-      "name": "Avani Victoria Falls Resort",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JanCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXQjPekCgw",
-      "name": "Awasi Lodges",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Awasi",
-      "group": "Awasi",
-      "email": "lcruz@awasi.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXQjPekCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCww",
-      "name": "Azamara",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "kmills@azamara.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTGCQw",
-      "name": "Baglioni Hotels Collection",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Baglioni",
-      "group": "Palace Resorts",
-      "email": "jkrueger@thepalacecompany.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTGCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSRCQw",
-      "name": "Banwa Private Island",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "p.balce@banwaprivateisland.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSRCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTmCgw",
-      "name": "Banyan Tree AlUla",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "adil.khan@groupbanyan.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTmCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTWCAw",
-      "name": "Banyan Tree Cabo Marques",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "nohemi.chavarin@banyantree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTWCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSGCAw",
-      "name": "Banyan Tree Doha",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSGCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JS2Cgw",
-      "name": "Banyan Tree Krabi",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "linda.schilling@groupbanyan.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JS2Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTBCgw",
-      "name": "Banyan Tree Phuket",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "sari.arab@banyantree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTBCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTWCQw",
-      "name": "Banyan Tree Puebla",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "Manuel.Leal@banyantree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTWCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTOCAw",
-      "name": "Banyan Tree Samui",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "craig.mcmahon@banyantree.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTOCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSeCww",
-      "name": "Banyan Tree Tamouda Bay",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Banyan Tree",
-      "group": "Banyan Group",
-      "email": "bahae.hadri@groupbanyan.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSeCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCgw",
-      "name": "Barchetta Yachts",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JShCww",
-      "name": "Bardessono Hotel & Spa",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "joana.bornia@bardessono.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JShCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXorbqdCQw",
-      "name": "Barriere Hotel Group",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Barriere Hotel Group",
-      "group": "Barriere Hotel Group",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXorbqdCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTeCQw",
-      "name": "Belmond",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Belmond",
-      "group": "Belmond Ltd",
-      "email": "thomas.alderink@belmond.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTeCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JShCgw",
-      "name": "Beverly Wilshire Beverly Hills (A Four Seasons Hotel)",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "caitlin.johnson@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JShCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCQw",
-      "name": "Boats at Sea",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSxCAw",
-      "name": "Borgo dei Conti Resort",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "THE The Hospitality Experience",
-      "group": "THE The Hospitality Experience",
-      "email": "a.lollini@bdcresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSxCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTxCAw",
-      "name": "Boston Harbor Hotel",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "apoon@bhh.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTxCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHmCww",
-      "name": "Bvlgari Hotel Beijing",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "shannon.byrne@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHmCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGKCww",
-      "name": "Bvlgari Hotel London",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "Max.Tchanturia@bulgarihotels.co.uk",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGKCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCgw",
-      "name": "Bvlgari Hotel Milano",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "giuseppe.barbieri@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG2Cww",
-      "name": "Bvlgari Hotel Paris",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "salome.papuchon@bulgarihotels.fr",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG2Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCgw",
-      "name": "Bvlgari Hotel Roma",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "almudena.rodriguezserrano@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGWCgw",
-      "name": "Bvlgari Hotel Shanghai",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "Shannon.byrne@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGWCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCQw",
-      "name": "Bvlgari Hotel Tokyo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "Kentaro.Kunisada@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHiCQw",
-      "name": "Bvlgari Resort Bali",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "fabio.peloia@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHiCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGKCAw",
-      "name": "Bvlgari Resort Dubai",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bulgari",
-      "group": "Marriott International",
-      "email": "Jill.Plattner@bulgarihotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGKCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGCCQw",
-      "name": "CERVO Mountain Resort",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "benjamin@cervo.swiss",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGCCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-r4CQw",
-      "name": "COMO Alpina Dolomites",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "annalisa.guidi@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-r4CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qQCQw",
-      "name": "COMO Castello del Nero",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "annalisa.guidi@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qQCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCgw",
-      "name": "COMO Hotels and Resorts",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "elio.lopez@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66q_Cww",
-      "name": "COMO Laucala Island",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "verenaisi.moimoi@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66q_Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCQw",
-      "name": "COMO Maalifushi",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "Josefine.norrman@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qYCQw",
-      "name": "COMO Parrot Cay Turks and Caicos",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "jessica.sarkin@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qYCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-r4Cgw",
-      "name": "COMO Shambhala Estate",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "birgit.albicker@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-r4Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66qvCgw",
-      "name": "COMO The Treasury Perth",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "gabi.vincent@comohotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66qvCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qoCQw",
-      "name": "COMO Uma Bhutan",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "COMO",
-      "group": "COMO",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qoCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGSCww",
-      "name": "Caesar Augustus Relais & Chateaux",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Relais & Chateaux",
-      "group": "Relais & Chateaux",
-      "email": "flavia.curci@caesar-augustus.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGSCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXEn8mjCQw",
-      "name": "Canyon Ranch Austin",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "New Opening",
-      "price": 6000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Canyon Ranch",
-      "group": "Canyon Ranch",
-      "email": "liaquez@canyonranch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXEn8mjCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHyCww",
-      "name": "Canyon Ranch Lenox",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Canyon Ranch",
-      "group": "Canyon Ranch",
-      "email": "mcasas@canyonranch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHyCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGaCAw",
-      "name": "Canyon Ranch Tucson",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Canyon Ranch",
-      "group": "Canyon Ranch",
-      "email": "mcasas@canyonranch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGaCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHqCgw",
-      "name": "Canyon Ranch\u00a0Woodside",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Canyon Ranch",
-      "group": "Canyon Ranch",
-      "email": "mcasas@canyonranch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHqCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9Cww",
-      "name": "Capasecca Luxury Yacht",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGaCgw",
-      "name": "Capella Singapore",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Capella",
-      "group": "Capella",
-      "email": "Jessica.Koh@capellahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGaCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGaCQw",
-      "name": "Capri Tiberio Palace",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mario.petraroli@shedircollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGaCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCww",
-      "name": "Capri on Board",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCww",
-      "name": "Carneros Resort and Spa",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "christy@definemarketing.com, krichard@carnerosresort.com, kzadnik@carnerosresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCww",
-      "name": "Carnival Cruise Lines",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mcampagnone@carnival.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbHCgw",
-      "name": "Casa Brera, The Luxury Collection",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "Laura.Osiride@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbHCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGmCgw",
-      "name": "Casa Cipriani Milano",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Casa Cipriani",
-      "group": "Cipriani",
-      "email": "jmarchini@cipriani.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGmCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHyCAw",
-      "name": "Casa di Langa",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "emanuela.carosso@casadilanga.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHyCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGmCww",
-      "name": "Castlemartyr Resort",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "eohalloran@castlemartyrresort.ie",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGmCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCww",
-      "name": "Celebrity Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "amiller@celebrity.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCQw",
-      "name": "Celestyal Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGGCww",
-      "name": "Chateau de Fonscolombe",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "benjamin.leclerc@fonscolombe.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGGCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rvCAw",
-      "name": "Claremont Resort & Club",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "amanda.soto@claremontresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rvCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rPCAw",
-      "name": "Clinique La Prairie",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dennis.bordkovych@laprairie.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rPCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rICgw",
-      "name": "Conrad Punta de Mita",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Conrad",
-      "group": "Hilton Hotels & Resorts",
-      "email": "garry.perotin@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-rICgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCww",
-      "name": "Costa Cruise Lines",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCgw",
-      "name": "Cruise Planners",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCww",
-      "name": "Crystal Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "cgirard@crystalcruises.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCQw",
-      "name": "Cunard Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCQw",
-      "name": "Delfin Amazon Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCww",
-      "name": "Desaru Coast",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "michael.foley@kerzner.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rfCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWIyOyHCQw",
-      "name": "Diplomat Collection",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Diplomat Collection",
-      "group": "Diplomat Collection",
-      "email": "Filippa.Henningsson@thediplomatcollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWIyOyHCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCQw",
-      "name": "Disney Cruise Lines",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "cassie.potter@disney.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JanCAw",
-      "name": "Dorchester Collection",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Dorchester Collection",
-      "group": "Dorchester Collection",
-      "email": "caroline.wilson-kent@dorchestercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JanCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCgw",
-      "name": "Dreamer Catamaran Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCQw",
-      "name": "Dwarika\u2019s Sanctuary",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "partners@dwarikas.com, sandra.farrell@r-recommends.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LX4Cww",
-      "name": "Ecoventura",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sales.usa@ecoventura.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LX4Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCAw",
-      "name": "Ecoventura - Galapagos",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-tCww",
-      "name": "El Silencio Lodge & Spa -  Relais & Chateaux",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Relais & Chateaux",
-      "group": "Relais & Chateaux",
-      "email": "marvin.zuniga@elsilenciolodge.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-tCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCQw",
-      "name": "Elite of the Seas",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCAw",
-      "name": "Emerald Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCww",
-      "name": "Emerging Destinations",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "Emerging Destinations",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-dCgw",
-      "name": "Emporium Hotel South Bank",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "katie.button@emporiumhotels.com.au",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-dCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbDCQw",
-      "name": "Enchanted Galapagos Lodge",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbDCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCww",
-      "name": "Enchantment",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Tanzerra Resorts",
-      "group": "Tanzerra Resorts",
-      "email": "gianna.goudreau@enchantmentresort.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCAw",
-      "name": "Explora Journeys",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "allison.farrell@explorajourneys.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-TCgw",
-      "name": "Explora Rapa Nui",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "amvarela@explora.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-TCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_9CQw",
-      "name": "Fairmont Heritage Place Mayakoba",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "ana.ramirez@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_9CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_jCQw",
-      "name": "Fairmont Mara Safari Club",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Maureen.wanja@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_jCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWMsefJCww",
-      "name": "Fairmont Monte Carlo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Monaco",
-      "brand": "Fairmont",
-      "group": "",
-      "email": "Isabelle.FREMONT@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWMsefJCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-jCww",
-      "name": "Fairmont Mount Kenya Safari Club",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Maureen.wanja@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-jCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-NCAw",
-      "name": "Fairmont Southampton",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Fairmont",
-      "group": "Accor",
-      "email": "Elizabeth.Bonomo@Fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-NCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y2HCQw",
-      "name": "Four Seasons Explorer, Palau (Cruising Resort)",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "karen.corburn@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y2HCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y3XCAw",
-      "name": "Four Seasons Hotel Beirut",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Lebanon",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y3XCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fiCQw",
-      "name": "Four Seasons Hotel George V",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "France",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "elodie.choquet@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fiCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-f0Cww",
-      "name": "Four Seasons Resort Punta Mita",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "Hunter.Swindle@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-f0Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCgw",
-      "name": "Four Seasons Yachts",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Phonan@fsyflorida.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCgw",
-      "name": "French Waterways",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbHCQw",
-      "name": "Garonga Safari Co.",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbHCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWYpPWoCQw",
-      "name": "Gaylord Hotels",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Gaylord Hotels",
-      "group": "",
-      "email": "Karen.Wilson-Torres@gaylordhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWYpPWoCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eyCQw",
-      "name": "Grace Bay Club",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Grace Bay Resorts",
-      "group": "Grace Bay Resorts",
-      "email": "sara.archibald@gracebayresorts.com , scott.khile@gracebayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eyCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWb0oTqCAw",
-      "name": "Grace Bay Resorts",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Grace Bay Resorts",
-      "group": "Grace Bay Resorts",
-      "email": "sara.archibald@gracebayresorts.com , scott.khile@gracebayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWb0oTqCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCww",
-      "name": "Grand Hotel Falkenberg",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-f8CAw",
-      "name": "Grand Hotel Fasano",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sales@ghf.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-f8CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWU7LHZCAw",
-      "name": "Grand Hotel Flora",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "d.moresi@grandhotelflora.net",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWU7LHZCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXCn4DNCQw",
-      "name": "Grand Hotel et de Milan",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "bbilir@grandhoteletdemilan.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXCn4DNCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oS7Cgw",
-      "name": "Grand Resort Bad Ragaz",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "jonas.schneider@resortragaz.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oS7Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTbCgw",
-      "name": "Great Fosters",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "adougans@alexanderhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTbCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSLCQw",
-      "name": "Gstaad Palace",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sales@palace.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSLCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCww",
-      "name": "Gulet Mediterranean D.O.O",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCAw",
-      "name": "HX",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCww",
-      "name": "Havila Voyages",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCQw",
-      "name": "Heritage Line - Refined Waterway Voyages",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXwi92OCww",
-      "name": "Hilton Aruba Caribbean Resort & Casino",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hilton",
-      "group": "Hilton Hotels & Resorts",
-      "email": "Joanne.Dirksz@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXwi92OCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCAw",
-      "name": "Hilton La Romana, an All Inclusive Family Resort",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hilton",
-      "group": "Hilton Hotels & Resorts",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSXCgw",
-      "name": "Hilton Luxury Brands",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hilton",
-      "group": "Hilton Hotels & Resorts",
-      "email": "mary.mayes@hilton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSXCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCQw",
-      "name": "Hilton Playa del Carmen (Adults Only)",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hilton",
-      "group": "Hilton Hotels & Resorts",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCgw",
-      "name": "Holland America Line & Seabourn",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "kperrine@hollandamerica.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTLCQw",
-      "name": "Hotel AWA",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mfuentes@hotelawa.cl",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTLCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oT9CQw",
-      "name": "Hotel Alfonso XIII a Luxury Collection Hotel Seville",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "pablo.alonso@luxurycollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oT9CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbLCgw",
-      "name": "Hotel Las Torres Patagonia",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbLCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LX4CQw",
-      "name": "Hotel Providence Paris",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "pauline@paulinederamond.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LX4CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGtCgw",
-      "name": "Hotel Punta Islita  Autograph Collection",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Autograph Collection",
-      "group": "Marriott International",
-      "email": "jtorres@enjoygroup.net",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGtCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rFCww",
-      "name": "Hotel Saint Augustine, a Bunkhouse Hotel",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Bunkhouse",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "edwin.machado@bunkhousegroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rFCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW4-4-XCgw",
-      "name": "Hotel Van Zandt",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "amity.flanders@hotelvanzandt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW4-4-XCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCQw",
-      "name": "Hurtigruten",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "linn.wilson@hurtigruten.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbTCww",
-      "name": "Hyatt",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "sydney.asensio@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbTCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbHCww",
-      "name": "Hyatt Regency Coconut Point",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hyatt Regency",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "jamie.wylie@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbHCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCgw",
-      "name": "Hyatt Zilara Rose Hall",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3Cww",
-      "name": "Hyatt Ziva Cancun",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_NCww",
-      "name": "Janu Tokyo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Aman",
-      "group": "Aman",
-      "email": "jvargas@aman.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_NCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-pCQw",
-      "name": "Jumeirah Al Naseem",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "cristian.toledo@jumeirah.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-pCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCAw",
-      "name": "Jumeirah Al Qasr",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "cristian.toledo@jumeirah.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-xCAw",
-      "name": "Jumeirah Bali",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-xCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-JCgw",
-      "name": "Jumeirah Capri Palace",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "suzanne.strubbe@jumeirah.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-JCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-lCww",
-      "name": "Jumeirah Olhahali Island",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "aaidha.majdhy@jumeirah.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-lCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCAw",
-      "name": "Jumeirah Red Sea",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Jumeirah",
-      "group": "Jumeirah Group",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbXCAw",
-      "name": "Karibu Camps & Lodges",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbXCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWK49KtCQw",
-      "name": "Katikies Hotels",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "Brand Spotlight + Newsletter",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "e.papageorgiou@katikies.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWK49KtCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOUCgw",
-      "name": "Kimpton Tsim Sha Tsui Hong Kong",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Hong Kong",
-      "brand": "Kimpton",
-      "group": "IHG Hotels & Resorts",
-      "email": "sunfill.li@ihg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOUCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_ZCgw",
-      "name": "Kristiania Lech",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "gertrud.schneider@kristiania.at",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_ZCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-dCAw",
-      "name": "L'Albereta",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "diana.toniolo@terramoretti.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-dCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_5CQw",
-      "name": "L'Andana",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "diana.toniolo@terramoretti.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_5CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-tCww",
-      "name": "La Casa de La Playa",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dtobon@hotelxcaret.com,dortegam@hotelxcaret.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-tCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbbCww",
-      "name": "La Coralina Island House",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbbCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCww",
-      "name": "Lake Placid Lodge",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Opal Collection",
-      "group": "Opal Collection",
-      "email": "cbradway@lakeplacidlodge.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCww",
-      "name": "Le Taha'a",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dave@moanamarketing.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCww",
-      "name": "Llatinaboats Menorca",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCgw",
-      "name": "Lotte Hotel Seattle",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Lotte",
-      "group": "Lotte",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCww",
-      "name": "M'Gloria Cruise Ha Long",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCQw",
-      "name": "MSC Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sara.hamiltonmoran@msccruisesusa.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rFCgw",
-      "name": "Mama Shelter Singapore",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Accor - Ennismore",
-      "group": "Accor",
-      "email": "lynn.heng@mamashelter.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rFCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjUCww",
-      "name": "Mandarin Oriental",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "jfreire@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjUCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiSCAw",
-      "name": "Mandarin Oriental Costa Navarino",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "etseli@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiSCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCww",
-      "name": "Mandarin Oriental Miami",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "sduggan@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiSCgw",
-      "name": "Mandarin Oriental Milan",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "Tier 1",
-      "price": 4000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiSCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbTCQw",
-      "name": "Mara Siana Camp",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbTCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCgw",
-      "name": "Margaritaville at Sea",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbXCww",
-      "name": "Marriott",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Marriott International",
-      "group": "Marriott International",
-      "email": "lori.lauman@marriottluxurybrands.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbXCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1CAw",
-      "name": "Mayfair House Hotel & Garden",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Andreia.Amyradakis@mayfairhousemiami.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCQw",
-      "name": "Meli\u00e1 Casa Maya",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Melia",
-      "group": "Meli\u00e1",
-      "email": "alejandra.contreras@melia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jZCQw",
-      "name": "Mii amo",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Tanzerra Resorts",
-      "group": "Tanzerra Resorts",
-      "email": "gianna.goudreau@miiamo.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jZCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jDCAw",
-      "name": "Minor Hotels",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Minor Hotels",
-      "group": "Minor Hotels",
-      "email": "lsamarasinghe@minor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jDCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j5Cgw",
-      "name": "Miraval Arizona Resort & Spa",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Miraval",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "susie.klein@miravalresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j5Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCQw",
-      "name": "Mirimar Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jlCQw",
-      "name": "Monaci delle Terre Nere",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "reservations@monacidelleterrenere.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jlCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j1CAw",
-      "name": "Montage Big Sky",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "Brea.Strager@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j1CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jVCQw",
-      "name": "Montage Healdsburg",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "Daniel.Strawn@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jVCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jtCAw",
-      "name": "Montage Kapalua Bay",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "Roger.Bright@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jtCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jFCAw",
-      "name": "Montage Laguna Beach",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "cataline.richmond@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jFCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jjCQw",
-      "name": "Montage Los Cabos",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "maria.bader@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jjCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ijCQw",
-      "name": "Montage Palmetto Bluff",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Montage",
-      "group": "Montage International",
-      "email": "Lydia.Redmond@montage.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ijCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jDCgw",
-      "name": "Monteverdi Tuscany",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "travel@monteverdituscany.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jDCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9idCgw",
-      "name": "Mount Juliet Estate",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Autograph Collection",
-      "group": "Marriott International",
-      "email": "lbriscoe@mountjuliet.ie",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9idCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9i9Cww",
-      "name": "Mount Nelson A Belmond Hotel Cape Town",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Belmond",
-      "group": "Belmond Ltd",
-      "email": "victoria.hut@belmond.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9i9Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCww",
-      "name": "My Paris River",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ijCgw",
-      "name": "NIZUC Resort & Spa",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Nizuc",
-      "group": "Grupo Brisas",
-      "email": "cynthia.lopez@nizuc.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ijCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCAw",
-      "name": "National Geographic x Lindblad Expeditions",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "LesaB@expeditions.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y3zCQw",
-      "name": "Naviva\u00ae, A Four Seasons Resort, Punta Mita, M\u00e9xico",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Mexico",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "kimberly.giblin@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXg7Y3zCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jpCAw",
-      "name": "Nobu Hotel Chicago",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Nobu - AIC",
-      "group": "AIC Hotel Group",
-      "email": "jarauz@nobuhotelchicago.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jpCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9i9Cgw",
-      "name": "North Bend Suites",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9i9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCgw",
-      "name": "Norwegian Cruise Line",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "rsims@ncl.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCww",
-      "name": "Nour El Nil",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j9CAw",
-      "name": "O2 Beach Club & Spa",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "lindsey@destinationsofdistinction.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j9CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9CAw",
-      "name": "Oceania Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "gcajas@oceaniacruises.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCAw",
-      "name": "OneSource Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMndCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW-joTTCww",
-      "name": "Oostwegel Collection",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Netherlands",
-      "brand": "",
-      "group": "",
-      "email": "m.oostwegel@oostwegelcollection.nl",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW-joTTCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW8m5zUCww",
-      "name": "Orient Express",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "Brand Spotlight + Newsletter",
-      "price": 15000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Orient Express",
-      "group": "Accor",
-      "email": "Markus.Tscherner@accor.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW8m5zUCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOtCQw",
-      "name": "Our Habitas AlUla",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Habitas",
-      "group": "Habitas",
-      "email": "annie.turnell@ourhabitas.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOtCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCQw",
-      "name": "PONANT Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "dwoods@ponant.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnjCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePbCgw",
-      "name": "Palacio Tangara Oetker Hotels",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Oetker Hotels",
-      "group": "Oetker Hotels",
-      "email": "silvio.araujo@oetkercollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePbCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWkCQw",
-      "name": "Palazzo Tal\u00eca",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "i.ramini@palazzotalia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWkCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCAw",
-      "name": "Paradise Grand Cruise, Ha Long",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3CAw",
-      "name": "Paraiso de la Bonita, a Luxury Collection Resort, Riviera Maya",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott International",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWRno-dCgw",
-      "name": "Park Hyatt ",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "Brand Spotlight",
-      "price": 10000,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Park Hyatt",
-      "group": "Hyatt",
-      "email": "suzanne.shalaby@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWRno-dCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePjCQw",
-      "name": "Park Hyatt Auckland",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "rachael.brown@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePjCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO1CQw",
-      "name": "Park Hyatt Beijing",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Park Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "priscillaxiaofan.zhang@hyatt.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO1CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCAw",
-      "name": "Paul Gauguin Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXyCQw",
-      "name": "Pendry Chicago",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "Jeff.Seidel@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXyCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWWCgw",
-      "name": "Pendry Manhattan West",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "James.Winning@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWWCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXqCgw",
-      "name": "Pendry Natirar",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "Erin.Knott@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXqCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW6CAw",
-      "name": "Pendry Newport Beach",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "kathy.goodarzi@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW6CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6CQw",
-      "name": "Pendry Park City",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "Devra.Glynn@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCgw",
-      "name": "Pendry San Diego",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "tamara.shelton@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWCCgw",
-      "name": "Pendry Washington DC - The Wharf",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "peter.schratz@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWCCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCww",
-      "name": "Pendry West Hollywood - No longer Pendry",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaHCQw",
-      "name": "Playa Resorts",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Playa Resorts",
-      "group": "Playa Hotels & Resorts N.V.",
-      "email": "Dan.Jimenez@playaresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaHCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbvpDxCAw",
-      "name": "Point Grace",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Grace Bay Resorts",
-      "group": "Grace Bay Resorts",
-      "email": "sara.archibald@gracebayresorts.com , scott.khile@gracebayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbvpDxCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCAw",
-      "name": "Polar Online",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmdCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCAw",
-      "name": "Premier Island",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCAw",
-      "name": "Primland, Auberge Collection",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "heather.williams@aubergeresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCgw",
-      "name": "Princess Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "kcarideo@princesscruises.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7Cww",
-      "name": "Quark Expeditions",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Randolph.TenEyck@quarkexpeditions.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXiCAw",
-      "name": "Raffles Grand Hotel d'Angkor",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "Isabel.GARCIA@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXiCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXWCgw",
-      "name": "Raffles Hotel Le Royal",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "Isabel.GARCIA@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXWCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWiCAw",
-      "name": "Raffles Jaipur",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "New Opening",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "tanmay.choudhary@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWiCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX8Cww",
-      "name": "Raffles Makati",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "eugene.tamesis@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX8Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXmCQw",
-      "name": "Raffles Udaipur",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "New Opening",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Raffles",
-      "group": "Accor",
-      "email": "Reshu.Tyagi@raffles.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXmCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCQw",
-      "name": "Regent Seven Seas",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "eschmit@rssc.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnLCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXyCww",
-      "name": "Rental Escapes",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "willie@rentalescapes.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXyCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7CQw",
-      "name": "Ritz-Carlton Yacht Collection",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Ray.Huynh@ritz-carltonyachtcollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbLCQw",
-      "name": "River House Lodge Patagonia",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbLCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCgw",
-      "name": "Riverside Luxury Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmDCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXb4LfoCAw",
-      "name": "Rock House",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Grace Bay Resorts",
-      "group": "Grace Bay Resorts",
-      "email": "sara.archibald@gracebayresorts.com , scott.khile@gracebayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXb4LfoCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iHCww",
-      "name": "Round Hill Hotel & Villas",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "lily@roundhill.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iHCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCQw",
-      "name": "Royal Caribbean",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "diegovelez@rccl.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnbCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jvCww",
-      "name": "Royal Davui Island Resort Fiji",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "grant@royaldavuifiji.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jvCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7Cgw",
-      "name": "R\u00f8dne Fjord Cruise",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jnCQw",
-      "name": "SHA Spain",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "abp@shawellness.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jnCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSBCgw",
-      "name": "SLS Baha Mar",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "SLS",
-      "group": "Accor",
-      "email": "Vanessa.GARCIA@slshotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSBCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbnCgw",
-      "name": "SLS Playa Mujeres",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "SLS",
-      "group": "Accor",
-      "email": "cynthia.sosa@slshotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbnCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSGCgw",
-      "name": "SLS South Beach",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "SLS",
-      "group": "Accor",
-      "email": "sinan.bozkurt@slshotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSGCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-inCAw",
-      "name": "Sagamore Pendry Baltimore",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Pendry",
-      "group": "Montage International",
-      "email": "peter.schratz@pendry.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-inCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rFCAw",
-      "name": "Salt Hotels",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "anne@salthotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rFCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb3CAw",
-      "name": "Sanctuary Cap Cana, a Luxury Collection Adult All-Inclusive Resort, Dominican Republic",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Luxury Collection",
-      "group": "Marriott",
-      "email": "Dan.Jimenez@playaresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb3CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iQCgw",
-      "name": "Santa Teresa Hotel RJ - MGallery",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "MGallery",
-      "group": "Accor",
-      "email": "david.constancio@fairmont.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iQCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCww",
-      "name": "Scarlet Pearl Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnNCww",
-      "name": "Scenic Luxury Cruises and Tours",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Derrick.Strother@scenicusa.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnNCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCAw",
-      "name": "Sea Cloud",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmTCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCAw",
-      "name": "Sea Cruise Hotel, Sokcho",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnzCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCAw",
-      "name": "SeaDream Yacht Club",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "ldeperro@seadream.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jwCgw",
-      "name": "Sensei Lana'i A Four Seasons Resort",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "USA",
-      "brand": "Four Seasons",
-      "group": "Four Seasons",
-      "email": "Kristy.Daley@fourseasons.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jwCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ifCAw",
-      "name": "Serras Barcelona",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Serras Collection",
-      "group": "Serras Collection",
-      "email": "mg@serrashotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ifCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jQCQw",
-      "name": "Shangri-La The Fort Manila",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Shangri-La",
-      "group": "Shangri-La",
-      "email": "gem.valmores@shangri-la.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jQCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jACQw",
-      "name": "Shangri-La The Shard London",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Shangri-La",
-      "group": "Shangri-La",
-      "email": "thomas.diaz@shangri-la.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jACQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iICww",
-      "name": "Shangri-La Toronto",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Shangri-La",
-      "group": "Shangri-La",
-      "email": "Andrew.Hau@shangri-la.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iICww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9Cgw",
-      "name": "Silversea",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "jennifert@silversea.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iPCAw",
-      "name": "Sindhorn Kempinski Hotel Bangkok",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Kempinski",
-      "group": "Kempinski",
-      "email": "kornchuma.udomphan@kempinski.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iPCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCQw",
-      "name": "Singita - Singita Grumeti",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Singita",
-      "group": "Singita",
-      "email": "Kristy.a@singita.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-j_Cww",
-      "name": "Singita - Singita Kruger National Park",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Singita",
-      "group": "Singita",
-      "email": "Rachel.m@singita.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-j_Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jwCQw",
-      "name": "Singita - Singita Pamushana",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Singita",
-      "group": "Singita",
-      "email": "Rachel.m@singita.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jwCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jQCAw",
-      "name": "Singita - Singita Sabi Sand",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Singita",
-      "group": "Singita",
-      "email": "Rachel.m@singita.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jQCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jnCgw",
-      "name": "Singita - Singita Volcanoes National Park",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Singita",
-      "group": "Singita",
-      "email": "Rachel.m@singita.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-jnCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbDCgw",
-      "name": "Siro Boko Place",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Siro",
-      "group": "Kerzner International",
-      "email": "jeff.tseng@babalshams.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbDCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCww",
-      "name": "Sixthman",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS6Cgw",
-      "name": "Sofitel Legend Casco Viejo Panama",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Sofitel",
-      "group": "Accor",
-      "email": "nilka.sanchez@sofitel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS6Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTRCAw",
-      "name": "Sofitel Legend People's Grand Hotel Xian",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Sofitel",
-      "group": "Accor",
-      "email": "jason.zhang@sofitel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTRCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCAw",
-      "name": "Sofitel Sydney Darling Harbour",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Sofitel",
-      "group": "Accor",
-      "email": "paul.andarakis@sofitel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS6CAw",
-      "name": "Sonnenalp Hotel",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "ccofelice@sonnenalp.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS6CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCww",
-      "name": "South Sea Cruises Fiji",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qNCww",
-      "name": "Spice of Life @ Sugar Beach, A Viceroy Resort",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "christy.connolly@viceroy.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qNCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eT2Cww",
-      "name": "St. Nicolas Bay Resort Hotel & Villas",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "reservations@stnicolasbay.gr",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eT2Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCQw",
-      "name": "Star Clippers",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmbCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCAw",
-      "name": "Starlite Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eShCww",
-      "name": "Sugar Beach A Viceroy Resort",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Viceroy",
-      "group": "Viceroy",
-      "email": "christy.connolly@viceroyhotelsandresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eShCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSOCAw",
-      "name": "Susana Balbo Winemaker's House & Spa Suites",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "ventas@sbuniquestays.ar",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSOCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCgw",
-      "name": "Swan Hellenic",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOYCww",
-      "name": "THotel",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Tracy.Bi@THotel.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOYCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCgw",
-      "name": "Tauck Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnrCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTmCAw",
-      "name": "Teranka",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "pmisarova@marbellaclub.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTmCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-MCgw",
-      "name": "The Chatwal Lodge",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Unbound Collection",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "sarah.banks@thechatwallodge.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-MCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_cCgw",
-      "name": "The Colony Hotel Palm Beach",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "mweinstein@thecolonypalmbeach.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_cCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-cCAw",
-      "name": "The Dewberry Charleston",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "jurbancic@dewberryhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-cCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-8CQw",
-      "name": "The Dolder Grand",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "anass.batale@dolderhotelag.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-8CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-8Cww",
-      "name": "The Fife Arms",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "diana@thefifearms.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-8Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_MCQw",
-      "name": "The Inn & Club at Harbour Town at The Sea Pines Resort",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "cgrindstaff@seapines.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_MCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-SCAw",
-      "name": "The Landmark Mandarin Oriental Hong Kong",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Mandarin Oriental",
-      "group": "Mandarin Oriental",
-      "email": "amyng@mohg.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-SCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_SCQw",
-      "name": "The Langham Sydney",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Langham",
-      "group": "Langham",
-      "email": "jayson.heron-smith@langhamhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4_SCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NybCQw",
-      "name": "The Lodge at Spruce Peak",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Destination by Hyatt",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "Beth.allen@destinationhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NybCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyfCAw",
-      "name": "The Lodge at Woodloch",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "jmanzione@thelodgeatwoodloch.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyfCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzbCAw",
-      "name": "The Louise",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Baillie Lodges",
-      "group": "Baillie Lodges",
-      "email": "libby@baillielodges.com.au",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzbCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCAw",
-      "name": "The Oberoi Zahra, Luxury Nile Cruise",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnTCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Ny3CAw",
-      "name": "The Palms Turks & Caicos",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hartling",
-      "group": "Hartling Group",
-      "email": "claudia.monero@hartlinggroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Ny3CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzXCAw",
-      "name": "The Peninsula Beverly Hills",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Peninsula",
-      "group": "Peninsula",
-      "email": "darleneadams@peninsula.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzXCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0CAw",
-      "name": "The Prince Akatoki London",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "kujithaperera@theprinceakatokilondon.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzbCww",
-      "name": "The Reef at Atlantis",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Atlantis Bahamas",
-      "group": "Atlantis Bahamas",
-      "email": "megan.prieto@atlantisparadise.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzbCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzLCww",
-      "name": "The Ritz-Carlton Berlin",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Antje.Heinz@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzLCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0Cgw",
-      "name": "The Ritz-Carlton Philadelphia",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "Amna.Maqbool@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WYCAw",
-      "name": "The Ritz-Carlton South Beach",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WYCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WwCgw",
-      "name": "The Ritz-Carlton Vienna",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Ritz-Carlton",
-      "group": "Marriott International",
-      "email": "reece.vanasse@ritzcarlton.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WwCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XACww",
-      "name": "The Royal Livingstone Anantara",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Anantara",
-      "group": "Minor Hotels",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XACww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCww",
-      "name": "The Royal Livingstone Victoria Falls by Anantara",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Emerging Destinations",
-      "group": "",
-      "email": "ana@emergingdestinations.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XkCww",
-      "name": "The Shore Club Turks and Caicos",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Hartling",
-      "group": "Hartling Group",
-      "email": "claudia.monero@hartlinggroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XkCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XoCgw",
-      "name": "The Silo Hotel",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Royal Portfolio",
-      "group": "Royal Portfolio",
-      "email": "werner@trp.travel",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XoCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XwCww",
-      "name": "The St. Regis Bahia Beach Resort Puerto Rico",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "sol.nieves@stregis.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XwCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XACQw",
-      "name": "The St. Regis Red Sea Resort",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "St. Regis",
-      "group": "Marriott International",
-      "email": "mohammed.rihan@marriott.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XACQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOsCgw",
-      "name": "The West Hollywood EDITION",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "EDITION",
-      "group": "Marriott International",
-      "email": "diego.gutierrez@editionhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOsCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPCCgw",
-      "name": "Thompson Buckhead",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Thompson",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "Sheree.Oats@thompsonhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPCCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOCCww",
-      "name": "Thompson Houston",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Thompson",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "david.gibson@thompsonhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOCCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOMCww",
-      "name": "Thompson Madrid by Hyatt",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Thompson",
-      "group": "Hyatt Hotels & Resorts",
-      "email": "paloma.navarro@thompsonhotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOMCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO8CAw",
-      "name": "Tierra Atacama",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Tierra",
-      "group": "Tierra Group",
-      "email": "n.russ@tierrahotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO8CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOUCww",
-      "name": "Tintswalo Safari",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "yvonne@tintswalo.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOUCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOcCgw",
-      "name": "Troutbeck",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sascha@dutchfieldllc.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOcCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPSCQw",
-      "name": "Twin Farms",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Tanzerra Resorts",
-      "group": "Tanzerra Resorts",
-      "email": "john@twinfarms.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPSCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9CAw",
-      "name": "UnCruise Adventures",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMn9CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCgw",
-      "name": "Uniworld Boutique River Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "chris.mastrota@uniworld.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmjCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7CAw",
-      "name": "Vacaya",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm7CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWYkJz2Cgw",
-      "name": "Vestige Collection",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Spain",
-      "brand": "",
-      "group": "",
-      "email": "mlopez@vestigecollection.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWYkJz2Cgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO4CAw",
-      "name": "Viceroy Los Cabos",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Viceroy",
-      "group": "Viceroy",
-      "email": "lorrianne.mesina@viceroy.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO4CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOsCQw",
-      "name": "Victoria Falls River Lodge",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "amanda@a2bmarketing.net",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOsCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPkCQw",
-      "name": "Victoria Golf Resort and Spa Managed by Accor",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Accor",
-      "group": "Accor",
-      "email": "jf.silva@anantara-hotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPkCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCgw",
-      "name": "Victory Star Cruise",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmtCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCgw",
-      "name": "Vietage",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMnDCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPsCgw",
-      "name": "Vik Chile",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Vik",
-      "group": "Vik",
-      "email": "jparapugna@vikretreats.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPsCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCQw",
-      "name": "Viking Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "shannon.tiger@viking.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmzCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPCCAw",
-      "name": "Villa Cordevigo Wine Relais Verona",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "a.andreolli@aandbeyond.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPCCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOSCww",
-      "name": "Villa Franca Positano",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sales@villafrancahotel.it",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOSCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO8Cww",
-      "name": "Villa Principe Leopoldo",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "andrea.broggi@ticinohotelsgroup.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoO8Cww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQ29n8CAw",
-      "name": "Vione Paros",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQ29n8CAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCgw",
-      "name": "Virgin Voyages",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "sabrina.newman@virginvoyages.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMntCgw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXolfefCQw",
-      "name": "W Nashville",
-      "stage": "Needs Review",
-      "stageKey": "5010",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "W Hotels",
-      "group": "Marriott International",
-      "email": "Andrea.Pendley@whotels.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXolfefCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceeCww",
-      "name": "Waldhaus Flims Wellness Resort",
-      "stage": "Needs Contact",
-      "stageKey": "5013",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Autograph Collection",
-      "group": "Marriott International",
-      "email": "c.leibenger@waldhaus-flims.ch",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceeCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW71IKuCQw",
-      "name": "West Bay Club",
-      "stage": "Declined",
-      "stageKey": "5008",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "Turks and Caicos",
-      "brand": "Grace Bay Resorts",
-      "group": "Grace Bay Resorts",
-      "email": "sara.archibald@gracebayresorts.com , scott.khile@gracebayresorts.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW71IKuCQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9CQw",
-      "name": "Windstar Cruises",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "Meg.Daly@windstarcruises.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMm9CQw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCAw",
-      "name": "Yachts WorldWide",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmLCAw"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCww",
-      "name": "Yrian Cruising",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "",
-      "group": "",
-      "email": "",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXPrMmrCww"
-    },
-    {
-      "key": "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9r5Cgw",
-      "name": "Zel Punta Cana",
-      "stage": "Do Not Invite",
-      "stageKey": "5009",
-      "package": "",
-      "price": 0,
-      "invoiceStatus": "",
-      "invoiceUrl": "",
-      "features": [],
-      "quarters": [],
-      "country": "",
-      "brand": "Melia",
-      "group": "Meli\u00e1",
-      "email": "juanita.hernandez@melia.com",
-      "streakUrl": "https://app.streak.com/pipelines/agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM/boxes/agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9r5Cgw"
-    }
-  ]
-};
+const AMPLIFY_DATA={"lastUpdated":"Feb 20, 2026","signedCount":250,"totalSigned":1119500,"totalPipeline":1207500,"paid":648000,"outstanding":471500,"waitingBilling":12500,"inKind":0,"needsInvoice":23000,"needsInvoiceCount":5,"inDiscussion":61000,"inDiscussionCount":64,"finalFollowUp":4000,"finalFollowUpCount":147,"marketingComplete":12000,"byStage":{"Tier 1":646500,"Brand Spotlight":221000,"New Opening":86000,"Tier 2":154000,"Marketing Complete":12000},"countByStage":{"Tier 1":184,"Brand Spotlight":26,"New Opening":15,"Tier 2":22,"Marketing Complete":3},"pipelineByStage":{"Needs Invoice":23000,"In Discussion":61000,"Final Follow Up":4000},"pipelineCountByStage":{"Needs Invoice":5,"In Discussion":64,"Final Follow Up":147},"funnel":[{"label":"Signed \u2014 Tier 1","stageKey":"5014","count":184,"value":646500},{"label":"Signed \u2014 Brand Spotlight","stageKey":"5016","count":26,"value":221000},{"label":"Signed \u2014 Tier 2","stageKey":"5015","count":22,"value":154000},{"label":"Signed \u2014 New Opening","stageKey":"5017","count":15,"value":86000},{"label":"Signed \u2014 Marketing Complete","stageKey":"5007","count":3,"value":12000},{"label":"Needs Invoice","stageKey":"5011","count":5,"value":23000},{"label":"In Discussion","stageKey":"5004","count":64,"value":61000},{"label":"Final Follow Up","stageKey":"5001","count":147,"value":4000},{"label":"Needs Contact","stageKey":"5013","count":65,"value":0},{"label":"Needs Review","stageKey":"5010","count":8,"value":0},{"label":"Declined","stageKey":"5008","count":174,"value":0},{"label":"Do Not Invite","stageKey":"5009","count":132,"value":0}],"signedOverTime":[{"month":"Aug 2025","count":13,"value":30000,"cumCount":13,"cumValue":30000},{"month":"Sep 2025","count":22,"value":117000,"cumCount":35,"cumValue":147000},{"month":"Oct 2025","count":49,"value":211000,"cumCount":84,"cumValue":358000},{"month":"Nov 2025","count":40,"value":177000,"cumCount":124,"cumValue":535000},{"month":"Dec 2025","count":41,"value":188000,"cumCount":165,"cumValue":723000},{"month":"Jan 2026","count":42,"value":198500,"cumCount":207,"cumValue":921500},{"month":"Feb 2026","count":43,"value":198000,"cumCount":250,"cumValue":1119500}],"newThisWeek":[{"name":"Solaz a Luxury Collection Resort Los Cabos","stage":"Tier 2","price":8000},{"name":"South Bank - Grace Bay Resorts","stage":"Brand Spotlight","price":5000},{"name":"Stein Eriksen Lodge Deer Valley","stage":"Marketing Complete","price":5000},{"name":"W Sardinia","stage":"Tier 1","price":4000},{"name":"Terre Blanche H\u00f4tel Spa Golf Resort","stage":"Tier 1","price":4000},{"name":"Fairmont Le Ch\u00e2teau Frontenac","stage":"Tier 1","price":4000},{"name":"Atlantis Bay","stage":"Tier 1","price":3000},{"name":"The Hoxton Florence","stage":"Tier 1","price":3000},{"name":"Mazzaro Sea Palace","stage":"Tier 1","price":3000}],"features":{"Collection":196,"Forum":125,"Newsletter":123,"Journal Article":14,"Social Media":14,"Advisor Assets":24,"Webinar":5},"quarters":{"TBD":97,"Q3":17,"Q2":76,"Q4":4,"Q1":69},"topCountries":[["USA",66],["Italy",28],["Spain",16],["Mexico",16],["Greece",15],["GB",11],["Japan",10],["Portugal",4],["UAE",4],["France",4]],"topGroups":[["Marriott International",47],["Accor",23],["Hyatt Hotels & Resorts",17],["Hilton Hotels & Resorts",13],["Kerzner International",8],["IHG Hotels & Resorts",7],["Grecotel",6],["Dorchester Collection",5],["Mandarin Oriental",5],["Katikies",4]],"topBrands":[["Raffles",13],["Ritz-Carlton",13],["W Hotels",8],["Waldorf Astoria",8],["Luxury Collection",6],["Grecotel",6],["St. Regis",6],["One&Only",6],["Dorchester Collection",5],["Mandarin Oriental",5]],"partnersUrl":"data-partners.json?v=d4ba0b7cd970","partnersColsUrl":"data-partners-cols.json?v=01fd755a0aea","searchUrl":"data-search.json?v=4faea1232ba9","cubeUrl":"data-cube.json?v=c6e630210f01"};
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Partner Portal Load Test
+--------------------------------
+Serves the generated site locally and replays a burst of partner portal
+visits (partner.html?key=...) — the traffic after a newsletter goes out —
+across every partner key in portal/, under several output layouts.
+
+Usage:  python3 loadtest.py [--help] [--site DIR] [--layouts shards,single,originals]
+                            [--concurrency 50] [--repeat 0.3] [--rtt-ms 0] [--mbps 0]
+                            [--out .cache/loadtest-report.json] [--compare OLD.json]
+
+A visit fetches what partner.html does: the page, its logo and fonts, the
+partner's data and resources/<key>.json (their assets) and the asset
+thumbnails. Each virtual browser keeps its own cache — immutable
+files (assets/<hash>.webp) are reused without a request, everything else is
+revalidated with If-None-Match — and a --repeat share of partners open
+their link a second time with a warm cache. Layouts:
+  shards     portal/ and resources/ files per partner, thumbnails from assets/ (current)
+  single     one file with every partner and their assets (the old partners-public.js)
+  originals  shards, but thumbnails are the full-size partner-assets/ files
+
+Reports bytes on the wire per visit, request and visit latency percentiles,
+status counts and how much the browser cache saved. --rtt-ms / --mbps add a
+simulated network so latency reflects bytes; --compare prints the change
+against an earlier report.
+"""
+
+import os, json, gzip, hashlib, random, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse
+
+import requests
+
+SCRIPT_DIR  = os.path.dirname(os.path.abspath(__file__))
+LAYOUTS     = ("shards", "single", "originals")
+CONCURRENCY = 50       # virtual browsers at once
+REPEAT      = 0.3      # share of partners who open their link twice
+SEED        = 1
+REPORT_PATH = os.path.join(SCRIPT_DIR, ".cache", "loadtest-report.json")
+PAGE_FILES  = ("partner.html", "logo.png", "fonts/ChiswickSansText-Regular.otf",
+               "fonts/ChiswickSansText-Semibold.otf", "fonts/Blanco-Regular.otf", "fonts/Blanco-Bold.otf")
+SINGLE_FILE = "partners-public.json"
+TYPES       = {".html": "text/html", ".json": "application/json", ".js": "text/javascript",
+               ".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".gif": "image/gif",
+               ".webp": "image/webp", ".pdf": "application/pdf", ".otf": "font/otf"}
+COMPRESSIBLE = {".html", ".json", ".js"}
+
+# ── Static server ──────────────────────────────────────────────────
+class SiteHandler(BaseHTTPRequestHandler):
+    """Static files from server.site (plus server.overlay, generated files),
+    with ETags, 304s, gzip for text and hosting-style cache headers."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = urlparse(self.path).path.lstrip("/")
+        body = self.server.read(path)
+        if body is None:
+            return self.reply(404, b"")
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        ext  = os.path.splitext(path)[1].lower()
+        headers = {"ETag": etag, "Content-Type": TYPES.get(ext, "application/octet-stream"),
+                   "Cache-Control": "public, max-age=31536000, immutable" if path.startswith("assets/")
+                                    else "public, max-age=0, must-revalidate"}
+        if self.headers.get("If-None-Match") == etag:
+            return self.reply(304, b"", headers)
+        if ext in COMPRESSIBLE and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = self.server.gzipped(path, body)
+            headers["Content-Encoding"] = "gzip"
+        self.reply(200, body, headers)
+
+    def reply(self, status, body, headers=None):
+        self.server.network_delay(len(body))
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class SiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, site, overlay=None, rtt_ms=0, mbps=0):
+        super().__init__(("127.0.0.1", 0), SiteHandler)
+        self.site, self.overlay = site, overlay or {}
+        self.rtt, self.bytes_per_s = rtt_ms / 1000, mbps * 125_000
+        self.cache, self.lock = {}, threading.Lock()
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+
+    def read(self, path):
+        if path in self.overlay:
+            return self.overlay[path]
+        full = os.path.normpath(os.path.join(self.site, path))
+        if not full.startswith(os.path.normpath(self.site) + os.sep) or not os.path.isfile(full):
+            return None
+        with open(full, "rb") as f:
+            return f.read()
+
+    def gzipped(self, path, body):
+        key = (path, hashlib.sha1(body).digest())
+        with self.lock:
+            if key not in self.cache:
+                self.cache[key] = gzip.compress(body, 6, mtime=0)
+            return self.cache[key]
+
+    def network_delay(self, size):
+        delay = self.rtt + (size / self.bytes_per_s if self.bytes_per_s else 0)
+        if delay:
+            time.sleep(delay)
+
+# ── Layouts ────────────────────────────────────────────────────────
+def portal_keys(site):
+    """Partner keys with a portal file, checked against portal/manifest.json."""
+    portal = os.path.join(site, "portal")
+    keys = sorted(f[:-5] for f in os.listdir(portal) if f.endswith(".json") and f != "manifest.json")
+    try:
+        sys.path.insert(0, SCRIPT_DIR)
+        from update import shard_id
+        with open(os.path.join(portal, "manifest.json")) as f:
+            listed = set(json.load(f)["shards"])
+        missing = [k for k in keys if shard_id(k) not in listed]
+        if missing:
+            print(f"Warning: {len(missing)} portal file(s) not in portal/manifest.json")
+    except (OSError, ValueError, KeyError, ImportError):
+        print("Warning: could not check keys against portal/manifest.json")
+    return keys
+
+def load_records(site, keys):
+    """Each partner's portal data with their assets as "resources"."""
+    records = {}
+    for key in keys:
+        with open(os.path.join(site, "portal", f"{key}.json")) as f:
+            records[key] = json.load(f)
+        try:
+            with open(os.path.join(site, "resources", f"{key}.json")) as f:
+                records[key]["resources"] = json.load(f)
+        except OSError:
+            records[key]["resources"] = {}
+    return records
+
+def visit_urls(layout, key, record):
+    """The requests partner.html makes for one visit, in order."""
+    urls = list(PAGE_FILES)
+    if layout == "single":
+        urls.append(SINGLE_FILE)
+    else:
+        urls += [f"portal/{key}.json", f"resources/{key}.json"]       # the latter 404s without assets
+    for assets in (record.get("resources") or {}).values():
+        for a in assets:
+            thumb = a.get("thumb") if layout != "originals" else None
+            if thumb:
+                urls.append(thumb)
+            elif a.get("path") and not a["path"].lower().endswith(".pdf"):
+                urls.append(a["path"])
+    return urls
+
+def layout_overlay(layout, records):
+    if layout == "single":
+        return {SINGLE_FILE: json.dumps(records, separators=(",", ":")).encode()}
+    return {}
+
+# ── Visits ─────────────────────────────────────────────────────────
+class Browser:
+    """One partner's browser: a keep-alive session and an HTTP cache."""
+
+    def __init__(self, base):
+        self.base, self.session, self.cache = base, requests.Session(), {}
+        self.session.headers["Accept-Encoding"] = "gzip"
+
+    def visit(self, urls):
+        """Fetch `urls` like a page load. Returns {"bytes" on the wire, "ms",
+        "requests": [(status, ms), …], "resources", "cached" (served from
+        the cache, without a request or by a 304)}."""
+        out = {"bytes": 0, "requests": [], "resources": 0, "cached": 0}
+        start = time.perf_counter()
+        for url in dict.fromkeys(urls):                    # a page loads each URL once
+            out["resources"] += 1
+            cached = self.cache.get(url)
+            if cached and cached["immutable"]:
+                out["cached"] += 1
+                continue
+            headers = {"If-None-Match": cached["etag"]} if cached else {}
+            t = time.perf_counter()
+            r = self.session.get(self.base + "/" + url, headers=headers, stream=True)
+            out["bytes"] += sum(len(c) for c in r.raw.stream(65536, decode_content=False))
+            out["requests"].append((r.status_code, (time.perf_counter() - t) * 1000))
+            if r.status_code == 304:
+                out["cached"] += 1
+            elif r.status_code == 200 and r.headers.get("ETag"):
+                self.cache[url] = {"etag": r.headers["ETag"],
+                                   "immutable": "immutable" in r.headers.get("Cache-Control", "")}
+        out["ms"] = (time.perf_counter() - start) * 1000
+        return out
+
+def percentiles(values, points=(50, 90, 99)):
+    if not values:
+        return {}
+    s = sorted(values)
+    out = {f"p{p}": round(s[min(len(s) - 1, int(len(s) * p / 100))], 2) for p in points}
+    out["max"] = round(s[-1], 2)
+    return out
+
+def run_layout(layout, site, keys, records, concurrency, repeat, rtt_ms, mbps):
+    server = SiteServer(site, layout_overlay(layout, records), rtt_ms, mbps)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    rng = random.Random(SEED)
+    repeaters = set(rng.sample(keys, int(len(keys) * repeat)))
+    browsers  = {key: Browser(server.url) for key in keys}
+    plan = [(key, False) for key in keys] + [(key, True) for key in sorted(repeaters)]
+    rng.shuffle(plan)
+    # A warm visit has to follow the same partner's first one
+    firsts = {key: threading.Event() for key in keys}
+
+    def one(item):
+        key, warm = item
+        if warm:
+            firsts[key].wait()
+        try:
+            return warm, browsers[key].visit(visit_urls(layout, key, records[key]))
+        finally:
+            if not warm:
+                firsts[key].set()
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(one, plan))
+    finally:
+        server.shutdown()
+        server.server_close()
+    wall = time.perf_counter() - start
+
+    report = {"visits": len(results), "wallSeconds": round(wall, 2)}
+    for label, visits in (("cold", [v for warm, v in results if not warm]),
+                          ("warm", [v for warm, v in results if warm])):
+        if not visits:
+            continue
+        sizes  = [v["bytes"] for v in visits]
+        reqs   = [req for v in visits for req in v["requests"]]
+        status = {}
+        for code, _ in reqs:
+            status[str(code)] = status.get(str(code), 0) + 1
+        report[label] = {
+            "visits":           len(visits),
+            "bytes":            sum(sizes),
+            "bytesPerVisit":    {"mean": round(sum(sizes) / len(visits)), **percentiles(sizes, (50, 95))},
+            "requestsPerVisit": round(len(reqs) / len(visits), 2),
+            "requestMs":        percentiles([ms for _, ms in reqs]),
+            "visitMs":          percentiles([v["ms"] for v in visits]),
+            "status":           status,
+            "cacheHitRatio":    round(sum(v["cached"] for v in visits) / sum(v["resources"] for v in visits), 3),
+        }
+    return report
+
+# ── Report ─────────────────────────────────────────────────────────
+def print_report(report, previous=None):
+    print(f"\n{'layout':<11}{'visit':<6}{'visits':>7}{'KB/visit':>10}{'p95 KB':>9}{'req/visit':>10}"
+          f"{'req p50':>9}{'req p99':>9}{'visit p90':>11}{'cache':>7}")
+    for layout, r in report["layouts"].items():
+        for label in ("cold", "warm"):
+            c = r.get(label)
+            if not c:
+                continue
+            line = (f"{layout:<11}{label:<6}{c['visits']:>7}{c['bytesPerVisit']['mean'] / 1024:>10.1f}"
+                    f"{c['bytesPerVisit']['p95'] / 1024:>9.1f}{c['requestsPerVisit']:>10}"
+                    f"{c['requestMs']['p50']:>8.1f}ms{c['requestMs']['p99']:>7.1f}ms"
+                    f"{c['visitMs']['p90']:>9.1f}ms{c['cacheHitRatio']:>7.0%}")
+            old = (((previous or {}).get("layouts") or {}).get(layout) or {}).get(label)
+            if old:
+                delta = c["bytesPerVisit"]["mean"] / max(1, old["bytesPerVisit"]["mean"]) - 1
+                line += f"   bytes {delta:+.0%} vs previous, visit p90 {old['visitMs']['p90']:.1f}ms before"
+            print(line)
+
+FLAGS = ("--site", "--layouts", "--concurrency", "--repeat", "--rtt-ms", "--mbps", "--out", "--compare")
+
+def usage(error=None):
+    """Print the usage (this module's docstring) and exit — with status 1
+    and `error` first when the arguments were wrong."""
+    if error:
+        raise SystemExit(f"{error}\n{__doc__.rstrip()}")
+    print(__doc__.strip())
+    sys.exit(0)
+
+def check_args(argv):
+    """Exit with the usage on --help, an unknown flag or a flag with no value."""
+    if "-h" in argv or "--help" in argv:
+        usage()
+    for flag, value in zip(argv[::2], argv[1::2] + [None]):
+        if flag not in FLAGS:
+            usage(f"Unknown argument: {flag}")
+        if value is None or value.startswith("--"):
+            usage(f"{flag} needs a value")
+
+def arg(name, default=None, kind=str):
+    value = sys.argv[sys.argv.index(name) + 1] if name in sys.argv[:-1] else default
+    try:
+        return kind(value)
+    except ValueError:
+        usage(f"{name}: not a valid {kind.__name__}: {value!r}")
+
+if __name__ == "__main__":
+    check_args(sys.argv[1:])
+    site        = os.path.abspath(arg("--site", SCRIPT_DIR))
+    layouts     = arg("--layouts", ",".join(LAYOUTS)).split(",")
+    concurrency = arg("--concurrency", CONCURRENCY, int)
+    repeat      = arg("--repeat", REPEAT, float)
+    rtt_ms      = arg("--rtt-ms", 0, float)
+    mbps        = arg("--mbps", 0, float)
+    unknown = [l for l in layouts if l not in LAYOUTS]
+    if unknown:
+        usage(f"Unknown layout(s): {', '.join(unknown)} (choose from {', '.join(LAYOUTS)})")
+    if concurrency < 1 or not 0 <= repeat <= 1 or rtt_ms < 0 or mbps < 0:
+        usage("--concurrency must be at least 1, --repeat between 0 and 1, --rtt-ms and --mbps not negative")
+    if not os.path.isdir(os.path.join(site, "portal")):
+        usage(f"No portal/ in {site} — run update.py first, or point --site at a generated site")
+
+    keys    = portal_keys(site)
+    records = load_records(site, keys)
+    print(f"{len(keys)} partner portals in {os.path.relpath(site)}; {concurrency} concurrent browsers, "
+          f"{repeat:.0%} revisit" + (f", {rtt_ms:g}ms RTT" if rtt_ms else "") + (f", {mbps:g} Mbit/s" if mbps else ""))
+    report = {"started": time.strftime("%Y-%m-%dT%H:%M:%S"), "partners": len(keys),
+              "settings": {"concurrency": concurrency, "repeat": repeat, "rttMs": rtt_ms, "mbps": mbps},
+              "layouts": {}}
+    for layout in layouts:
+        report["layouts"][layout] = run_layout(layout, site, keys, records, concurrency, repeat, rtt_ms, mbps)
+
+    previous = None
+    if arg("--compare"):
+        with open(arg("--compare")) as f:
+            previous = json.load(f)
+    print_report(report, previous)
+    out = arg("--out", REPORT_PATH)
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"\nReport → {os.path.relpath(out)}")
@@ -1,5829 +0,0 @@
-// Auto-generated by update.py on Feb 20, 2026
-// Partner portal data — no internal pricing or pipeline info
-
-const PARTNER_PUBLIC_DATA = {
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefECww": {
-    "name": "1 Hotel Hanalei Bay",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXagdysCgw": {
-    "name": "45 Park Lane",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefYCQw": {
-    "name": "7Pines Resort Ibiza",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCAw": {
-    "name": "7Pines Resort Sardinia",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefICQw": {
-    "name": "Acqualina Resort & Residences on the Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q5CAw": {
-    "name": "Alila Mayakoba",
-    "package": "New Opening + Advisor Assets",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaf_CQw": {
-    "name": "Alila Ventana Big Sur",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zefQCww": {
-    "name": "Almanac Barcelona",
-    "package": "Tier 1",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Spain",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXC0-OECww": {
-    "name": "Almanac Hotels",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "July - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zeeECQw": {
-    "name": "Almanac Palais Vienna",
-    "package": "Tier 1",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Austria",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Ja3CQw": {
-    "name": "Almanac X Alcron Prague",
-    "package": "Tier 1",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Czech Republic",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531565702.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3zaffCQw": {
-    "name": "Amirandes A Grecotel Resort to Live",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSeCQw": {
-    "name": "Andaz Peninsula Papagayo Resort Costa Rica by Hyatt",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "Costa Rica",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JS2CAw": {
-    "name": "Arizona Biltmore LXR Hotels & Resorts",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWgqMTpCQw": {
-    "name": "Atlantis",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Bahamas",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXbjOfpCww": {
-    "name": "Atlantis Bay",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCAw": {
-    "name": "Atlantis The Royal",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "UAE",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSWCww": {
-    "name": "Banyan Tree Mayakoba",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Mexico",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JTRCgw": {
-    "name": "Beach Enclave",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Turks and Caicos",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXx-t2_Cgw": {
-    "name": "Bellustar Tokyo",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qVCww": {
-    "name": "Beverly Hills Hotel & Bungalows",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSOCww": {
-    "name": "Borgo Pignano Tuscany",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7JSGCww": {
-    "name": "Borgo Santandrea",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHaCww": {
-    "name": "Buahan A Banyan Tree Escape",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Indonesia",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771525307778.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGyCQw": {
-    "name": "Bvlgari Hotels & Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWwr5XJCgw": {
-    "name": "Cape Sounio Grecotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHCCQw": {
-    "name": "Capella Hotels",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Webinar",
-        "timing": "January 2026"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dH6Cww": {
-    "name": "Carlisle Bay",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Antigua",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHmCAw": {
-    "name": "Carlton Hotel St. Moritz",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "December - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q4 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q4"
-    ],
-    "country": "Switzerland",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dHGCQw": {
-    "name": "Carmel Valley Ranch",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531849697.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dGSCQw": {
-    "name": "Casa Angelina",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2dG8CAw": {
-    "name": "Castelfalfi",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6CAw": {
-    "name": "Castello Di Reschio (Reschio Hotel)",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531685521.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXq5_vTCgw": {
-    "name": "Chapter Chianti Country Resort",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qwCww": {
-    "name": "Conrad Fort Lauderdale Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771532089670.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qwCQw": {
-    "name": "Conrad Orlando",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX6-qACQw": {
-    "name": "Conrad Tulum Riviera Maya",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned, September - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned, September - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q3"
-    ],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXX66rvCww": {
-    "name": "Conrad Washington DC",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "September - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-tCgw": {
-    "name": "Eau Palm Beach Resort and Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_rCAw": {
-    "name": "Edgewood Tahoe Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_1CQw": {
-    "name": "Equinox Hotel New York City",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_tCAw": {
-    "name": "Excelsior Hotel Gallia A Luxury Collection Hotel Milan",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_VCgw": {
-    "name": "Explora",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCQw": {
-    "name": "FH55 Grand Hotel Palatino",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWECww": {
-    "name": "FH55 Hotel Calzaiuoli",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_zCAw": {
-    "name": "Fairmont Le Ch\u00e2teau Frontenac",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Canada",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_9Cgw": {
-    "name": "Fairmont Miramar Hotel & Bungalows",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL-zCQw": {
-    "name": "Fairmont Sonoma Mission Inn & Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXrL_DCQw": {
-    "name": "Fairmont Tremblant",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Canada",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fqCQw": {
-    "name": "Four Seasons Astir Palace Hotel Athens",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fcCAw": {
-    "name": "Gansevoort Meatpacking",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWivZu5Cgw": {
-    "name": "Garrya Mu Cang Chai",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Vietnam",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-eCCAw": {
-    "name": "Grand Hotel Les Trois Rois",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Switzerland",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCAw": {
-    "name": "Grand Hyatt Deer Valley & Residences",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCgw": {
-    "name": "Grand Hyatt Grand Cayman",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl-fcCQw": {
-    "name": "Grand Hyatt Vail",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTdCQw": {
-    "name": "Grand Velas Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "February - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Mexico",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWQvOHvCQw": {
-    "name": "Grecotel",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "January - Planned"
-      },
-      {
-        "name": "Webinar",
-        "timing": "January 2026"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Greece",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522164903.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JazCQw": {
-    "name": "HOTEL THE MITSUI KYOTO, a Luxury Collection Hotel & Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Japan",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531565702.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSDCQw": {
-    "name": "Hammock Cove Antigua",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Antigua",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTnCgw": {
-    "name": "Hotel Arts Barcelona",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "September - Planned, February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "September - Planned, February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "February - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1",
-      "Q3"
-    ],
-    "country": "Spain",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCww": {
-    "name": "Hotel Bel Air",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSrCAw": {
-    "name": "Hotel Byron",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oTLCgw": {
-    "name": "Hotel Caf\u00e9 Royal London",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "GB",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531372379.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oSdCww": {
-    "name": "Hotel Casa del Mar",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCQw": {
-    "name": "Hotel Chapter Roma",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rNCAw": {
-    "name": "Hotel Eden",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW3_oS7CAw": {
-    "name": "Hotel Goldener Hirsch a Luxury Collection Hotel Salzburg",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Austria",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuHbCww": {
-    "name": "Hotel Hermitage Monte-Carlo",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Monaco",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuGTCgw": {
-    "name": "Hotel Plaza e de Russie",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWzwvvtCAw": {
-    "name": "Huntington Hotel",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3xuH7Cww": {
-    "name": "Hyatt Regency Kyoto",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-iHCQw": {
-    "name": "Ikos Kissamos",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6SzCgw": {
-    "name": "InterContinental Presidente Cozumel Resort Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWcCgw": {
-    "name": "JW Marriott Marco Island",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWF8KruCww": {
-    "name": "JW Marriott Orlando, Grand Lakes",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_tCgw": {
-    "name": "Jack's Camp",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Botswana",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_FCQw": {
-    "name": "Jumeirah Hotels & Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_VCAw": {
-    "name": "Kamalaya Koh Samui",
-    "package": "Newsletter + Forum Feature",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Thailand",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXx67f0Cww": {
-    "name": "Katikies Chromata",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf-lCgw": {
-    "name": "Katikies Garden",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCAw": {
-    "name": "Katikies Kirini Santorini",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_JCQw": {
-    "name": "Katikies\u00a0Mykonos",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWT8qrICAw": {
-    "name": "Kempinski Germany: Hotel Adlon & Hotel Vier Jahreszeiten",
-    "package": "Bespoke Kempinski",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned, May - Planned, June - Planned, July - Planned, August - Planned, September - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned, April - Planned, May - Planned, July - Planned, August - Planned, September - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q3",
-      "Q4"
-    ],
-    "country": "Germany",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JajCww": {
-    "name": "Kerzner",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "February - Planned"
-      },
-      {
-        "name": "Webinar",
-        "timing": "February 2026"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6S1CQw": {
-    "name": "Kimpton Aysla Mallorca",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXGm6TVCgw": {
-    "name": "Kimpton Los Monteros Marbella",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWeqau2Cww": {
-    "name": "Kimpton Shinjuku Tokyo",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qPECww": {
-    "name": "Kimpton Vividora Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LW0Cgw": {
-    "name": "L'oscar London",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWmuoTdCgw": {
-    "name": "La Zambra",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnmf_pCQw": {
-    "name": "Ladera Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "St Lucia",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjyCAw": {
-    "name": "Le Royal Monceau - Raffles Paris",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "France",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjCCAw": {
-    "name": "Les Roches Blanches",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "France",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXCgYG0CAw": {
-    "name": "Lignee Hotels",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "February - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOisCgw": {
-    "name": "Maison M\u00e9tier",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Social Media",
-        "timing": "January - Completed"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522164903.png",
-          "note": ""
-        },
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ],
-      "Journal Article": [
-        {
-          "label": "January Journal Article Feature",
-          "path": "",
-          "note": ""
-        }
-      ],
-      "Social Media": [
-        {
-          "label": "January Social Media Feature",
-          "path": "",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjiCQw": {
-    "name": "Malliouhana Anguilla",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Anguilla",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjSCQw": {
-    "name": "Mandarin Oriental Geneva",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Switzerland",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOjcCgw": {
-    "name": "Mandarin Oriental Hyde Park London",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "GB",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiKCgw": {
-    "name": "Mandarin Oriental Munich",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Germany",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOisCww": {
-    "name": "Mandarin Oriental New York",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX3jOiMCAw": {
-    "name": "Mandarin Oriental Paris",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "France",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jFCww": {
-    "name": "Mauna Lani, Auberge Collection",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771525307778.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9itCww": {
-    "name": "Mazzaro Sea Palace",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9itCAw": {
-    "name": "Mission Pacific Beach Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771532089670.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCAw": {
-    "name": "Mondrian Ibiza",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j9Cgw": {
-    "name": "Montage International",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWBrL_7CAw": {
-    "name": "Monte-Carlo Bay Hotel & Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Monaco",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iFCQw": {
-    "name": "Monte-Carlo Beach",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Monaco",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j5Cww": {
-    "name": "Mykonos Blu ",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9j1CQw": {
-    "name": "Nantipa - A Tico Beach Experience",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Costa Rica",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWCjrmCCww": {
-    "name": "Nanuku Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Fiji",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9idCAw": {
-    "name": "Naples Grande Beach Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771526379026.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9ipCww": {
-    "name": "Nekajui a Ritz-Carlton Reserve",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Costa Rica",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iNCgw": {
-    "name": "Nihi Sumba",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Indonesia",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iZCww": {
-    "name": "NoMad London",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9iNCww": {
-    "name": "Noble House Hotels & Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA, Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnq9jNCAw": {
-    "name": "Nobu Hotel Marbella",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWahYSuCQw": {
-    "name": "Nomade Ibiza",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWq04b6CAw": {
-    "name": "Nomade Temple Madrid",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39Jb7CQw": {
-    "name": "Omni Hotels",
-    "package": "Brand Spotlight + Additional Webinar",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWN5uCfCgw": {
-    "name": "One Aldwych",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "July - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePzCQw": {
-    "name": "One&Only Aesthesis",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOTCAw": {
-    "name": "One&Only K\u00e9a Island",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeO7Cww": {
-    "name": "One&Only Mandarina",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePTCQw": {
-    "name": "One&Only One Za\u2019abeel",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "UAE",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePzCAw": {
-    "name": "One&Only Palmilla",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeONCQw": {
-    "name": "One&Only Reethi Rah",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Maldives",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXUCAw": {
-    "name": "PGA National Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWcCQw": {
-    "name": "Palacio do Governador, SLH",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Portugal",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpePtCww": {
-    "name": "Palmaia - The House of AiA",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned, February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned, March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1",
-      "Q2"
-    ],
-    "country": "Mexico",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX05rThCww": {
-    "name": "Pan Pacific Hotel Group",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOdCAw": {
-    "name": "Park Hyatt Bangkok",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Thailand",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWnpeOzCQw": {
-    "name": "Park Hyatt Beaver Creek Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXa1Nv9Cww": {
-    "name": "Pazziella, a Luxury Collection Hotel, Capri",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531230782.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX2t4rSCgw": {
-    "name": "Pearl Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "July - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "French Polynesia/Tahiti",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWumeniCww": {
-    "name": "Pendry Hotels",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbzCAw": {
-    "name": "Peninsula Hotels",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Multiple Countries",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWmCAw": {
-    "name": "Phaea Blue Elounda Crete",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaTCAw": {
-    "name": "Proper",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXSCgw": {
-    "name": "Puente Romano Beach Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW-gOOqCAw": {
-    "name": "Raffles",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Multiple Countries",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6Cww": {
-    "name": "Raffles Bali",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Indonesia",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pX6Cgw": {
-    "name": "Raffles Boston",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW8CQw": {
-    "name": "Raffles Doha",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Qatar",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCww": {
-    "name": "Raffles Dubai",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "UAE",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCww": {
-    "name": "Raffles Europejski Warsaw",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Poland",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWmCQw": {
-    "name": "Raffles Istanbul",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Turkey",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWqCAw": {
-    "name": "Raffles London at The OWO",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWTuOyjCAw": {
-    "name": "Raffles Sentosa Singapore",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Singapore",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pW2Cgw": {
-    "name": "Raffles Seychelles",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "July - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "Seychelles",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pXCCAw": {
-    "name": "Raffles Singapore",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Singapore",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWWCww": {
-    "name": "Raffles The Palm Dubai",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "UAE",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qOsCgw": {
-    "name": "Regent Hong Kong",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Hong Kong",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXJs8eDCgw": {
-    "name": "Ritz-Carlton Japan",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXECAw": {
-    "name": "Rivoli Boutique Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWX7pWKCAw": {
-    "name": "Rocco Forte Hotels",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-i_CQw": {
-    "name": "Royal Hotel Sanremo",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5igCgw": {
-    "name": "Royal Mansour Casablanca",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Morocco",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531050126.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rlCAw": {
-    "name": "SLS Barcelona",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCww": {
-    "name": "SUMAQ Machu Picchu Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Peru",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531050126.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-inCgw": {
-    "name": "Salamander Middleburg",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCww": {
-    "name": "San Clemente Palace Venice",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5jgCgw": {
-    "name": "Shangri-La Tokyo",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCww": {
-    "name": "Sheraton Maui Resort & Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Hawaii",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5iwCgw": {
-    "name": "Shutters on the Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm5igCAw": {
-    "name": "Siari a Ritz-Carlton Reserve",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-j3CQw": {
-    "name": "Silversands Grenada",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Grenada",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXm-ivCQw": {
-    "name": "Singer Palace Hotel Roma",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eS2Cgw": {
-    "name": "Sofitel Kia Ora Moorea Beach Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "French Polynesia",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSuCww": {
-    "name": "Solaz a Luxury Collection Resort Los Cabos",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWrjYjaCQw": {
-    "name": "South Bank - Grace Bay Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "Turks and Caicos",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTuCww": {
-    "name": "Southall Farm & Inn",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531685521.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eTWCgw": {
-    "name": "Stein Eriksen Lodge Deer Valley",
-    "package": "Wedding Ad",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXkCww": {
-    "name": "StolenTime Saint Lucia",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "St Lucia",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-ECQw": {
-    "name": "THE DOLLI at Acropolis",
-    "package": "Tier 1",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-KCAw": {
-    "name": "Tanzerra Resorts",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Multiple Countries",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eThCAw": {
-    "name": "Terranea Resort",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSGCww": {
-    "name": "Terre Blanche H\u00f4tel Spa Golf Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "France",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWn2eSRCgw": {
-    "name": "The Barcelona EDITION",
-    "package": "Tier 1",
-    "invoiceStatus": "",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXsCAw": {
-    "name": "The BoTree",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qtCgw": {
-    "name": "The Breakers Palm Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-CCgw": {
-    "name": "The Cape a Thompson Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Mexico",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771532089670.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCww": {
-    "name": "The Cove at Atlantis",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Bahamas",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCAw": {
-    "name": "The Dorchester",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXIxIyTCgw": {
-    "name": "The Excellence Collection",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "January - Planned"
-      },
-      {
-        "name": "Webinar",
-        "timing": "January 2026"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522164903.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-iCww": {
-    "name": "The Excelsior a Luxury Collection Hotel Florence",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-iCAw": {
-    "name": "The Fifth Avenue Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531372379.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXnt4-cCgw": {
-    "name": "The Global Ambassador",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaXCQw": {
-    "name": "The Hari",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "GB",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JaTCQw": {
-    "name": "The Hoxton Florence",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JbnCww": {
-    "name": "The Lake Como EDITION",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NznCww": {
-    "name": "The Loren at Pink Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Bermuda",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771525307778.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rpCgw": {
-    "name": "The Newman",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "February - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "February - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "GB",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKW1nY-XCAw": {
-    "name": "The Parker Palm Springs",
-    "package": "Tier 2",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned, August - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned, August - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1",
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWMCQw": {
-    "name": "The Ranch Malibu & The Ranch Hudson Valley",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyHCAw": {
-    "name": "The Ranch at Laguna Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34Nz7Cgw": {
-    "name": "The Ritz-Carlton Bacara Santa Barbara",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XECww": {
-    "name": "The Ritz-Carlton Kyoto",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzPCgw": {
-    "name": "The Ritz-Carlton Maui Kapalua",
-    "package": "Brand Spotlight",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Webinar",
-        "timing": "February 2026"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XkCQw": {
-    "name": "The Ritz-Carlton Nikko",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Japan",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531050126.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NyzCww": {
-    "name": "The Ritz-Carlton Oahu Turtle Bay",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzHCQw": {
-    "name": "The Ritz-Carlton Orlando Grande Lakes",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XoCQw": {
-    "name": "The Ritz-Carlton Rancho Mirage",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531685521.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMW34NzXCQw": {
-    "name": "The Ritz-Carlton Residences Waikiki Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8X0Cww": {
-    "name": "The Ritz-Carlton Sarasota",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICww": {
-    "name": "The Ritz-Carlton Tokyo",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      }
-    ],
-    "quarters": [],
-    "country": "Japan",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XgCgw": {
-    "name": "The Riviera Maya EDITION",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed, August - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Mexico",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWw4uOnCgw": {
-    "name": "The Roc ",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Greece",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XYCQw": {
-    "name": "The Roosevelt New Orleans A Waldorf Astoria Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCAw": {
-    "name": "The Seabird Ocean Resort & Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WUCgw": {
-    "name": "The Shelbourne",
-    "package": "Tier 2",
-    "invoiceStatus": "In-kind partnership",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XYCgw": {
-    "name": "The St. Regis Deer Valley",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed, November - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q4 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q4"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771522299585.png",
-          "note": ""
-        }
-      ],
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W4Cww": {
-    "name": "The St. Regis Florence",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XgCAw": {
-    "name": "The St. Regis Kanai Resort Riviera Maya",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8XQCww": {
-    "name": "The St. Regis Maldives Vommuli Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Maldives",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522584384.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WwCQw": {
-    "name": "The St. Regis Mardavall Mallorca Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WECQw": {
-    "name": "The St. Regis Punta Mita Resort",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Mexico",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMX39JabCQw": {
-    "name": "The Strand Turks & Caicos",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Turks and Caicos",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8WICAw": {
-    "name": "The Surrey A Corinthia Hotel",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned, July - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned, July - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl8W0CQw": {
-    "name": "The Tampa EDITION",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned, August - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned, August - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoP8Cww": {
-    "name": "The Towers at Lotte New York Palace",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "September - Planned, February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "September - Planned, February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "February - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1",
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771531372379.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWT19jVCww": {
-    "name": "The Westerly at Hilton Aruba Caribbean Resort",
-    "package": "New Opening",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Aruba",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKX-vPPWCgw": {
-    "name": "The Westin Dragonara Resort - Malta",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Malta",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWj4eCPCww": {
-    "name": "The Westin Grand Cayman Seven Mile Beach Resort & Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Cayman Islands",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9q1Cgw": {
-    "name": "Tivoli Kopke Porto Gaia Hotel",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Portugal",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPsCww": {
-    "name": "Tortuga Bay Puntacana",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned, February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned, February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "February - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q1"
-    ],
-    "country": "Dominican Republic",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771517319318.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPECgw": {
-    "name": "Viceroy at Ombria Algarve",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Portugal",
-    "resources": {
-      "Forum": [
-        {
-          "label": "February Forum Feature",
-          "path": "partner-assets/forum-1771524961538.pdf",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWG8qPUCQw": {
-    "name": "Vignette Collection Dinso Resort & Villas Ko Chang",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Thailand",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoPMCgw": {
-    "name": "Villa Dubrovnik",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "June - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Croatia",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9rpCww": {
-    "name": "Villa San Michele, a Belmond Hotel, Florence",
-    "package": "New Opening",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Journal Article",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Social Media",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOECQw": {
-    "name": "W Algarve",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Portugal",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXuoOSCAw": {
-    "name": "W Aspen & The Sky Residences at W Aspen",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "October - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfxCgw": {
-    "name": "W Barcelona",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "Spain",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWsCgw": {
-    "name": "W Fort Lauderdale",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "July - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKWK2JT-Cww": {
-    "name": "W Muscat",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "Oman",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LXMCAw": {
-    "name": "W Punta Cana",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Dominican Republic",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771532089670.png",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgKXzw5bPCgw": {
-    "name": "W Sardinia",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q1 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "Italy",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycexCgw": {
-    "name": "W South Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "February - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {
-      "Collection": [
-        {
-          "label": "February Collection Feature",
-          "path": "partner-assets/collection-1771530558464.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXn8LWUCgw": {
-    "name": "Wailea Beach Resort, Marriott Maui",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceuCww": {
-    "name": "Waldorf Astoria Chicago",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "March - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfOCQw": {
-    "name": "Waldorf Astoria Los Cabos Pedregal",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "August - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q3 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q3"
-    ],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycehCww": {
-    "name": "Waldorf Astoria Monarch Beach",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceRCAw": {
-    "name": "Waldorf Astoria Osaka",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned, September - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "February - Planned, October - Planned"
-      }
-    ],
-    "quarters": [],
-    "country": "Japan",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfeCww": {
-    "name": "Waldorf Astoria Park City",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "October - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "March - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q4 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q4"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyce-CQw": {
-    "name": "Waldorf Astoria Riviera Maya",
-    "package": "Tier 2",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned, September - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "May - Planned, September - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "May - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q3"
-    ],
-    "country": "Mexico",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyceBCQw": {
-    "name": "Waldorf Astoria Washington DC",
-    "package": "Tier 1",
-    "invoiceStatus": "Invoice sent \u2014 payment pending",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "May - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "June - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMWXl9qlCQw": {
-    "name": "Westin Maui Resort and Spa",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [],
-    "quarters": [],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXyce-Cgw": {
-    "name": "Yacht Club at The Boca Raton",
-    "package": "Tier 2",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "April - Planned, October - Planned"
-      },
-      {
-        "name": "Forum",
-        "timing": "April - Planned, October - Planned"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "Q2 - Planned"
-      },
-      {
-        "name": "Advisor Assets",
-        "timing": "April - Planned"
-      }
-    ],
-    "quarters": [
-      "Q2",
-      "Q3"
-    ],
-    "country": "USA",
-    "resources": {},
-    "lastUpdated": "Feb 20, 2026"
-  },
-  "agxzfm1haWxmb29nYWVyMQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIEQ2FzZRiAgMXXycfhCww": {
-    "name": "Zad\u00fan a Ritz-Carlton Reserve Los Cabos",
-    "package": "Tier 1",
-    "invoiceStatus": "Paid",
-    "deliverables": [
-      {
-        "name": "Collection",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Forum",
-        "timing": "January - Completed"
-      },
-      {
-        "name": "Newsletter",
-        "timing": "January - Completed"
-      }
-    ],
-    "quarters": [
-      "Q1"
-    ],
-    "country": "USA",
-    "resources": {
-      "Forum": [
-        {
-          "label": "January Forum Feature",
-          "path": "partner-assets/forum-1771522695019.png",
-          "note": ""
-        }
-      ],
-      "Collection": [
-        {
-          "label": "January Collection Feature",
-          "path": "partner-assets/collection-1771523560297.png",
-          "note": ""
-        }
-      ],
-      "Newsletter": [
-        {
-          "label": "January Newsletter Feature",
-          "path": "partner-assets/newsletter-1771540569714.pdf",
-          "note": ""
-        }
-      ]
-    },
-    "lastUpdated": "Feb 20, 2026"
-  }
-};
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Streak Stand-in Server
+--------------------------------
+A local, offline imitation of the parts of the Streak v1 API that update.py
+uses, for development and benchmarks without a live API key.
+
+Usage:  python3 streak_standin.py [--port 8765] [--boxes 1000] [--seed 1] [--pipeline-key KEY]
+                                  [--fixtures DIR] [--fail-rate 0.0] [--latency-ms 0]
+                                  [--webhook-url URL]
+        python3 streak_standin.py --record DIR     (snapshot the live pipeline)
+        python3 streak_standin.py --replay FILE --to URL [--interval-ms 0]
+
+Then:   STREAK_BASE_URL=http://127.0.0.1:8765 STREAK_RATE=1000 python3 update.py --no-git
+
+Serves GET /pipelines/{key} (with an ETag), paginated GET /pipelines/{key}/boxes
+(optionally sortBy=lastUpdatedTimestamp), GET and DELETE /boxes/{key}, and
+POST /boxes/{key}/fields/{fieldKey}, which edits the box and bumps its
+lastUpdatedTimestamp. Boxes come from recorded fixtures (DIR/pipeline.json +
+DIR/boxes.json) or a deterministic synthetic generator. GET /_stats returns
+request counts; POST /_reset clears them.
+
+GET /boxes/{key} includes the box's pipelineKey (--pipeline-key, default the
+2026 pipeline), which `update.py --serve` checks.
+
+With --webhook-url, every edit or delete is also posted to that URL as a
+box webhook (for `update.py --serve`); --replay posts recorded webhook
+bodies (one JSON document per line) instead.
+"""
+
+import os, json, hashlib, random, sys, threading, time
+from urllib.request import urlopen, Request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from update import (
+    ALL_STAGE_NAMES, FEATURE_FIELDS, PACKAGE_LABELS, INVOICE_LABELS, QUARTER_LABELS, COLLECTION_NA,
+    F_PRICE, F_INVOICE, F_INVOICE_URL, F_COUNTRY, F_BRAND, F_GROUP, F_QUARTER, F_EMAIL,
+    F_INVOICE_DATE, F_PACKAGE, PIPELINE_KEY,
+)
+
+# ── Synthetic data ─────────────────────────────────────────────────
+BASE_TS          = 1767225600000   # 2026-01-01, first synthetic update time (ms)
+PORTAL_LINK_KEY  = "1080"
+TIMING_LABELS    = {"9001": "Q1 - Planned", "9002": "Q2 - Planned", "9003": "Q3 - Planned",
+                    "9004": "August - Planned", COLLECTION_NA: "N/A"}
+STAGE_WEIGHTS    = {"5014": 6, "5015": 6, "5016": 5, "5017": 4, "5007": 5, "5011": 4, "5004": 8,
+                    "5001": 5, "5013": 10, "5010": 6, "5008": 8, "5009": 3, "5002": 25, "5018": 5}
+COUNTRIES = ["USA", "Mexico", "Italy", "France", "Japan", "Greece", "Thailand", "Portugal", "Spain", "Peru"]
+BRANDS    = ["Aman", "1 Hotels", "Four Seasons", "Rosewood", "Belmond", "Six Senses", "Auberge"]
+GROUPS    = ["Marriott", "Hyatt", "Accor", "IHG", "Independent"]
+
+def synthetic_pipeline():
+    """Pipeline document with every stage and field update.py reads."""
+    options = lambda kind, labels: {
+        "TAG":      {"tagSettings": {"tags": [{"key": k, "tag": v} for k, v in labels.items()]}},
+        "DROPDOWN": {"dropdownSettings": {"items": [{"key": k, "name": v} for k, v in labels.items()]}},
+    }[kind]
+    fields = [
+        {"key": F_PRICE,        "name": "Price",        "type": "TEXT_INPUT"},
+        {"key": F_INVOICE,      "name": "Invoice",      "type": "DROPDOWN", **options("DROPDOWN", INVOICE_LABELS)},
+        {"key": F_INVOICE_URL,  "name": "Invoice URL",  "type": "TEXT_INPUT"},
+        {"key": F_COUNTRY,      "name": "Country",      "type": "TEXT_INPUT"},
+        {"key": F_BRAND,        "name": "Brand",        "type": "TEXT_INPUT"},
+        {"key": F_GROUP,        "name": "Group",        "type": "TEXT_INPUT"},
+        {"key": F_QUARTER,      "name": "Quarter",      "type": "TAG",      **options("TAG", QUARTER_LABELS)},
+        {"key": F_EMAIL,        "name": "Email",        "type": "TEXT_INPUT"},
+        {"key": F_INVOICE_DATE, "name": "Invoice Date", "type": "DATE"},
+        {"key": F_PACKAGE,      "name": "Package",      "type": "DROPDOWN", **options("DROPDOWN", PACKAGE_LABELS)},
+        {"key": PORTAL_LINK_KEY, "name": "Partner Portal Link", "type": "TEXT_INPUT"},
+    ]
+    for name, key in FEATURE_FIELDS.items():
+        if name == "Webinar":
+            fields.append({"key": key, "name": name, "type": "DATE"})
+        elif name in ("Collection", "Newsletter"):
+            fields.append({"key": key, "name": name, "type": "TAG", **options("TAG", TIMING_LABELS)})
+        else:
+            fields.append({"key": key, "name": name, "type": "DROPDOWN", **options("DROPDOWN", TIMING_LABELS)})
+    return {"key": "standin", "name": "Amplify 2026",
+            "stages": {k: {"key": k, "name": v} for k, v in ALL_STAGE_NAMES.items()},
+            "fields": fields}
+
+def synthetic_box(i, seed=1):
+    """Box number `i` of the synthetic pipeline — the same for a given seed,
+    so any page can be generated on demand."""
+    rnd    = random.Random(seed * 1_000_003 + i)
+    stage  = rnd.choices(list(STAGE_WEIGHTS), weights=list(STAGE_WEIGHTS.values()))[0]
+    signed = stage in ("5014", "5015", "5016", "5017", "5007")
+    fields = {
+        F_PRICE:   rnd.choice(["$1,500", "2500", "$4,000.00", "7500", "", "TBD"]),
+        F_COUNTRY: rnd.choice(COUNTRIES),
+        F_BRAND:   rnd.choice(BRANDS),
+        F_GROUP:   rnd.choice(GROUPS),
+        F_EMAIL:   f"partner{i}@example.com",
+        F_PACKAGE: rnd.choice(list(PACKAGE_LABELS)),
+        F_QUARTER: rnd.sample(list(QUARTER_LABELS), rnd.randint(0, 2)),
+    }
+    if signed or rnd.random() < 0.2:
+        fields[F_INVOICE] = rnd.choice(list(INVOICE_LABELS))
+    if signed and rnd.random() < 0.7:
+        fields[F_INVOICE_DATE] = BASE_TS - rnd.randint(1, 300) * 86_400_000
+        fields[F_INVOICE_URL]  = f"https://invoices.example.com/{i}"
+    for name, key in FEATURE_FIELDS.items():
+        if rnd.random() < 0.3:
+            if name == "Webinar":
+                fields[key] = BASE_TS + rnd.randint(0, 330) * 86_400_000
+            elif name in ("Collection", "Newsletter"):
+                fields[key] = [rnd.choice(list(TIMING_LABELS))]
+            else:
+                fields[key] = rnd.choice(list(TIMING_LABELS))
+    return {
+        "key":                  f"sb{i:07d}",
+        "name":                 f"{fields[F_BRAND]} {rnd.choice(COUNTRIES)} {i}",
+        "stageKey":             stage,
+        "creationTimestamp":    BASE_TS - 400 * 86_400_000,
+        "lastStageChangeDate":  BASE_TS - rnd.randint(1, 300) * 86_400_000,
+        "lastUpdatedTimestamp": BASE_TS + i * 60_000,
+        "fields":               fields,
+    }
+
+# ── Box store ──────────────────────────────────────────────────────
+class BoxStore:
+    """The boxes the stand-in serves: recorded fixtures, or `count` synthetic
+    boxes generated page by page. Edits made through the field POST are kept
+    as overrides on top."""
+
+    def __init__(self, count=1000, seed=1, boxes=None, pipeline=None, pipeline_key=PIPELINE_KEY):
+        self.fixed    = boxes
+        self.pipeline_key = pipeline_key
+        self.count    = len(boxes) if boxes is not None else count
+        self.seed     = seed
+        self.pipeline = pipeline or synthetic_pipeline()
+        self.etag     = '"%s"' % hashlib.sha256(json.dumps(self.pipeline, sort_keys=True).encode()).hexdigest()[:16]
+        self.edits    = {}        # index → edited box
+        self.deleted  = set()     # indices of deleted boxes
+        self.lock     = threading.Lock()
+        if boxes is not None:
+            self.index = {b["key"]: i for i, b in enumerate(boxes)}
+            self.order = sorted(range(self.count), key=lambda i: -(boxes[i].get("lastUpdatedTimestamp") or 0))
+        else:
+            self.index = None
+            self.order = range(self.count - 1, -1, -1)   # synthetic timestamps rise with i
+        self._recent = None
+
+    @classmethod
+    def from_fixtures(cls, path):
+        with open(os.path.join(path, "boxes.json")) as f:
+            boxes = json.load(f)
+        pipeline = None
+        if os.path.exists(os.path.join(path, "pipeline.json")):
+            with open(os.path.join(path, "pipeline.json")) as f:
+                pipeline = json.load(f)
+        return cls(boxes=boxes, pipeline=pipeline)
+
+    def index_of(self, key):
+        if self.index is not None:
+            return self.index.get(key)
+        if key.startswith("sb") and key[2:].isdigit() and int(key[2:]) < self.count:
+            return int(key[2:])
+        return None
+
+    def box(self, i):
+        if i in self.edits:
+            return self.edits[i]
+        return self.fixed[i] if self.fixed is not None else synthetic_box(i, self.seed)
+
+    def get(self, key):
+        """One box, with the pipelineKey the single-box endpoint includes."""
+        i = self.index_of(key)
+        if i is None or i in self.deleted:
+            return None
+        box = self.box(i)
+        return {**box, "pipelineKey": box.get("pipelineKey", self.pipeline_key)}
+
+    def page(self, page, limit, by_updated=False):
+        if not by_updated and not self.deleted:
+            return [self.box(i) for i in range(page * limit, min((page + 1) * limit, self.count))]
+        with self.lock:
+            if not by_updated:
+                order = [i for i in range(self.count) if i not in self.deleted]
+            else:
+                if self._recent is None:
+                    edited = sorted(self.edits, key=lambda i: -self.edits[i]["lastUpdatedTimestamp"])
+                    self._recent = edited + [i for i in self.order if i not in self.edits]
+                order = [i for i in self._recent if i not in self.deleted] if self.deleted else self._recent
+        return [self.box(i) for i in order[page * limit:(page + 1) * limit]]
+
+    def delete(self, key):
+        """Delete a box. Returns False for an unknown box."""
+        i = self.index_of(key)
+        if i is None or i in self.deleted:
+            return False
+        with self.lock:
+            self.deleted.add(i)
+        return True
+
+    def set_field(self, key, field_key, value):
+        """Apply a field POST. Returns False for an unknown box."""
+        i = self.index_of(key)
+        if i is None or i in self.deleted:
+            return False
+        with self.lock:
+            box = json.loads(json.dumps(self.box(i)))
+            box.setdefault("fields", {})[field_key] = value
+            box["lastUpdatedTimestamp"] = int(time.time() * 1000)
+            self.edits[i] = box
+            self._recent  = None
+        return True
+
+# ── HTTP server ────────────────────────────────────────────────────
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, store, port=8765, fail_rate=0.0, latency_ms=0, webhook_url=None):
+        super().__init__(("127.0.0.1", port), StandinHandler)
+        self.store       = store
+        self.webhook_url = webhook_url
+        self.fail_rate   = fail_rate
+        self.latency     = latency_ms / 1000
+        self.faults      = random.Random(0)
+        self.stats       = {}
+        self.stats_lock  = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def notify(self, event, key):
+        """Post a box webhook for `key` (in the background, best effort)."""
+        if not self.webhook_url:
+            return
+        body = json.dumps({"event": event, "boxKey": key, "timestamp": int(time.time() * 1000)}).encode()
+        threading.Thread(target=post_json, args=(self.webhook_url, body), daemon=True).start()
+
+    def count(self, route):
+        with self.stats_lock:
+            self.stats[route] = self.stats.get(route, 0) + 1
+            self.stats["total"] = self.stats.get("total", 0) + 1
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, as with the real API
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, obj, status=200, headers=None):
+        body = json.dumps(obj, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_empty(self, status, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def throttled(self, route):
+        """Count the request, apply latency, and maybe inject a 429."""
+        srv = self.server
+        srv.count(route)
+        if srv.latency:
+            time.sleep(srv.latency)
+        if srv.fail_rate and srv.faults.random() < srv.fail_rate:
+            srv.count("429")
+            self.send_empty(429, {"Retry-After": "0.1"})
+            return True
+        return False
+
+    def do_GET(self):
+        url, store = urlparse(self.path), self.server.store
+        parts = url.path.strip("/").split("/")
+        if url.path == "/_stats":
+            with self.server.stats_lock:
+                return self.send_json(dict(self.server.stats))
+        if "pipelines" in parts and parts[-1] == "boxes":
+            if self.throttled("GET boxes"):
+                return
+            q = parse_qs(url.query)
+            return self.send_json(store.page(int(q.get("page", ["0"])[0]), int(q.get("limit", ["100"])[0]),
+                                             q.get("sortBy") == ["lastUpdatedTimestamp"]))
+        if len(parts) >= 2 and parts[-2] == "boxes":
+            if self.throttled("GET box"):
+                return
+            box = store.get(parts[-1])
+            return self.send_json(box) if box is not None else self.send_json({"error": "box not found"}, 404)
+        if len(parts) >= 2 and parts[-2] == "pipelines":
+            if self.throttled("GET pipeline"):
+                return
+            if self.headers.get("If-None-Match") == store.etag:
+                return self.send_empty(304, {"ETag": store.etag})
+            return self.send_json(store.pipeline, headers={"ETag": store.etag})
+        self.send_json({"error": "not found"}, 404)
+
+    def do_POST(self):
+        url, store = urlparse(self.path), self.server.store
+        parts = url.path.strip("/").split("/")
+        body  = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if url.path == "/_reset":
+            with self.server.stats_lock:
+                self.server.stats.clear()
+            return self.send_empty(204)
+        if len(parts) >= 4 and parts[-4] == "boxes" and parts[-2] == "fields":
+            if self.throttled("POST field"):
+                return
+            try:
+                value = json.loads(body or b"{}").get("value")
+            except ValueError:
+                return self.send_json({"error": "invalid JSON"}, 400)
+            if not store.set_field(parts[-3], parts[-1], value):
+                return self.send_json({"error": "box not found"}, 404)
+            self.server.notify("BOX_EDIT_FIELD", parts[-3])
+            return self.send_json({"key": parts[-1], "value": value})
+        self.send_json({"error": "not found"}, 404)
+
+    def do_DELETE(self):
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if len(parts) >= 2 and parts[-2] == "boxes":
+            if self.throttled("DELETE box"):
+                return
+            if not self.server.store.delete(parts[-1]):
+                return self.send_json({"error": "box not found"}, 404)
+            self.server.notify("BOX_DELETE", parts[-1])
+            return self.send_json({"success": True})
+        self.send_json({"error": "not found"}, 404)
+
+def start_in_thread(store, port=0, **kw):
+    """Start a stand-in on a background thread (port 0 = any free port)."""
+    server = StandinServer(store, port, **kw)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ── Webhooks ───────────────────────────────────────────────────────
+def post_json(url, body):
+    try:
+        urlopen(Request(url, data=body, headers={"Content-Type": "application/json"}), timeout=10).close()
+    except OSError as e:
+        print(f"  Warning: webhook to {url} failed ({e})")
+
+def replay_webhooks(path, url, interval_ms=0):
+    """Post each recorded webhook body in `path` (JSON lines) to `url`."""
+    sent = 0
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                post_json(url, line.strip().encode())
+                sent += 1
+                time.sleep(interval_ms / 1000)
+    print(f"Replayed {sent} webhook(s) to {url}")
+
+# ── Fixture recording ──────────────────────────────────────────────
+def record_fixtures(out_dir):
+    """Save the live pipeline and every box as fixtures for --fixtures."""
+    import update
+    os.makedirs(out_dir, exist_ok=True)
+    r = update.streak.get(f"/pipelines/{update.PIPELINE_KEY}")
+    r.raise_for_status()
+    boxes = update.fetch_all_boxes()
+    with open(os.path.join(out_dir, "pipeline.json"), "w") as f:
+        json.dump(r.json(), f, indent=1)
+    with open(os.path.join(out_dir, "boxes.json"), "w") as f:
+        json.dump(boxes, f, separators=(",", ":"))
+    print(f"Recorded pipeline and {len(boxes)} boxes to {out_dir}")
+
+def arg(name, default=None):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else default
+
+if __name__ == "__main__":
+    if "--record" in sys.argv:
+        record_fixtures(arg("--record"))
+        sys.exit(0)
+    if "--replay" in sys.argv:
+        replay_webhooks(arg("--replay"), arg("--to"), float(arg("--interval-ms", 0)))
+        sys.exit(0)
+    if "--fixtures" in sys.argv:
+        store = BoxStore.from_fixtures(arg("--fixtures"))
+    else:
+        store = BoxStore(count=int(arg("--boxes", 1000)), seed=int(arg("--seed", 1)),
+                         pipeline_key=arg("--pipeline-key", PIPELINE_KEY))
+    server = StandinServer(store, int(arg("--port", 8765)),
+                           fail_rate=float(arg("--fail-rate", 0)), latency_ms=float(arg("--latency-ms", 0)),
+                           webhook_url=arg("--webhook-url"))
+    print(f"Streak stand-in serving {store.count} boxes at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
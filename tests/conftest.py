@@ -0,0 +1,30 @@
+"""Shared test setup: the repo on sys.path, a Streak rate that does not
+throttle, and a fixture that points update's Streak client at a stand-in."""
+
+import os, sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("STREAK_RATE", "1000")     # read when update is imported
+
+import update
+from streak_standin import start_in_thread
+
+@pytest.fixture
+def standin():
+    """Start a stand-in serving a BoxStore and send update's Streak calls to
+    it; returns the server."""
+    servers, base_url = [], update.streak.base_url
+
+    def start(store):
+        server = start_in_thread(store)
+        servers.append(server)
+        update.streak.base_url = server.url
+        return server
+    yield start
+    update.streak.base_url = base_url
+    for server in servers:
+        server.shutdown()
+        server.server_close()
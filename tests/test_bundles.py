@@ -0,0 +1,213 @@
+"""The dashboard bundles written by write_dashboard_bundles()."""
+
+import json, os
+from datetime import datetime, timedelta
+
+import update
+from streak_standin import synthetic_box, synthetic_pipeline
+
+NOW = datetime(2026, 10, 17, 9, 0)
+
+def synthetic_state(count, seed=1):
+    state = update.MetricsState(update.PipelineSchema(synthetic_pipeline()))
+    for i in range(count):
+        state.upsert(synthetic_box(i, seed))
+    return state
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def test_rerun_on_unchanged_boxes_keeps_data_js(tmp_path):
+    state = synthetic_state(300)
+    changed, over = update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    assert not over and str(tmp_path / "data.js") in changed
+    before = read_bytes(tmp_path / "data.js")
+
+    # The next day nothing changed but the date, so nothing is rewritten
+    changed, _ = update.write_dashboard_bundles(state, state.summary(NOW + timedelta(days=1)),
+                                                str(tmp_path), budgets={})
+    assert changed == []
+    assert read_bytes(tmp_path / "data.js") == before
+    assert update.read_summary(str(tmp_path / "data.js"))["lastUpdated"] == NOW.strftime("%b %d, %Y")
+
+def ungap(gaps):
+    ids, total = [], 0
+    for gap in gaps:
+        total += gap
+        ids.append(total)
+    return ids
+
+def matches(row, query):
+    return any(query in (row.get(f) or "").lower() for f in update.SEARCH_FIELDS)
+
+def search_ids(index, rows, query, facets):
+    """The dashboard's index lookup (_searchIds in index.html)."""
+    ids = None
+    def narrow(postings):
+        nonlocal ids
+        ids = postings if ids is None else sorted(set(ids) & set(postings))
+    for name, value in facets.items():
+        narrow(ungap(index["facets"][name].get(value, [])))
+    if len(query) >= 3:
+        for i in range(len(query) - 2):
+            narrow(ungap(index["grams"].get(query[i:i + 3], [])))
+    elif ids is None:
+        ids = range(len(rows))
+    return [i for i in ids if matches(rows[i], query)]
+
+def scan_ids(rows, query, facets):
+    """The dashboard's fallback: a substring scan of every row."""
+    return [i for i, row in enumerate(rows)
+            if matches(row, query) and all(value in update.SEARCH_FACETS[name](row) for name, value in facets.items())]
+
+def test_search_index_matches_substring_scan(tmp_path):
+    state = synthetic_state(400)
+    update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    with open(tmp_path / "data-partners.json") as f:
+        rows = json.load(f)
+    with open(tmp_path / "data-search.json") as f:
+        index = json.load(f)
+    assert index["rows"] == len(rows)
+
+    row = rows[17]
+    queries = ["", "a", "ma", "os", "aman", "four seasons", "partner1", "@example", row["name"].lower()[-5:], "zzz"]
+    filters = [{}, {"stage": row["stage"]}, {"quarter": "TBD"}, {"stage": row["stage"], "invoice": "Paid"}]
+    for query in queries:
+        for facets in filters:
+            found = search_ids(index, rows, query, facets)
+            assert found == scan_ids(rows, query, facets), (query, facets)
+    assert search_ids(index, rows, "partner1", {}) and search_ids(index, rows, "a", {"quarter": "TBD"})
+
+def cube_total(cube, **filters):
+    """(count, value) of the cube cell for `filters` ({dim: value}; the rest "all")."""
+    cell = 0
+    for dim, values in zip(cube["dims"], cube["values"]):
+        i = values.index(filters[dim]) if dim in filters else len(values)
+        cell = cell * (len(values) + 1) + i
+    cells = dict(zip(ungap(cube["cells"]), zip(cube["count"], cube["value"])))
+    return cells.get(cell, (0, 0))
+
+def test_cube_totals_match_compute_metrics():
+    boxes   = [synthetic_box(i) for i in range(500)]
+    schema  = update.PipelineSchema(synthetic_pipeline())
+    state   = synthetic_state(500)
+    cube    = state.cube()
+    labels  = {"stage":   lambda p: [p["stage"]],
+               "package": lambda p: [p["package"]],
+               "quarter": lambda p: p["quarters"] or ["TBD"],
+               "country": lambda p: [p["country"]],
+               "invoice": lambda p: [p["invoiceStatus"]]}
+    partners = update.compute_metrics(boxes, schema, NOW)["partners"]
+
+    def expected(filters):
+        rows = [p for p in partners if all(v in labels[d](p) for d, v in filters.items())]
+        return len(rows), sum(p["price"] for p in rows)
+
+    assert cube_total(cube) == expected({}) == (len(partners), sum(p["price"] for p in partners))
+    row = partners[0]
+    for dim, values in zip(cube["dims"], cube["values"]):
+        for value in values:
+            assert cube_total(cube, **{dim: value}) == expected({dim: value}), (dim, value)
+            filters = {"stage": row["stage"], dim: value}
+            assert cube_total(cube, **filters) == expected(filters), filters
+    filters = {"stage": row["stage"], "quarter": "TBD", "country": row["country"], "package": row["package"]}
+    assert cube_total(cube, **filters) == expected(filters)
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+def apply_delta(rows, delta):
+    """The dashboard's patch step (_applyPartnerDelta in index.html)."""
+    out = []
+    for op in delta["ops"]:
+        out += rows[op[0]:op[0] + op[1]] if isinstance(op, list) else [op]
+    assert len(out) == delta["rows"]
+    return out
+
+def signed_box(count):
+    return next(b for b in map(synthetic_box, range(count)) if b["stageKey"] == "5014")
+
+def test_delta_reproduces_the_new_table(tmp_path):
+    state = synthetic_state(400)
+    update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    old_rows = load_json(tmp_path / "data-partners.json")
+
+    # One signed box re-priced, one added, one removed
+    box = signed_box(400)
+    box["fields"][update.F_PRICE] = "$123,456"
+    state.upsert(box)
+    state.upsert(synthetic_box(400))
+    state.discard(next(r["key"] for r in old_rows if r["key"] != box["key"]))
+    update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    chain = update.read_summary(str(tmp_path / "data.js"))["partnersDeltas"]
+    assert len(chain) == 1
+    delta = load_json(tmp_path / chain[0]["url"])
+    assert apply_delta(old_rows, delta) == load_json(tmp_path / "data-partners.json")
+    assert (delta["changed"], delta["removed"]) == (1, 1) and delta["added"] <= 1
+
+def test_delta_carries_only_changed_summary_fields(tmp_path):
+    state = synthetic_state(400)
+    update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    old_summary = update.read_summary(str(tmp_path / "data.js"))
+
+    box = signed_box(400)
+    box["fields"][update.F_PRICE] = "$123,456"
+    state.upsert(box)
+    update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    summary = update.read_summary(str(tmp_path / "data.js"))
+    delta   = load_json(tmp_path / summary["partnersDeltas"][0]["url"])
+    moved   = {k for k, v in summary.items() if old_summary.get(k) != v and k not in update.LINK_FIELDS}
+    assert set(delta["summary"]) == moved
+    assert "totalSigned" in moved and not {"topCountries", "topGroups", "topBrands", "lastUpdated"} & moved
+
+def column_reader(col):
+    """One column's values (_columnReader in index.html)."""
+    if isinstance(col, list):
+        return col
+    if "dict" in col:
+        return [col["dict"][i] for i in col["ids"]]
+    if "prefix" in col:
+        return ["" if v is None else col["prefix"] + v for v in col["values"]]
+    return [[name for b, name in enumerate(col["names"]) if m >> b & 1] for m in col["masks"]]
+
+def decode_columns(doc):
+    """The rows of data-partners-cols.json (decodePartnerColumns in index.html)."""
+    cols = {f: column_reader(c) for f, c in doc["cols"].items() if not (isinstance(c, dict) and "derived" in c)}
+    for f, c in doc["cols"].items():
+        if isinstance(c, dict) and "derived" in c:
+            cols[f] = [c["derived"] + v for v in cols[c["from"]]]
+    if "features" in cols:
+        timings, start, features = column_reader(doc["cols"]["features"]["timings"]), 0, []
+        for names in cols["features"]:
+            features.append([{"name": n, "timing": t} for n, t in zip(names, timings[start:])])
+            start += len(names)
+        cols["features"] = features
+    return [{f: cols[f][i] for f in doc["fields"]} for i in range(doc["rows"])]
+
+def encode_columns(rows):
+    columns = update.PartnerColumns()
+    assert list(columns.feed(rows)) == rows
+    return json.loads(columns.encode())
+
+def test_columns_decode_to_the_partner_rows(tmp_path):
+    state = synthetic_state(400)
+    update.write_dashboard_bundles(state, state.summary(NOW), str(tmp_path), budgets={})
+    doc  = load_json(tmp_path / "data-partners-cols.json")
+    rows = load_json(tmp_path / "data-partners.json")
+    assert decode_columns(doc) == rows
+    cols = doc["cols"]
+    assert "masks" in cols["features"] and "masks" in cols["quarters"] and "dict" in cols["stage"]
+    assert "derived" in cols["streakUrl"]
+
+def test_columns_fall_back_for_unordered_and_repeated_sets():
+    rows = [{"key": f"k{i}", "tags": tags, "n": i}
+            for i, tags in enumerate([["a", "b"], ["b", "a"], [], ["c", "c"], ["a"]])]
+    doc  = encode_columns(rows)
+    assert "dict" in doc["cols"]["tags"] and isinstance(doc["cols"]["key"], list)
+    assert decode_columns(doc) == rows
+    ordered = [{"key": "x" * 10 + str(i), "tags": tags} for i, tags in enumerate([["b", "a"], ["b"], ["a", "c"]])]
+    doc = encode_columns(ordered)
+    assert doc["cols"]["tags"]["names"] == ["b", "a", "c"] and doc["cols"]["key"]["prefix"] == "x" * 10
+    assert decode_columns(doc) == ordered
@@ -0,0 +1,38 @@
+"""ChangeBatcher coalesces webhook events: one batch per quiet period, and
+at most `max_wait` of delay while events keep coming."""
+
+import threading, time
+
+import update
+
+def collect(batcher, batches, count):
+    for _ in range(count):
+        batch = batcher.wait()
+        batches.append((time.monotonic(), batch))
+
+def test_batcher_flushes_once_per_window():
+    batcher, batches = update.ChangeBatcher(debounce=0.2, max_wait=0.6), []
+    worker = threading.Thread(target=collect, args=(batcher, batches, 3), daemon=True)
+    worker.start()
+
+    # A burst, repeats included, is one batch once it goes quiet
+    start = time.monotonic()
+    for keys in ({"a"}, {"b", "a"}, {"c"}):
+        batcher.add(keys)
+        time.sleep(0.02)
+    time.sleep(0.4)
+    assert len(batches) == 1
+    at, batch = batches[0]
+    assert batch == {"a", "b", "c"} and 0.2 <= at - start < 0.4
+
+    # A steady stream never goes quiet, so it is cut every max_wait
+    start, sent = time.monotonic(), set()
+    for i in range(26):
+        batcher.add({f"k{i}"})
+        sent.add(f"k{i}")
+        time.sleep(0.05)
+    worker.join(timeout=2)
+    assert len(batches) == 3
+    (first, a), (second, b) = batches[1], batches[2]
+    assert 0.6 <= first - start < 0.8 and 0.5 <= second - first < 0.8
+    assert not a & b and a | b <= sent and len(a | b) >= 20
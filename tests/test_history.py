@@ -0,0 +1,54 @@
+"""BoxHistory keeps one validity interval per stretch of unchanged state,
+and its as-of queries read the interval that held at the time asked."""
+
+from datetime import datetime, timedelta
+
+import update
+from streak_standin import F_PRICE, F_INVOICE, synthetic_box, synthetic_pipeline
+
+T0 = datetime(2026, 1, 1)
+
+def box(stage, price, invoice):
+    b = synthetic_box(0)
+    b["stageKey"] = stage
+    b["fields"].update({F_PRICE: price, F_INVOICE: invoice})
+    return b
+
+def record(history, state, b, days):
+    if b is None:
+        state.discard("sb0000000")
+    else:
+        state.upsert(b)
+    return history.record(state.records, now=T0 + timedelta(days=days))
+
+def test_as_of_queries_read_the_interval_in_force(tmp_path):
+    state   = update.MetricsState(update.PipelineSchema(synthetic_pipeline()))
+    history = update.BoxHistory(str(tmp_path / "history.sqlite"))
+    try:
+        assert record(history, state, box("5014", "1000", "9001"), 0)[1] == 1
+        assert record(history, state, box("5014", "1000", "9001"), 5)[1] == 0     # no change, no row
+        record(history, state, box("5014", "2500", "9001"), 10)                   # price edit
+        record(history, state, box("5015", "2500", "9002"), 40)                   # stage and invoice move
+        record(history, state, None, 70)                                          # deleted
+
+        rows = history.db.execute("SELECT valid_from, valid_to, stage, cents FROM states ORDER BY valid_from").fetchall()
+        ms = lambda days: update.to_ms(T0 + timedelta(days=days))
+        assert rows == [(ms(0), ms(10), "5014", 100000), (ms(10), ms(40), "5014", 250000),
+                        (ms(40), ms(70), "5015", 250000)]
+
+        curve = history.revenue_curve(T0, T0 + timedelta(days=80), step_days=10)
+        assert [(p["value"], p["count"]) for p in curve] == \
+               [(1000, 1), (2500, 1), (2500, 1), (2500, 1), (2500, 1), (2500, 1), (2500, 1), (0, 0), (0, 0)]
+
+        # 35 days in: Outstanding since day 0 (the price edit keeps the stint), 2500 owed
+        aging = history.invoice_aging(T0 + timedelta(days=35))
+        assert aging["30-60"] == {"count": 1, "value": 2500}
+        assert sum(b["count"] for b in aging.values()) == 1
+        assert sum(b["count"] for b in history.invoice_aging(T0 + timedelta(days=45)).values()) == 0
+
+        assert history.transitions(T0, T0 + timedelta(days=80)) == \
+               [{"key": "sb0000000", "at": ms(40), "from": "5014", "to": "5015"}]
+        assert history.stage_dwell(T0, T0 + timedelta(days=80)) == \
+               {"5014": {"count": 1, "meanDays": 40.0, "medianDays": 40.0}}
+    finally:
+        history.close()
@@ -0,0 +1,74 @@
+"""A second pipeline with its own stage keys runs as a worker against the
+Streak stand-in and produces a summary for those stages."""
+
+import json, os, subprocess, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streak_standin import BoxStore, start_in_thread, synthetic_box, synthetic_pipeline
+
+STAGE_MAP = {"5014": "6001", "5015": "6002", "5011": "6011", "5004": "6004"}
+CUSTOM = {
+    "id":             "test-custom",
+    "key":            "custom-pipeline-key",
+    "signedStages":   {"6001": "Gold", "6002": "Silver"},
+    "pipelineStages": {"6011": "To Invoice", "6004": "Talking"},
+    "stageRoles":     {"needsInvoice": "6011", "inDiscussion": "6004"},
+    "funnelOrder":    ["6002", "6001"],
+}
+
+def custom_boxes(count):
+    boxes = []
+    for i in range(count):
+        box = synthetic_box(i)
+        box["stageKey"] = STAGE_MAP.get(box["stageKey"], box["stageKey"])
+        boxes.append(box)
+    return boxes
+
+def custom_pipeline():
+    doc = synthetic_pipeline()
+    for stages in (CUSTOM["signedStages"], CUSTOM["pipelineStages"]):
+        doc["stages"].update({k: {"key": k, "name": v} for k, v in stages.items()})
+    return doc
+
+def run_worker(env):
+    proc = subprocess.run([sys.executable, os.path.join(ROOT, "update.py"), "--no-git"],
+                          env=env, cwd=ROOT, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+def test_pipeline_with_custom_stages(tmp_path):
+    boxes  = custom_boxes(200)
+    config = {**CUSTOM, "stateDir": str(tmp_path / "state"), "outDir": str(tmp_path / "out")}
+    (tmp_path / "pipelines.json").write_text(json.dumps([config]))
+    report_path = tmp_path / "state" / f"run-report-{CUSTOM['id']}.json"
+    data_js     = tmp_path / "out" / "data.js"
+    server = start_in_thread(BoxStore(boxes=boxes, pipeline=custom_pipeline()))
+    try:
+        env = {**os.environ, "STREAK_BASE_URL": server.url, "STREAK_RATE": "1000",
+               "AMPLIFY_PIPELINES": str(tmp_path / "pipelines.json"), "AMPLIFY_PIPELINE": CUSTOM["id"]}
+        run_worker(env)
+        report = json.loads(report_path.read_text())
+        assert report["rollup"]["signedCount"] == sum(b["stageKey"] in CUSTOM["signedStages"] for b in boxes)
+
+        text = data_js.read_text()
+        data = json.loads(text[text.index("{"):text.rindex("}") + 1])
+        funnel = [f["stageKey"] for f in data["funnel"]]
+        assert funnel[:4] == ["6002", "6001", "6011", "6004"]
+        talking = [b for b in boxes if b["stageKey"] == "6004"]
+        assert data["inDiscussionCount"] == len(talking)
+        assert data["marketingComplete"] == 0          # no stage has that role here
+
+        # Published as of an earlier day: reruns on the same boxes keep that
+        # date, so neither data.js nor the rollup entry changes
+        data_js.write_text(text.replace(data["lastUpdated"], "Jan 02, 2026"))
+        before = data_js.read_bytes()
+        run_worker(env)
+        first = json.loads(report_path.read_text())["rollup"]
+        run_worker(env)
+        assert data_js.read_bytes() == before
+        assert json.loads(report_path.read_text())["rollup"] == first
+        assert first["lastUpdated"] == "Jan 02, 2026"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,40 @@
+"""Incremental syncs pick up edits, the periodic full reconcile picks up
+deletes, and after each the snapshot and the incrementally updated metrics
+match a full fetch and a full recompute."""
+
+from datetime import datetime
+
+import update
+from streak_standin import BoxStore, F_PRICE, synthetic_pipeline
+
+def check_against_full_fetch(sync, schema, metrics_path, now):
+    boxes = sorted(update.fetch_all_boxes(), key=lambda b: b["key"])
+    assert list(sync.boxes) == boxes
+    state = update.update_metrics(sync, schema, path=metrics_path)
+    assert state.result(now) == update.compute_metrics(boxes, schema, now)
+
+def test_sync_after_edit_and_delete_matches_full_fetch(tmp_path, standin):
+    store  = BoxStore(count=1200)
+    standin(store)
+    schema = update.PipelineSchema(synthetic_pipeline())
+    path, metrics_path, now = str(tmp_path / "boxes.sqlite"), str(tmp_path / "metrics.json"), datetime.now()
+    first  = update.sync_boxes(path=path)
+    assert len(first.changed) == 1200 and first.removed == []
+    check_against_full_fetch(first, schema, metrics_path, now)
+
+    store.set_field("sb0000007", F_PRICE, "$9,999")
+    store.delete("sb0000011")
+    sync = update.sync_boxes(path=path)
+    assert sync.changed == ["sb0000007"] and sync.removed == []
+    assert sync.generation == first.generation + 1
+    assert list(sync.boxes.get_many(["sb0000007"]))[0]["fields"][F_PRICE] == "$9,999"
+
+    # Deletes only show up in a full reconcile, once the last is too old
+    snap = update.BoxSnapshot(path)
+    snap.set_meta("last_full_ms", 0)
+    snap.commit()
+    snap.close()
+    update.update_metrics(sync, schema, path=metrics_path)
+    sync = update.sync_boxes(path=path)
+    assert sync.changed == [] and sync.removed == ["sb0000011"]
+    check_against_full_fetch(sync, schema, metrics_path, now)
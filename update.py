@@ -4,21 +4,128 @@ Amplify 2026 Dashboard Updater
 --------------------------------
 Pulls live data from Streak and regenerates data.js for the dashboard.
 
-Usage:  python3 update.py
+Usage:  python3 update.py [--no-git] [--full] [--verify] [--profile]
+        python3 update.py --serve [--port 8787] [--no-git] [--pipeline ID]
+        python3 update.py --history transitions|movement|revenue|aging|dwell
+                          [--since YYYY-MM-DD] [--until YYYY-MM-DD] [--pipeline ID]
 Needs:  pip3 install requests
+
+Boxes are cached in .cache/boxes.sqlite between runs; only boxes changed
+since the last sync are downloaded, with a full reconcile every few days
+(or on --full) to pick up deleted boxes. Metrics are updated from the
+changed boxes alone (.cache/metrics.json); --verify also recomputes them
+from scratch and checks the two agree.
+
+Each run writes a JSON report (.cache/run-report.json, appended to
+.cache/run-history.jsonl) with phase timings, per-endpoint HTTP stats and
+artifact sizes; --profile adds cProfile stats for compute_metrics.
+
+Each run also records how every box's stage, value, invoice status,
+package and country changed in .cache/history.sqlite, which --history
+queries offline (stage moves, revenue over time, invoice aging, dwell).
+
+--serve runs as a daemon that takes Streak box webhooks on /webhook and
+applies each burst of changes within seconds.
+
+With pipelines.json, every pipeline listed there (one per program year)
+is processed in its own worker process, in parallel, and data-rollup.json
+sums them across years.
 """
 
-import os, re, json, subprocess, sys, requests
+import os, re, io, codecs, json, hashlib, hmac, random, shutil, sqlite3, subprocess, sys, tempfile, threading, time, zlib, requests
+import cProfile, pstats
+from bisect import bisect_left, insort
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from graphlib import TopologicalSorter, CycleError
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+try:
+    import brotli          # optional: adds .br siblings next to the .gz ones
+except ImportError:
+    brotli = None
+
+try:
+    from PIL import Image  # optional: resized / thumbnail variants of partner assets
+except ImportError:
+    Image = None
 
 # ── Config ─────────────────────────────────────────────────────────
 API_KEY      = os.environ.get("STREAK_API_KEY", "strk_2lafc8Wr8YLM7VE64qJUkmGL4USh")
 PIPELINE_KEY = "agxzfm1haWxmb29nYWVyNQsSDE9yZ2FuaXphdGlvbiIOZm9yYXRyYXZlbC5jb20MCxIIV29ya2Zsb3cYgIDFtcWIugoM"
-BASE_URL     = "https://api.streak.com/api/v1"
+BASE_URL     = os.environ.get("STREAK_BASE_URL", "https://api.streak.com/api/v1")
 AUTH         = (API_KEY, "")
 
+SCRIPT_DIR    = os.path.dirname(os.path.abspath(__file__))
+
+# pipelines.json lists every pipeline (one per program year) a run
+# processes. Each one is handled by a worker process of this script with
+# AMPLIFY_PIPELINE set to its id; the settings below are that pipeline's.
+# Without pipelines.json the constants in this file are used as they are.
+PIPELINES_PATH = os.environ.get("AMPLIFY_PIPELINES", os.path.join(SCRIPT_DIR, "pipelines.json"))
+PIPELINE_ID    = os.environ.get("AMPLIFY_PIPELINE", "")
+
+def load_pipelines(path=PIPELINES_PATH):
+    """The pipeline configs from pipelines.json ([] when there is none)."""
+    try:
+        with open(path) as f:
+            pipelines = json.load(f)
+    except FileNotFoundError:
+        return []
+    for p in pipelines:
+        if not re.fullmatch(r"[0-9A-Za-z_-]+", str(p.get("id", ""))) or not p.get("key"):
+            raise SystemExit(f"{os.path.basename(path)}: each pipeline needs an id ([0-9A-Za-z_-]) and a key")
+    return pipelines
+
+def pipeline_dirs(config):
+    """(state dir, output dir) of a pipeline config, absolute. Defaults to
+    .cache/<id> and years/<id>."""
+    return (os.path.join(SCRIPT_DIR, config.get("stateDir", os.path.join(".cache", config["id"]))),
+            os.path.normpath(os.path.join(SCRIPT_DIR, config.get("outDir", os.path.join("years", config["id"])))))
+
+def run_report_path(config=None):
+    """The latest run's report: a pipeline worker's goes in its state dir."""
+    if not config:
+        return os.path.join(SCRIPT_DIR, ".cache", "run-report.json")
+    return os.path.join(pipeline_dirs(config)[0], f"run-report-{config['id']}.json")
+
+PIPELINES = load_pipelines()
+PIPELINE  = next((p for p in PIPELINES if p["id"] == PIPELINE_ID), None) if PIPELINE_ID else {}
+if PIPELINE is None:
+    raise SystemExit(f"Unknown pipeline {PIPELINE_ID!r} (not in {os.path.basename(PIPELINES_PATH)})")
+PIPELINE_KEY = PIPELINE.get("key", PIPELINE_KEY)
+
+# STATE_DIR is persisted between runs (see update.yml); OUTPUT_DIR gets the published files
+STATE_DIR, OUTPUT_DIR = pipeline_dirs(PIPELINE) if PIPELINE else (os.path.join(SCRIPT_DIR, ".cache"), SCRIPT_DIR)
+SNAPSHOT_PATH = os.path.join(STATE_DIR, "boxes.sqlite")
+SCHEMA_PATH   = os.path.join(STATE_DIR, "pipeline.json")
+SCHEMA_TTL    = 6 * 3600     # seconds before the cached pipeline is revalidated
+METRICS_STATE_PATH = os.path.join(STATE_DIR, "metrics.json")
+RUN_REPORT_PATH    = run_report_path(PIPELINE)                     # latest run
+RUN_HISTORY_PATH   = os.path.join(SCRIPT_DIR, ".cache", "run-history.jsonl")  # one report per line
+RUN_HISTORY_KEEP   = 500
+PROFILE_PATH       = os.path.join(STATE_DIR, "compute.prof")
+BOX_HISTORY_PATH   = os.path.join(STATE_DIR, "history.sqlite")   # box state over time
+PAGE_SIZE     = 500
+FULL_RECONCILE_DAYS = 7      # full re-download to catch deleted boxes
+SYNC_OVERLAP_MS     = 60_000 # re-read boxes this close to the watermark (clock skew)
+
+HTTP_WORKERS   = 4      # concurrent Streak requests
+HTTP_RATE      = float(os.environ.get("STREAK_RATE", 8))  # sustained requests/second across all workers
+HTTP_BURST     = 8      # token bucket size
+HTTP_RETRIES   = 5      # attempts after the first for 429 / 5xx / network errors
+HTTP_BACKOFF   = 0.5    # base backoff seconds (doubles per attempt, jittered)
+HTTP_RETRY_AFTER_MAX = 60   # longest Retry-After honoured, in seconds
+HTTP_TIMEOUT   = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 # ── Stage keys ─────────────────────────────────────────────────────
+# Which keys count as signed / pipeline is fixed here; display names are
+# refreshed from the pipeline schema when it can be fetched.
 SIGNED_STAGES = {
     "5014": "Tier 1",
     "5015": "Tier 2",
@@ -31,6 +138,13 @@ PIPELINE_STAGES = {
     "5004": "In Discussion",
     "5001": "Final Follow Up",
 }
+FUNNEL_ORDER = ("5014", "5016", "5015", "5017", "5007", "5011", "5004", "5001")  # others follow in map order
+STAGE_ROLES  = {           # stages the summary reports on by name
+    "needsInvoice":      "5011",
+    "inDiscussion":      "5004",
+    "finalFollowUp":     "5001",
+    "marketingComplete": "5007",
+}
 ALL_STAGE_NAMES = {
     **SIGNED_STAGES,
     **PIPELINE_STAGES,
@@ -78,6 +192,7 @@ FEATURE_FIELDS = {
 }
 
 # ── Dropdown/tag lookups ────────────────────────────────────────────
+# Fallbacks only — the live labels come from the pipeline schema below.
 INVOICE_LABELS = {
     "9001": "Outstanding",
     "9002": "Paid",
@@ -93,68 +208,519 @@ COLLECTION_NA = "9025"  # "N/A" tag key for Collection field
 
 PORTAL_BASE_URL = "https://amplify-2026-dashboard.vercel.app/partner.html?key="
 
-# ── Fetch dropdown labels for feature fields ────────────────────
-def fetch_field_labels():
-    """Return {field_key: {option_key: label}} for all feature fields."""
-    r = requests.get(f"{BASE_URL}/pipelines/{PIPELINE_KEY}", auth=AUTH)
-    if r.status_code != 200:
-        print(f"  Warning: could not fetch pipeline metadata ({r.status_code})")
-        return {}
-    data = r.json()
-    labels = {}
-    feature_keys = set(FEATURE_FIELDS.values())
-    for field in data.get("fields", []):
-        fkey  = str(field.get("key", ""))
-        ftype = field.get("type", "")
-        if fkey not in feature_keys:
-            continue
-        if ftype == "TAG":
-            # Tags store options as tagSettings.tags[].tag
-            tags = (field.get("tagSettings") or {}).get("tags", [])
-            if tags:
-                labels[fkey] = {str(t.get("key", "")): t.get("tag", "") for t in tags}
-        elif ftype == "DROPDOWN":
-            # Dropdowns store options as dropdownSettings.items[].name
-            items = (field.get("dropdownSettings") or {}).get("items", [])
-            if items:
-                labels[fkey] = {str(i.get("key", "")): i.get("name", "") for i in items}
-        # DATE type (Webinar) has no discrete options — handled at read time
-    print(f"  Loaded label mappings for {len(labels)} feature field(s)")
-    return labels
+# ── Per-pipeline overrides ─────────────────────────────────────────
+# A pipelines.json entry can replace any of the maps above. Pipelines
+# cloned from the 2026 one share its stage and field keys, so they only
+# need the ones that were renamed or added.
+SIGNED_STAGES   = PIPELINE.get("signedStages", SIGNED_STAGES)
+PIPELINE_STAGES = PIPELINE.get("pipelineStages", PIPELINE_STAGES)
+ALL_STAGE_NAMES = {**ALL_STAGE_NAMES, **PIPELINE.get("stageNames", {}), **SIGNED_STAGES, **PIPELINE_STAGES}
+FUNNEL_ORDER    = tuple(PIPELINE.get("funnelOrder", FUNNEL_ORDER))
+STAGE_ROLES     = {**STAGE_ROLES, **PIPELINE.get("stageRoles", {})}
+EXCLUDED_STAGES = frozenset(PIPELINE.get("excludedStages", ("5002", "5018")))  # left out of the partner table
+LEAD_STAGES     = PIPELINE.get("leadStages", {})  # stage key → id of the pipeline its boxes are leads for
+
+_fields = PIPELINE.get("fields", {})
+F_PRICE        = _fields.get("price",       F_PRICE)
+F_INVOICE      = _fields.get("invoice",     F_INVOICE)
+F_INVOICE_URL  = _fields.get("invoiceUrl",  F_INVOICE_URL)
+F_COUNTRY      = _fields.get("country",     F_COUNTRY)
+F_BRAND        = _fields.get("brand",       F_BRAND)
+F_GROUP        = _fields.get("group",       F_GROUP)
+F_QUARTER      = _fields.get("quarter",     F_QUARTER)
+F_EMAIL        = _fields.get("email",       F_EMAIL)
+F_INVOICE_DATE = _fields.get("invoiceDate", F_INVOICE_DATE)
+F_PACKAGE      = _fields.get("package",     F_PACKAGE)
+
+PACKAGE_LABELS  = PIPELINE.get("packageLabels", PACKAGE_LABELS)
+FEATURE_FIELDS  = PIPELINE.get("featureFields", FEATURE_FIELDS)
+INVOICE_LABELS  = PIPELINE.get("invoiceLabels", INVOICE_LABELS)
+QUARTER_LABELS  = PIPELINE.get("quarterLabels", QUARTER_LABELS)
+COLLECTION_NA   = PIPELINE.get("collectionNA", COLLECTION_NA)
+if OUTPUT_DIR != SCRIPT_DIR:   # partner.html reads this pipeline's shards from its output dir
+    PORTAL_BASE_URL = PORTAL_BASE_URL.replace("?key=", f"?data={os.path.relpath(OUTPUT_DIR, SCRIPT_DIR)}&key=")
+PORTAL_BASE_URL = PIPELINE.get("portalBaseUrl", PORTAL_BASE_URL)
+
+# ── Streak HTTP client ─────────────────────────────────────────────
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, at most `burst` banked."""
+
+    def __init__(self, rate, burst):
+        self.rate, self.burst = rate, burst
+        self.tokens  = float(burst)
+        self.updated = time.monotonic()
+        self.lock    = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens  = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def retry_after_seconds(resp):
+    """Parse a Retry-After header (delta-seconds or HTTP date); None if absent."""
+    val = resp.headers.get("Retry-After") if resp is not None else None
+    if not val:
+        return None
+    try:
+        return max(0.0, float(val))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(val).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class HttpStats:
+    """Per-endpoint request counters for the run report.
+
+    Endpoints are paths with their keys masked (/pipelines/*/boxes), so
+    every page or box write lands in the same bucket.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+
+    @staticmethod
+    def endpoint(method, path):
+        return method + " " + re.sub(r"(/(?:pipelines|boxes|fields))/[^/?]+", r"\1/*", path)
+
+    def record(self, method, path, seconds, resp=None, sent=0, retry=False):
+        with self.lock:
+            e = self.endpoints.setdefault(self.endpoint(method, path), {
+                "calls": 0, "retries": 0, "errors": 0, "bytesSent": 0, "bytesReceived": 0,
+                "status": {}, "latencies": []})
+            e["calls"]     += 1
+            e["retries"]   += retry
+            e["bytesSent"] += sent
+            e["latencies"].append(seconds)
+            if resp is None:
+                e["errors"] += 1
+            else:
+                e["status"][str(resp.status_code)] = e["status"].get(str(resp.status_code), 0) + 1
+                e["bytesReceived"] += len(resp.content)
+
+    def report(self):
+        """{endpoint: counts + latency percentiles (ms)}."""
+        out = {}
+        with self.lock:
+            for name, e in sorted(self.endpoints.items()):
+                lat = sorted(e["latencies"])
+                pct = lambda q: round(lat[min(len(lat) - 1, int(q * len(lat)))] * 1000, 1)
+                out[name] = {**{k: v for k, v in e.items() if k != "latencies"},
+                             "latencyMs": {"p50": pct(0.5), "p90": pct(0.9), "p99": pct(0.99),
+                                           "max": pct(1.0)}}
+        return out
+
+class StreakClient:
+    """Keep-alive session shared by every Streak call, with rate limiting,
+    retries (jittered exponential backoff, honouring Retry-After) and a small
+    worker pool for concurrent requests."""
+
+    def __init__(self, base_url=BASE_URL, auth=AUTH, workers=HTTP_WORKERS,
+                 rate=HTTP_RATE, burst=HTTP_BURST, retries=HTTP_RETRIES):
+        self.base_url = base_url
+        self.workers  = workers
+        self.retries  = retries
+        self.bucket   = TokenBucket(rate, burst)
+        self.stats    = HttpStats()
+        self.session  = requests.Session()
+        self.session.auth = auth
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._pool = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def request(self, method, path, **kw):
+        """Send a request, retrying throttled / failed attempts.
+
+        Returns the final Response (which may still be an error status once
+        retries run out); network errors are re-raised after the last attempt.
+        """
+        kw.setdefault("timeout", HTTP_TIMEOUT)
+        sent = len(json.dumps(kw["json"])) if "json" in kw else 0
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            resp, start = None, time.perf_counter()
+            try:
+                resp = self.session.request(method, self.base_url + path, **kw)
+                self.stats.record(method, path, time.perf_counter() - start, resp, sent, attempt > 0)
+                if resp.status_code not in RETRY_STATUSES:
+                    return resp
+            except (requests.ConnectionError, requests.Timeout):
+                self.stats.record(method, path, time.perf_counter() - start, None, sent, attempt > 0)
+                if attempt == self.retries:
+                    raise
+            if attempt == self.retries:
+                return resp
+            delay = retry_after_seconds(resp)
+            if delay is None:
+                delay = HTTP_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+            time.sleep(min(delay, HTTP_RETRY_AFTER_MAX))
+
+    def get(self, path, **kw):
+        return self.request("GET", path, **kw)
+
+    def post(self, path, **kw):
+        return self.request("POST", path, **kw)
+
+    def map(self, fn, items):
+        """Run fn over items on the worker pool, yielding results in order."""
+        return self.pool.map(fn, items)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self.session.close()
+
+streak = StreakClient()
+
+# ── Pipeline schema ────────────────────────────────────────────────
+def option_labels(field):
+    """Return {option_key: label} for a TAG or DROPDOWN field definition."""
+    ftype = field.get("type", "")
+    if ftype == "TAG":
+        # Tags store options as tagSettings.tags[].tag
+        tags = (field.get("tagSettings") or {}).get("tags", [])
+        return {str(t.get("key", "")): t.get("tag", "") for t in tags}
+    if ftype == "DROPDOWN":
+        # Dropdowns store options as dropdownSettings.items[].name
+        items = (field.get("dropdownSettings") or {}).get("items", [])
+        return {str(i.get("key", "")): i.get("name", "") for i in items}
+    # DATE type (Webinar) has no discrete options — handled at read time
+    return {}
+
+def funnel_order(stages):
+    """The keys of `stages` in FUNNEL_ORDER, then any others in map order."""
+    return [k for k in FUNNEL_ORDER if k in stages] + [k for k in stages if k not in FUNNEL_ORDER]
+
+class PipelineSchema:
+    """Decoded /pipelines/{key} document.
+
+    Builds every key→label map the updater needs once, falling back to the
+    hardcoded maps above for anything the document does not define.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc or {}
+        stages = {str(k): (v or {}).get("name") for k, v in (self.doc.get("stages") or {}).items()}
+        self.stage_names = {**ALL_STAGE_NAMES, **{k: v for k, v in stages.items() if v}}
+        self.signed_stages   = {k: self.stage_names[k] for k in SIGNED_STAGES}
+        self.pipeline_stages = {k: self.stage_names[k] for k in PIPELINE_STAGES}
+
+        self.fields  = {str(f.get("key", "")): f for f in self.doc.get("fields", [])}
+        self.options = {k: option_labels(f) for k, f in self.fields.items()}
+        self.package_labels = self.options.get(F_PACKAGE) or PACKAGE_LABELS
+        self.invoice_labels = self.options.get(F_INVOICE) or INVOICE_LABELS
+        self.quarter_labels = self.options.get(F_QUARTER) or QUARTER_LABELS
+        self.feature_labels = {k: self.options[k] for k in FEATURE_FIELDS.values() if self.options.get(k)}
+
+    def field_key(self, name):
+        """Return the key of the field called `name`, or None."""
+        for key, field in self.fields.items():
+            if field.get("name") == name:
+                return key
+        return None
+
+def load_pipeline_schema(path=SCHEMA_PATH, ttl=SCHEMA_TTL):
+    """Return the pipeline schema, cached on disk for `ttl` seconds.
+
+    Once the TTL lapses the document is revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged pipeline costs a bodyless 304. A stale
+    cache is used if Streak cannot be reached; with neither, the hardcoded
+    maps apply.
+    """
+    cached = None
+    if os.path.exists(path):
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+    if cached and time.time() - cached.get("fetchedAt", 0) < ttl:
+        return PipelineSchema(cached["doc"])
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("lastModified"):
+        headers["If-Modified-Since"] = cached["lastModified"]
+    try:
+        r = streak.get(f"/pipelines/{PIPELINE_KEY}", headers=headers)
+    except requests.RequestException as e:
+        r = None
+        print(f"  Warning: could not fetch pipeline metadata ({e})")
+
+    if r is not None and r.status_code == 304 and cached:
+        cached["fetchedAt"] = time.time()
+    elif r is not None and r.status_code == 200:
+        cached = {
+            "fetchedAt":    time.time(),
+            "etag":         r.headers.get("ETag"),
+            "lastModified": r.headers.get("Last-Modified"),
+            "doc":          r.json(),
+        }
+    else:
+        if r is not None:
+            print(f"  Warning: could not fetch pipeline metadata ({r.status_code})")
+        return PipelineSchema(cached["doc"] if cached else {})
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(cached, f)
+    schema = PipelineSchema(cached["doc"])
+    print(f"  Loaded label mappings for {len(schema.feature_labels)} feature field(s)")
+    return schema
+
+_schema = None
+
+def pipeline_schema():
+    """Per-run memoised load_pipeline_schema()."""
+    global _schema
+    if _schema is None:
+        _schema = load_pipeline_schema()
+    return _schema
 
 # ── Helpers ────────────────────────────────────────────────────────
-def fetch_all_boxes():
-    boxes, page = [], 0
+def fetch_box_page(page, **params):
+    r = streak.get(f"/pipelines/{PIPELINE_KEY}/boxes",
+                   params={"limit": PAGE_SIZE, "page": page, **params})
+    r.raise_for_status()
+    return r.json()
+
+def iter_box_pages(expected=0):
+    """Yield every page of boxes in order. The pages `expected` boxes (the
+    count at the last sync) fill are fetched HTTP_WORKERS at a time; past
+    them the window starts at one page and doubles while pages come back
+    full, so few requests are spent on pages that turn out to be empty."""
+    page, total, grow = 0, 0, 1
+    known = -(-expected // PAGE_SIZE)
     print("Fetching boxes from Streak", end="", flush=True)
+    done = False
+    while not done:
+        size = max(min(streak.workers, known - page), grow)
+        if page >= known:
+            grow = min(grow * 2, streak.workers)
+        for batch in streak.map(fetch_box_page, range(page, page + size)):
+            if batch:
+                total += len(batch)
+                print(".", end="", flush=True)
+                yield batch
+            if len(batch) < PAGE_SIZE:
+                done = True
+                break
+        page += size
+    print(f" {total} boxes total")
+
+def fetch_all_boxes():
+    """Download every box into one list."""
+    return [box for batch in iter_box_pages() for box in batch]
+
+def iter_changed_pages(since):
+    """Yield pages of boxes updated at or after `since` (Unix ms), newest first.
+
+    Pages are requested sorted by lastUpdatedTimestamp, so paging stops at
+    the first page that reaches back past the watermark.
+    """
+    page, total = 0, 0
+    print("Fetching changed boxes from Streak", end="", flush=True)
     while True:
-        r = requests.get(f"{BASE_URL}/pipelines/{PIPELINE_KEY}/boxes",
-                         auth=AUTH, params={"limit": 500, "page": page})
-        r.raise_for_status()
-        batch = r.json()
+        batch = fetch_box_page(page, sortBy="lastUpdatedTimestamp")
         if not batch:
             break
-        boxes.extend(batch)
+        fresh = [b for b in batch if (b.get("lastUpdatedTimestamp") or 0) >= since]
+        total += len(fresh)
         print(".", end="", flush=True)
-        if len(batch) < 500:
+        if fresh:
+            yield fresh
+        if len(fresh) < len(batch) or len(batch) < PAGE_SIZE:
             break
         page += 1
-    print(f" {len(boxes)} boxes total")
-    return boxes
+    print(f" {total} changed")
 
-def price(box):
-    val = box.get("fields", {}).get(F_PRICE)
-    if val is None:
-        return 0
+def fetch_changed_boxes(since):
+    return [box for batch in iter_changed_pages(since) for box in batch]
+
+# ── Local box snapshot ─────────────────────────────────────────────
+class BoxSnapshot:
+    """SQLite store of the last known state of every box, keyed by box key."""
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS boxes (
+                key         TEXT PRIMARY KEY,
+                updated_ms  INTEGER NOT NULL,
+                body        TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                name  TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+
+    def get_meta(self, name, default=None):
+        row = self.db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, name, value):
+        self.db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, str(value)))
+
+    def watermark(self):
+        row = self.db.execute("SELECT MAX(updated_ms) FROM boxes").fetchone()
+        return row[0] or 0
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM boxes").fetchone()[0]
+
+    def upsert(self, boxes):
+        """Store one batch of boxes, returning the keys whose content changed."""
+        rows = {b["key"]: (b, json.dumps(b, sort_keys=True, separators=(",", ":"))) for b in boxes}
+        old  = {}
+        keys = list(rows)
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            old.update(self.db.execute(
+                f"SELECT key, body FROM boxes WHERE key IN ({','.join('?' * len(chunk))})", chunk))
+        changed = [(b, body) for key, (b, body) in rows.items() if old.get(key) != body]
+        self.db.executemany(
+            "INSERT OR REPLACE INTO boxes (key, updated_ms, body) VALUES (?, ?, ?)",
+            [(b["key"], b.get("lastUpdatedTimestamp") or 0, body) for b, body in changed])
+        return [b["key"] for b, _ in changed]
+
+    def replace_all(self, pages):
+        """Replace the snapshot with the boxes in `pages` (an iterable of
+        batches, stored as they arrive). Returns (changed keys, removed keys)."""
+        seen, changed = set(), []
+        for batch in pages:
+            seen.update(b["key"] for b in batch)
+            changed += self.upsert(batch)
+        removed = [k for (k,) in self.db.execute("SELECT key FROM boxes") if k not in seen]
+        self.db.executemany("DELETE FROM boxes WHERE key = ?", [(k,) for k in removed])
+        return changed, removed
+
+    def delete(self, keys):
+        """Drop `keys` from the snapshot, returning those that were there."""
+        gone = [k for k in keys if self.db.execute("SELECT 1 FROM boxes WHERE key = ?", (k,)).fetchone()]
+        self.db.executemany("DELETE FROM boxes WHERE key = ?", [(k,) for k in gone])
+        return gone
+
+    def advance(self, now_ms):
+        """Bump and return the snapshot generation (once per sync)."""
+        generation = int(self.get_meta("generation", 0)) + 1
+        self.set_meta("generation", generation)
+        self.set_meta("last_sync_ms", now_ms)
+        return generation
+
+    def commit(self):
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+class SnapshotBoxes:
+    """Re-iterable, lazily decoded view of the boxes in a snapshot file.
+
+    Each iteration opens its own connection (so it can be used from any
+    thread) and holds one row at a time.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        self.path = path
+
+    def __iter__(self):
+        db = sqlite3.connect(self.path)
+        try:
+            for (body,) in db.execute("SELECT body FROM boxes ORDER BY key"):
+                yield json.loads(body)
+        finally:
+            db.close()
+
+    def __len__(self):
+        db = sqlite3.connect(self.path)
+        try:
+            return db.execute("SELECT COUNT(*) FROM boxes").fetchone()[0]
+        finally:
+            db.close()
+
+    def get_many(self, keys):
+        """Yield the stored boxes for `keys` (missing keys are skipped)."""
+        keys = list(keys)
+        db = sqlite3.connect(self.path)
+        try:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                for (body,) in db.execute(
+                        f"SELECT body FROM boxes WHERE key IN ({','.join('?' * len(chunk))})", chunk):
+                    yield json.loads(body)
+        finally:
+            db.close()
+
+SyncResult = namedtuple("SyncResult", "boxes changed removed generation")
+
+def sync_boxes(full=False, path=SNAPSHOT_PATH):
+    """Bring the local snapshot up to date with Streak.
+
+    Runs a full download when forced, when the snapshot is empty, or when the
+    last full reconcile is older than FULL_RECONCILE_DAYS; otherwise pulls only
+    boxes changed since the newest timestamp already stored. Pages are written
+    to the snapshot as they arrive, so only one page is held in memory.
+
+    Returns a SyncResult with every box (a lazy SnapshotBoxes view), the keys
+    whose content changed, the keys of deleted boxes, and the snapshot
+    generation (bumped on every sync) so derived state can tell whether it is
+    exactly one sync behind.
+    """
+    snap = BoxSnapshot(path)
     try:
-        return float(str(val).replace(",", "").replace("$", "").strip())
-    except:
-        return 0
+        now_ms    = int(time.time() * 1000)
+        last_full = int(snap.get_meta("last_full_ms", 0))
+        stale     = now_ms - last_full > FULL_RECONCILE_DAYS * 86_400_000
+        if full or stale or not snap.watermark():
+            changed, removed = snap.replace_all(iter_box_pages(snap.count()))
+            snap.set_meta("last_full_ms", now_ms)
+        else:
+            changed, removed = [], []
+            for batch in iter_changed_pages(snap.watermark() - SYNC_OVERLAP_MS):
+                changed += snap.upsert(batch)
+        generation = snap.advance(now_ms)
+        snap.commit()
+        print(f"  Snapshot: {len(changed)} changed, {len(removed)} removed")
+        return SyncResult(SnapshotBoxes(path), changed, removed, generation)
+    finally:
+        snap.close()
 
 def field_val(box, key):
     return box.get("fields", {}).get(key)
 
-def is_set(box, key, exclude_keys=None):
-    val = field_val(box, key)
+def parse_price(val):
+    """Price field → float; blank or unparseable values count as 0."""
+    if val is None:
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+    try:
+        return float(str(val).replace(",", "").replace("$", "").strip())
+    except ValueError:
+        return 0.0
+
+def is_set_value(val, exclude_keys=None):
     if val is None:
         return False
     if isinstance(val, list):
@@ -166,89 +732,116 @@ def is_set(box, key, exclude_keys=None):
         return True
     return str(val).strip() != ""
 
-def top_n(counter, n=10):
-    return sorted(counter.items(), key=lambda x: -x[1])[:n]
+def feature_timing(val, labels, excl):
+    if labels:
+        # TAG or DROPDOWN field — decode numeric key(s) to human label
+        if isinstance(val, list):
+            items = [str(v) for v in val if str(v) not in excl]
+            return ", ".join(labels.get(v, v) for v in items)
+        raw = str(val).strip() if val else ""
+        return labels.get(raw, raw)
+    if isinstance(val, (int, float)) and val > 1_000_000_000_000:
+        # DATE field (Unix ms timestamp, e.g. Webinar) — format as "Month YYYY"
+        try:
+            return datetime.fromtimestamp(val / 1000).strftime("%B %Y")
+        except Exception:
+            return str(val)
+    # Plain text or unknown
+    if isinstance(val, list):
+        return ", ".join(str(v) for v in val if str(v) not in excl)
+    return str(val).strip() if val else ""
 
-def get_quarters(box):
-    qval = field_val(box, F_QUARTER)
-    if not qval:
-        return []
-    keys = qval if isinstance(qval, list) else [qval]
-    return [QUARTER_LABELS.get(str(k), str(k)) for k in keys]
-
-def get_features(box, field_labels=None):
-    field_labels = field_labels or {}
-    result = []
-    for fname, fkey in FEATURE_FIELDS.items():
-        excl = {COLLECTION_NA} if fkey == "1067" else None
-        if is_set(box, fkey, excl):
-            val    = field_val(box, fkey)
-            labels = field_labels.get(fkey, {})
-
-            if labels:
-                # TAG or DROPDOWN field — decode numeric key(s) to human label
-                if isinstance(val, list):
-                    items  = [str(v) for v in val if str(v) not in (excl or set())]
-                    timing = ", ".join(labels.get(v, v) for v in items)
-                else:
-                    raw    = str(val).strip() if val else ""
-                    timing = labels.get(raw, raw)
-            elif isinstance(val, (int, float)) and val > 1_000_000_000_000:
-                # DATE field (Unix ms timestamp, e.g. Webinar) — format as "Month YYYY"
-                try:
-                    timing = datetime.fromtimestamp(val / 1000).strftime("%B %Y")
-                except Exception:
-                    timing = str(val)
-            else:
-                # Plain text or unknown
-                if isinstance(val, list):
-                    items  = [str(v) for v in val if str(v) not in (excl or set())]
-                    timing = ", ".join(items)
-                else:
-                    timing = str(val).strip() if val else ""
+# ── Box records ────────────────────────────────────────────────────
+FEATURE_NAMES = tuple(FEATURE_FIELDS)
+FEATURE_EXCL  = {fkey: ({COLLECTION_NA} if fkey == FEATURE_FIELDS["Collection"] else set())
+                 for fkey in FEATURE_FIELDS.values()}
 
-            result.append({"name": fname, "timing": timing})
-    return result
+class BoxRecord:
+    """Compact, decoded view of one Streak box.
 
-# ── Main ───────────────────────────────────────────────────────────
-def compute_metrics(boxes):
-    field_labels = fetch_field_labels()
-    signed_val   = defaultdict(float)
-    signed_cnt   = defaultdict(int)
-    pipeline_val = defaultdict(float)
-    pipeline_cnt = defaultdict(int)
-    other_cnt    = defaultdict(int)
-
-    paid = outstanding = waiting = in_kind = 0
-
-    features  = defaultdict(int)
-    quarters  = defaultdict(int)
-    countries = defaultdict(int)
-    brands    = defaultdict(int)
-    groups    = defaultdict(int)
-    signed_by_month = defaultdict(lambda: {"count": 0, "value": 0})
-    new_this_week   = []
-    week_ago        = datetime.now() - timedelta(days=7)
-
-    partners = []
+    `qmask` / `fmask` are bitmasks over BoxDecoder.quarter_names and
+    FEATURE_NAMES; `timings` holds one label per set feature bit, in order.
+    Strings are interned so repeated countries, labels etc. share storage.
+    """
+    __slots__ = ("key", "name", "stage", "stage_rank", "price", "invoice", "invoice_url",
+                 "package", "qmask", "fmask", "timings", "sign_ts", "month",
+                 "country", "brand", "group", "email")
 
-    for box in boxes:
-        stage = str(box.get("stageKey", ""))
-        p     = price(box)
-        inv   = str(field_val(box, F_INVOICE) or "")
-
-        if stage in SIGNED_STAGES:
-            label = SIGNED_STAGES[stage]
-            signed_val[label] += p
-            signed_cnt[label] += 1
-            # Determine signed date: Invoice Date field from Streak (most accurate),
-            # falling back to lastStageChangeDate / creationTimestamp.
-            sign_dt = None
-            inv_date_val = field_val(box, F_INVOICE_DATE)
-            if inv_date_val:
+class BoxDecoder:
+    """Decodes raw boxes into BoxRecords in a single pass per box."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.rank   = {**{k: 0 for k in schema.signed_stages}, **{k: 1 for k in schema.pipeline_stages}}
+        # Quarter bits follow the pipeline's option order; unknown keys get
+        # bits on first sight so nothing is dropped.
+        self.quarter_names = list(dict.fromkeys(schema.quarter_labels.values()))
+        self.quarter_bits  = {q: 1 << i for i, q in enumerate(self.quarter_names)}
+        self.known_quarters = {q: i for i, q in enumerate(self.quarter_names)}
+        self._mask_cache   = {}
+
+    def quarter_mask(self, qval):
+        if not qval:
+            return 0
+        mask = 0
+        for k in (qval if isinstance(qval, list) else [qval]):
+            label = self.schema.quarter_labels.get(str(k), str(k))
+            bit = self.quarter_bits.get(label)
+            if bit is None:
+                bit = self.quarter_bits[label] = 1 << len(self.quarter_names)
+                self.quarter_names.append(label)
+            mask |= bit
+        return mask
+
+    def quarter_rank(self, name):
+        """Sort key: pipeline option order first, then unknown labels by name."""
+        return (0, self.known_quarters[name], "") if name in self.known_quarters else (1, 0, name)
+
+    def quarters(self, mask):
+        """Bitmask → list of quarter labels (shared list per mask; do not mutate)."""
+        names = self._mask_cache.get(mask)
+        if names is None:
+            names = [q for i, q in enumerate(self.quarter_names) if mask >> i & 1]
+            names = self._mask_cache[mask] = sorted(names, key=self.quarter_rank)
+        return names
+
+    def decode(self, box):
+        fields = box.get("fields") or {}
+        rec = BoxRecord()
+        rec.key   = box.get("key", "")
+        rec.name  = box.get("name", "")
+        rec.stage = sys.intern(str(box.get("stageKey", "")))
+        rec.stage_rank = self.rank.get(rec.stage, 2)
+        rec.price   = parse_price(fields.get(F_PRICE))
+        rec.invoice = sys.intern(str(fields.get(F_INVOICE) or ""))
+        inv_url = fields.get(F_INVOICE_URL)
+        rec.invoice_url = str(inv_url).strip() if inv_url and str(inv_url).startswith("http") else ""
+        rec.package = self.schema.package_labels.get(str(fields.get(F_PACKAGE) or ""), "")
+        rec.qmask   = self.quarter_mask(fields.get(F_QUARTER))
+
+        fmask, timings = 0, []
+        for i, fkey in enumerate(FEATURE_FIELDS.values()):
+            val = fields.get(fkey)
+            if is_set_value(val, FEATURE_EXCL[fkey]):
+                fmask |= 1 << i
+                timings.append(sys.intern(feature_timing(val, self.schema.feature_labels.get(fkey), FEATURE_EXCL[fkey])))
+        rec.fmask, rec.timings = fmask, tuple(timings)
+
+        rec.country = sys.intern(str(fields.get(F_COUNTRY) or "").strip())
+        rec.brand   = sys.intern(str(fields.get(F_BRAND) or "").strip())
+        rec.group   = sys.intern(str(fields.get(F_GROUP) or "").strip())
+        rec.email   = str(fields.get(F_EMAIL) or "").strip()
+
+        # Signed date: Invoice Date field from Streak (most accurate), falling
+        # back to lastStageChangeDate / creationTimestamp. Signed boxes only.
+        rec.sign_ts = rec.month = None
+        if rec.stage_rank == 0:
+            sign_dt  = None
+            inv_date = fields.get(F_INVOICE_DATE)
+            if inv_date:
                 try:
                     # Streak DATE fields are Unix ms timestamps
-                    sign_dt = datetime.fromtimestamp(int(inv_date_val) / 1000)
+                    sign_dt = datetime.fromtimestamp(int(inv_date) / 1000)
                 except Exception:
                     pass
             if not sign_dt:
@@ -259,188 +852,1711 @@ def compute_metrics(boxes):
                     except Exception:
                         pass
             if sign_dt:
-                mk = sign_dt.strftime("%Y-%m")
-                signed_by_month[mk]["count"] += 1
-                signed_by_month[mk]["value"] += int(p)
-                if sign_dt >= week_ago:
-                    new_this_week.append({
-                        "name":  box.get("name", ""),
-                        "stage": SIGNED_STAGES[stage],
-                        "price": int(p),
-                    })
-        elif stage in PIPELINE_STAGES:
-            label = PIPELINE_STAGES[stage]
-            pipeline_val[label] += p
-            pipeline_cnt[label] += 1
+                rec.sign_ts = sign_dt.timestamp()
+                rec.month   = sys.intern(sign_dt.strftime("%Y-%m"))
+        return rec
+
+    def features(self, rec):
+        names = (n for i, n in enumerate(FEATURE_NAMES) if rec.fmask >> i & 1)
+        return [{"name": n, "timing": t} for n, t in zip(names, rec.timings)]
+
+    def partner(self, rec):
+        """Per-partner output record (data.js `partners` entry)."""
+        return {
+            "key":           rec.key,
+            "name":          rec.name,
+            "stage":         self.schema.stage_names.get(rec.stage, rec.stage),
+            "stageKey":      rec.stage,
+            "package":       rec.package,
+            "price":         int(rec.price),
+            "invoiceStatus": self.schema.invoice_labels.get(rec.invoice, ""),
+            "invoiceUrl":    rec.invoice_url,
+            "features":      self.features(rec),
+            "quarters":      list(self.quarters(rec.qmask)),
+            "country":       rec.country,
+            "brand":         rec.brand,
+            "group":         rec.group,
+            "email":         rec.email,
+            "streakUrl":     f"https://app.streak.com/pipelines/{PIPELINE_KEY}/boxes/{rec.key}",
+        }
+
+# ── Metrics ────────────────────────────────────────────────────────
+STATE_VERSION = 2
+
+class RankedCounter:
+    """Counter kept ordered by (-count, name) so top-N is a slice.
+
+    Ties break on name rather than insertion order, so the ranking is the
+    same however the counts were reached.
+    """
+
+    def __init__(self, counts=None):
+        self.counts = dict(counts or {})
+        self.order  = sorted((-n, k) for k, n in self.counts.items())
+
+    def add(self, name, delta=1):
+        old = self.counts.get(name, 0)
+        if old:
+            del self.order[bisect_left(self.order, (-old, name))]
+        new = old + delta
+        if new:
+            self.counts[name] = new
+            insort(self.order, (-new, name))
         else:
-            other_cnt[stage] += 1
+            del self.counts[name]
 
-        # Invoice status (all non-invited boxes)
-        if stage != "5002":
-            if   inv == "9002": paid        += p
-            elif inv == "9001": outstanding += p
-            elif inv == "9004": waiting     += p
-            elif inv == "9005": in_kind     += p
-
-        # Features + geography (signed only)
-        if stage in SIGNED_STAGES:
-            for fname, fkey in FEATURE_FIELDS.items():
-                excl = {COLLECTION_NA} if fkey == "1067" else None
-                if is_set(box, fkey, excl):
-                    features[fname] += 1
-
-            for q in get_quarters(box):
-                quarters[q] += 1
-            if not get_quarters(box):
-                quarters["TBD"] += 1
-
-            c = field_val(box, F_COUNTRY)
-            b = field_val(box, F_BRAND)
-            g = field_val(box, F_GROUP)
-            if c and str(c).strip(): countries[str(c).strip()] += 1
-            if b and str(b).strip(): brands[str(b).strip()]    += 1
-            if g and str(g).strip(): groups[str(g).strip()]    += 1
-
-        # Build per-partner record (skip Invited and 2027 Lead)
-        if stage not in ("5002", "5018"):
-            inv_url = field_val(box, F_INVOICE_URL)
-            partners.append({
-                "key":           box.get("key", ""),
-                "name":          box.get("name", ""),
-                "stage":         ALL_STAGE_NAMES.get(stage, stage),
-                "stageKey":      stage,
-                "package":       PACKAGE_LABELS.get(str(field_val(box, F_PACKAGE) or ""), ""),
-                "price":         int(p),
-                "invoiceStatus": INVOICE_LABELS.get(inv, ""),
-                "invoiceUrl":    str(inv_url).strip() if inv_url and str(inv_url).startswith("http") else "",
-                "features":      get_features(box, field_labels),
-                "quarters":      get_quarters(box),
-                "country":       str(field_val(box, F_COUNTRY) or "").strip(),
-                "brand":         str(field_val(box, F_BRAND) or "").strip(),
-                "group":         str(field_val(box, F_GROUP) or "").strip(),
-                "email":         str(field_val(box, F_EMAIL) or "").strip(),
-                "streakUrl":     f"https://app.streak.com/pipelines/{PIPELINE_KEY}/boxes/{box.get('key', '')}",
-            })
+    def top(self, n=10):
+        return [(k, -c) for c, k in self.order[:n]]
 
-    total_signed   = sum(signed_val.values())
-    total_pipeline = total_signed + sum(pipeline_val.values())
-    signed_count   = sum(signed_cnt.values())
-
-    # Build funnel
-    funnel = []
-    signed_order = [
-        ("5014", "Tier 1"),
-        ("5016", "Brand Spotlight"),
-        ("5015", "Tier 2"),
-        ("5017", "New Opening"),
-        ("5007", "Marketing Complete"),
-    ]
-    for sk, lbl in signed_order:
-        funnel.append({
-            "label": f"Signed — {lbl}",
-            "stageKey": sk,
-            "count": signed_cnt.get(lbl, 0),
-            "value": int(signed_val.get(lbl, 0)),
-        })
-
-    for sk, label in [("5011","Needs Invoice"),("5004","In Discussion"),("5001","Final Follow Up")]:
-        funnel.append({
-            "label":    label,
-            "stageKey": sk,
-            "count":    pipeline_cnt.get(label, 0),
-            "value":    int(pipeline_val.get(label, 0)),
-        })
-
-    for sk, label in [("5013","Needs Contact"),("5010","Needs Review"),("5008","Declined"),("5009","Do Not Invite")]:
-        cnt = other_cnt.get(sk, 0)
-        if cnt:
-            funnel.append({"label": label, "stageKey": sk, "count": cnt, "value": 0})
-
-    # Sort partners for output (signed first, then pipeline, then others, alphabetical within group)
-    stage_order_key = {**{k: 0 for k in SIGNED_STAGES}, **{k: 1 for k in PIPELINE_STAGES}}
-    partners.sort(key=lambda p: (stage_order_key.get(p["stageKey"], 2), p["name"]))
-
-    # Build signed-over-time series (sorted chronologically, with cumulative totals)
-    sorted_months = sorted(signed_by_month.keys())
-    cum_count = cum_value = 0
-    signed_over_time = []
-    for mk in sorted_months:
-        cum_count += signed_by_month[mk]["count"]
-        cum_value += signed_by_month[mk]["value"]
-        dt = datetime.strptime(mk, "%Y-%m")
-        signed_over_time.append({
-            "month":    dt.strftime("%b %Y"),
-            "count":    signed_by_month[mk]["count"],
-            "value":    signed_by_month[mk]["value"],
-            "cumCount": cum_count,
-            "cumValue": cum_value,
-        })
+CUBE_DIMS = ("stage", "package", "quarter", "country", "invoice")
 
+def build_cube(rows):
+    """Encode (labels, count, cents) rows as a sparse mixed-radix cube.
+
+    `labels` has one value per CUBE_DIMS entry, except quarter, which is a
+    tuple (a partner can want several). Each dimension is dictionary-encoded
+    as its sorted values plus one extra "all" index (= len(values)); a cell's
+    id is its indices combined in mixed radix (len(values) + 1 per dimension).
+    Every rollup is precomputed — any mix of set / "all" dimensions is one
+    lookup — and a partner counts once in any rollup over quarter. Only
+    non-empty cells are stored: ids gap-encoded, with parallel count and
+    value (whole dollars) arrays.
+    """
+    values = [sorted({v for labels, _, _ in rows for v in (labels[d] if d == 2 else (labels[d],))})
+              for d in range(len(CUBE_DIMS))]
+    index  = [{v: i for i, v in enumerate(vals)} for vals in values]
+    radix  = [len(vals) + 1 for vals in values]
+    totals = defaultdict(lambda: [0, 0])
+    for labels, n, cents in rows:
+        # each dimension: its own index(es) or "all"; quarters expand only
+        # when that dimension is set, so "all quarters" counts the row once
+        choices = []
+        for d, v in enumerate(labels):
+            own = [index[d][q] for q in v] if d == 2 else [index[d][v]]
+            choices.append(own + [radix[d] - 1])
+        ids = [0]
+        for d, opts in enumerate(choices):
+            ids = [i * radix[d] + o for i in ids for o in opts]
+        for i in ids:
+            t = totals[i]
+            t[0] += n
+            t[1] += cents
+    cells = sorted(i for i, t in totals.items() if t[0])
     return {
-        "lastUpdated":      datetime.now().strftime("%b %d, %Y"),
-        "signedCount":      signed_count,
-        "totalSigned":      int(total_signed),
-        "totalPipeline":    int(total_pipeline),
-        "paid":             int(paid),
-        "outstanding":      int(outstanding),
-        "waitingBilling":   int(waiting),
-        "inKind":           int(in_kind),
-        "needsInvoice":     int(pipeline_val.get("Needs Invoice", 0)),
-        "needsInvoiceCount":pipeline_cnt.get("Needs Invoice", 0),
-        "inDiscussion":     int(pipeline_val.get("In Discussion", 0)),
-        "inDiscussionCount":pipeline_cnt.get("In Discussion", 0),
-        "finalFollowUp":    int(pipeline_val.get("Final Follow Up", 0)),
-        "finalFollowUpCount":pipeline_cnt.get("Final Follow Up", 0),
-        "marketingComplete":int(signed_val.get("Marketing Complete", 0)),
-        "byStage":          {k: int(v) for k, v in signed_val.items()},
-        "countByStage":     dict(signed_cnt),
-        "pipelineByStage":  {k: int(v) for k, v in pipeline_val.items()},
-        "pipelineCountByStage": dict(pipeline_cnt),
-        "funnel":           funnel,
-        "signedOverTime":   signed_over_time,
-        "newThisWeek":      sorted(new_this_week, key=lambda x: -x["price"]),
-        "features":         dict(features),
-        "quarters":         dict(quarters),
-        "topCountries":     top_n(countries),
-        "topGroups":        top_n(groups),
-        "topBrands":        top_n(brands),
-        "partners":         partners,
+        "dims":   CUBE_DIMS,
+        "values": values,
+        "cells":  [b - a for a, b in zip([0] + cells, cells)],
+        "count":  [totals[i][0] for i in cells],
+        "value":  [int(totals[i][1] / 100) for i in cells],
     }
 
-def find_portal_link_field():
-    """Find the 'Partner Portal Link' field key in the pipeline. Returns key or None."""
-    r = requests.get(f"{BASE_URL}/pipelines/{PIPELINE_KEY}", auth=AUTH)
-    r.raise_for_status()
-    for field in r.json().get("fields", []):
-        if field.get("name") == "Partner Portal Link":
-            return str(field["key"])
-    return None
+def schema_fingerprint(schema):
+    """Hash of everything the decoder reads from the schema."""
+    parts = [STATE_VERSION, schema.stage_names, schema.package_labels, schema.invoice_labels,
+             schema.quarter_labels, schema.feature_labels]
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+class MetricsState:
+    """Aggregate state behind data.js, updatable one box at a time.
+
+    Every aggregate is a sum or count, so a changed box is applied as a
+    retraction of its previous record plus an insertion of the new one.
+    Output ordering never depends on the order boxes arrived in, so
+    incremental and full builds produce byte-identical results.
+    """
+
+    def __init__(self, schema):
+        self.schema     = schema
+        self.decoder    = BoxDecoder(schema)
+        self.generation = 0
+        self.records    = {}                     # box key → BoxRecord
+        self.stage_cnt  = defaultdict(int)       # stage key → boxes
+        self.stage_cents = defaultdict(int)      # stage key → value (signed/pipeline)
+        self.invoice_cents = defaultdict(int)    # invoice key → value (non-invited)
+        self.feature_cnt = [0] * len(FEATURE_NAMES)
+        self.qmask_cnt  = defaultdict(int)       # quarter mask → signed boxes
+        self.countries  = RankedCounter()
+        self.brands     = RankedCounter()
+        self.groups     = RankedCounter()
+        self.months     = {}                     # "YYYY-MM" → [count, value]
+        self.recent     = []                     # sorted (sign_ts, key) of signed boxes
+        self.cells      = {}                     # CUBE_DIMS base cell → [boxes, cents] (partner table)
+
+    # ── updates ──
+    def upsert(self, box):
+        rec = self.decoder.decode(box)
+        old = self.records.get(rec.key)
+        if old is not None:
+            self._apply(old, -1)
+        self.records[rec.key] = rec
+        self._apply(rec, 1)
+
+    def discard(self, key):
+        old = self.records.pop(key, None)
+        if old is not None:
+            self._apply(old, -1)
+
+    def _apply(self, rec, sign):
+        stage, cents = rec.stage, round(rec.price * 100) * sign
+        self._bump(self.stage_cnt, stage, sign)
+        if rec.stage_rank < 2:
+            self._bump(self.stage_cents, stage, cents)
+        if stage != "5002":
+            self._bump(self.invoice_cents, rec.invoice, cents)
+        if stage not in EXCLUDED_STAGES:
+            cell = (stage, rec.package, rec.qmask, rec.country, rec.invoice)
+            c = self.cells.setdefault(cell, [0, 0])
+            c[0] += sign
+            c[1] += cents
+            if not c[0]:
+                del self.cells[cell]
+        if rec.stage_rank != 0:
+            return
+
+        if rec.month:
+            m = self.months.setdefault(rec.month, [0, 0])
+            m[0] += sign
+            m[1] += int(rec.price) * sign
+            if not m[0]:
+                del self.months[rec.month]
+            if sign > 0:
+                insort(self.recent, (rec.sign_ts, rec.key))
+            else:
+                del self.recent[bisect_left(self.recent, (rec.sign_ts, rec.key))]
+        fmask = rec.fmask
+        while fmask:
+            low = fmask & -fmask
+            self.feature_cnt[low.bit_length() - 1] += sign
+            fmask ^= low
+        self._bump(self.qmask_cnt, rec.qmask, sign)
+        if rec.country: self.countries.add(rec.country, sign)
+        if rec.brand:   self.brands.add(rec.brand, sign)
+        if rec.group:   self.groups.add(rec.group, sign)
+
+    @staticmethod
+    def _bump(counter, key, delta):
+        n = counter[key] + delta
+        if n:
+            counter[key] = n
+        else:
+            del counter[key]
+
+    # ── output ──
+    def result(self, now=None):
+        """The full data payload, partner table included."""
+        return {**self.summary(now), "partners": list(self.partners())}
+
+    def partners(self):
+        """Yield per-partner rows (skipping EXCLUDED_STAGES): signed
+        first, then pipeline, then others, alphabetical within group."""
+        recs = sorted((r for r in self.records.values() if r.stage not in EXCLUDED_STAGES),
+                      key=lambda r: (r.stage_rank, r.name, r.key))
+        for r in recs:
+            yield self.decoder.partner(r)
+
+    def cube(self):
+        """Aggregate cube over the partner table: count and value for every
+        combination of CUBE_DIMS values, rollups included (see build_cube)."""
+        d = self.decoder
+        rows = []
+        for (stage, package, qmask, country, invoice), (n, cents) in self.cells.items():
+            rows.append(((self.schema.stage_names.get(stage, stage), package, d.quarters(qmask) or ("TBD",),
+                          country, self.schema.invoice_labels.get(invoice, "")), n, cents))
+        return build_cube(rows)
+
+    def partner_rows(self, keys):
+        """Partner table rows for just `keys` (skipping unknown / excluded boxes)."""
+        for key in keys:
+            r = self.records.get(key)
+            if r is not None and r.stage not in EXCLUDED_STAGES:
+                yield self.decoder.partner(r)
+
+    def partner_count(self):
+        return sum(1 for r in self.records.values() if r.stage not in EXCLUDED_STAGES)
+
+    def summary(self, now=None):
+        """The data payload without the partner table."""
+        now = now or datetime.now()
+        signed_stages, pipeline_stages = self.schema.signed_stages, self.schema.pipeline_stages
+        stage_names = self.schema.stage_names
+        dollars = lambda cents: int(cents / 100)
+
+        signed_val   = {signed_stages[k]: self.stage_cents.get(k, 0) for k in signed_stages if self.stage_cnt.get(k)}
+        signed_cnt   = {signed_stages[k]: self.stage_cnt[k] for k in signed_stages if self.stage_cnt.get(k)}
+        pipeline_val = {pipeline_stages[k]: self.stage_cents.get(k, 0) for k in pipeline_stages if self.stage_cnt.get(k)}
+        pipeline_cnt = {pipeline_stages[k]: self.stage_cnt[k] for k in pipeline_stages if self.stage_cnt.get(k)}
+
+        total_signed   = sum(signed_val.values())
+        total_pipeline = total_signed + sum(pipeline_val.values())
+        signed_count   = sum(signed_cnt.values())
+
+        # Build funnel
+        funnel = []
+        for sk in funnel_order(signed_stages):
+            lbl = signed_stages[sk]
+            funnel.append({
+                "label": f"Signed — {lbl}",
+                "stageKey": sk,
+                "count": signed_cnt.get(lbl, 0),
+                "value": dollars(signed_val.get(lbl, 0)),
+            })
 
-def write_portal_links(partners):
-    """Write each signed partner's portal URL into their Streak box."""
-    field_key = find_portal_link_field()
+        for sk in funnel_order(pipeline_stages):
+            label = pipeline_stages[sk]
+            funnel.append({
+                "label":    label,
+                "stageKey": sk,
+                "count":    pipeline_cnt.get(label, 0),
+                "value":    dollars(pipeline_val.get(label, 0)),
+            })
+
+        for sk in ("5013", "5010", "5008", "5009"):
+            cnt = self.stage_cnt.get(sk, 0)
+            if cnt:
+                funnel.append({"label": stage_names[sk], "stageKey": sk, "count": cnt, "value": 0})
+
+        # Build signed-over-time series (sorted chronologically, with cumulative totals)
+        cum_count = cum_value = 0
+        signed_over_time = []
+        for mk in sorted(self.months):
+            count, value = self.months[mk]
+            cum_count += count
+            cum_value += value
+            dt = datetime.strptime(mk, "%Y-%m")
+            signed_over_time.append({
+                "month":    dt.strftime("%b %Y"),
+                "count":    count,
+                "value":    value,
+                "cumCount": cum_count,
+                "cumValue": cum_value,
+            })
+
+        week_ago = (now - timedelta(days=7)).timestamp()
+        new_this_week = []
+        for _, key in self.recent[bisect_left(self.recent, (week_ago, "")):]:
+            rec = self.records[key]
+            new_this_week.append({"name": rec.name, "stage": signed_stages[rec.stage], "price": int(rec.price)})
+        new_this_week.sort(key=lambda x: (-x["price"], x["name"]))
+
+        features = {FEATURE_NAMES[i]: n for i, n in enumerate(self.feature_cnt) if n}
+        quarters = {}
+        for i, q in sorted(enumerate(self.decoder.quarter_names), key=lambda iq: self.decoder.quarter_rank(iq[1])):
+            n = sum(c for mask, c in self.qmask_cnt.items() if mask >> i & 1)
+            if n:
+                quarters[q] = n
+        if self.qmask_cnt.get(0):
+            quarters["TBD"] = self.qmask_cnt[0]
+
+        # A role whose stage this pipeline does not have reports 0
+        needs_invoice, in_discussion, final_follow_up = (pipeline_stages.get(STAGE_ROLES[r])
+                                                         for r in ("needsInvoice", "inDiscussion", "finalFollowUp"))
+        inv = self.invoice_cents
+        return {
+            "lastUpdated":      now.strftime("%b %d, %Y"),
+            "signedCount":      signed_count,
+            "totalSigned":      dollars(total_signed),
+            "totalPipeline":    dollars(total_pipeline),
+            "paid":             dollars(inv.get("9002", 0)),
+            "outstanding":      dollars(inv.get("9001", 0)),
+            "waitingBilling":   dollars(inv.get("9004", 0)),
+            "inKind":           dollars(inv.get("9005", 0)),
+            "needsInvoice":     dollars(pipeline_val.get(needs_invoice, 0)),
+            "needsInvoiceCount":pipeline_cnt.get(needs_invoice, 0),
+            "inDiscussion":     dollars(pipeline_val.get(in_discussion, 0)),
+            "inDiscussionCount":pipeline_cnt.get(in_discussion, 0),
+            "finalFollowUp":    dollars(pipeline_val.get(final_follow_up, 0)),
+            "finalFollowUpCount":pipeline_cnt.get(final_follow_up, 0),
+            "marketingComplete":dollars(signed_val.get(signed_stages.get(STAGE_ROLES["marketingComplete"]), 0)),
+            "byStage":          {k: dollars(v) for k, v in signed_val.items()},
+            "countByStage":     signed_cnt,
+            "pipelineByStage":  {k: dollars(v) for k, v in pipeline_val.items()},
+            "pipelineCountByStage": pipeline_cnt,
+            "funnel":           funnel,
+            "signedOverTime":   signed_over_time,
+            "newThisWeek":      new_this_week,
+            "features":         features,
+            "quarters":         quarters,
+            "topCountries":     self.countries.top(),
+            "topGroups":        self.groups.top(),
+            "topBrands":        self.brands.top(),
+        }
+
+    # ── persistence ──
+    def save(self, path=METRICS_STATE_PATH):
+        state = {
+            "fingerprint":  schema_fingerprint(self.schema),
+            "generation":   self.generation,
+            "quarterNames": self.decoder.quarter_names,
+            "records":      [[getattr(r, s) for s in BoxRecord.__slots__] for r in self.records.values()],
+            "stageCnt":     self.stage_cnt,
+            "stageCents":   self.stage_cents,
+            "invoiceCents": self.invoice_cents,
+            "featureCnt":   self.feature_cnt,
+            "qmaskCnt":     {str(k): v for k, v in self.qmask_cnt.items()},
+            "countries":    self.countries.counts,
+            "brands":       self.brands.counts,
+            "groups":       self.groups.counts,
+            "months":       self.months,
+            "recent":       self.recent,
+            "cells":        [[*cell, n, cents] for cell, (n, cents) in self.cells.items()],
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, schema, path=METRICS_STATE_PATH):
+        """Load saved state, or None if missing or built from a different schema."""
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("fingerprint") != schema_fingerprint(schema):
+            return None
+        self = cls(schema)
+        self.generation = state["generation"]
+        self.decoder.quarter_names = state["quarterNames"]
+        self.decoder.quarter_bits  = {q: 1 << i for i, q in enumerate(self.decoder.quarter_names)}
+        for row in state["records"]:
+            rec = BoxRecord()
+            for slot, val in zip(BoxRecord.__slots__, row):
+                setattr(rec, slot, val)
+            rec.timings = tuple(rec.timings)
+            self.records[rec.key] = rec
+        self.stage_cnt.update(state["stageCnt"])
+        self.stage_cents.update(state["stageCents"])
+        self.invoice_cents.update(state["invoiceCents"])
+        self.feature_cnt = state["featureCnt"]
+        self.qmask_cnt.update({int(k): v for k, v in state["qmaskCnt"].items()})
+        self.countries = RankedCounter(state["countries"])
+        self.brands    = RankedCounter(state["brands"])
+        self.groups    = RankedCounter(state["groups"])
+        self.months    = state["months"]
+        self.recent    = [tuple(x) for x in state["recent"]]
+        self.cells     = {tuple(row[:5]): row[5:] for row in state["cells"]}
+        return self
+
+def compute_metrics(boxes, schema=None, now=None):
+    """Full recompute of the data.js payload from raw boxes."""
+    state = MetricsState(schema or pipeline_schema())
+    for box in boxes:
+        state.upsert(box)
+    return state.result(now)
+
+def update_metrics(sync, schema=None, verify=False, path=METRICS_STATE_PATH):
+    """Bring the metrics state up to date, applying only the boxes that changed.
+
+    Saved state is reused when it was built from the same schema and is
+    exactly one sync behind the snapshot; otherwise it is rebuilt from every
+    box. With verify=True the result is also recomputed from scratch and the
+    two are compared byte for byte. Returns the MetricsState.
+    """
+    schema = schema or pipeline_schema()
+    now    = datetime.now()
+    state  = MetricsState.load(schema, path)
+    if state is not None and state.generation == sync.generation - 1:
+        for key in sync.removed:
+            state.discard(key)
+        for box in sync.boxes.get_many(sync.changed):
+            state.upsert(box)
+        print(f"  Metrics: applied {len(sync.changed)} changed / {len(sync.removed)} removed box(es)")
+    else:
+        state = MetricsState(schema)
+        for box in sync.boxes:
+            state.upsert(box)
+        print(f"  Metrics: rebuilt from {len(sync.boxes)} boxes")
+    state.generation = sync.generation
+
+    if verify:
+        full = MetricsState(schema)
+        for box in sync.boxes:
+            full.upsert(box)
+        if json.dumps([full.result(now), full.cube()]) != json.dumps([state.result(now), state.cube()]):
+            print("  Warning: incremental metrics differ from a full recompute — using the full result")
+            state = full
+            state.generation = sync.generation
+        else:
+            print("  Verified: incremental metrics match a full recompute")
+    state.save(path)
+    return state
+
+# ── Box history ────────────────────────────────────────────────────
+# Every run records how each box's decoded state changed, as validity
+# intervals: a row per (box, stretch of time with the same tracked values),
+# closed (valid_to set) when a run sees the box change or disappear. This
+# keeps the store proportional to changes rather than runs × boxes.
+HISTORY_FIELDS = ("stage", "cents", "invoice", "package", "country")
+AGING_BUCKETS  = (0, 30, 60, 90)   # days; last bucket is open-ended
+OUTSTANDING    = "9001"            # invoice key for "Outstanding"
+
+def history_values(rec):
+    return (rec.stage, round(rec.price * 100), rec.invoice, rec.package, rec.country)
+
+def to_ms(dt):
+    return int(dt.timestamp() * 1000)
+
+class BoxHistory:
+    """SQLite store of box state intervals, with time-series queries.
+
+    `stage_since` / `invoice_since` carry the start of the current stage /
+    invoice status stint forward across rows, so dwell times and invoice
+    aging need no walk back through a box's rows.
+    """
+
+    def __init__(self, path=BOX_HISTORY_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS states (
+                key           TEXT NOT NULL,
+                valid_from    INTEGER NOT NULL,
+                valid_to      INTEGER,
+                stage         TEXT NOT NULL,
+                cents         INTEGER NOT NULL,
+                invoice       TEXT NOT NULL,
+                package       TEXT NOT NULL,
+                country       TEXT NOT NULL,
+                stage_since   INTEGER NOT NULL,
+                invoice_since INTEGER NOT NULL,
+                PRIMARY KEY (key, valid_from)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS states_open  ON states (valid_to, key);
+            CREATE INDEX IF NOT EXISTS states_from  ON states (valid_from);
+            CREATE INDEX IF NOT EXISTS states_stage ON states (stage, valid_from);
+            CREATE TABLE IF NOT EXISTS runs (
+                ts         INTEGER PRIMARY KEY,
+                generation INTEGER NOT NULL,
+                boxes      INTEGER NOT NULL,
+                changed    INTEGER NOT NULL
+            );
+        """)
+
+    def last_generation(self):
+        row = self.db.execute("SELECT generation FROM runs ORDER BY ts DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def open_rows(self, keys=None):
+        """{key: (valid_from, values, stage_since, invoice_since)} for boxes as they stand."""
+        sql = f"SELECT key, valid_from, {', '.join(HISTORY_FIELDS)}, stage_since, invoice_since " \
+              "FROM states WHERE valid_to IS NULL"
+        if keys is None:
+            rows = self.db.execute(sql)
+        else:
+            keys, rows = list(keys), []
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows += self.db.execute(f"{sql} AND key IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+        return {r[0]: (r[1], tuple(r[2:7]), r[7], r[8]) for r in rows}
+
+    def record(self, records, keys=None, now=None):
+        """Record the state of `records` ({key: BoxRecord}) at `now`.
+
+        With `keys`, only those boxes are compared (a box in `keys` but not
+        in `records` was removed); otherwise every open row is reconciled.
+        Returns (run timestamp in ms, number of boxes whose tracked values changed).
+        """
+        ts   = to_ms(now or datetime.now())
+        keys = set(records) | set(self.open_rows()) if keys is None else set(keys)
+        old  = self.open_rows(keys)
+        close, insert, changed = [], [], 0
+        for key in keys:
+            rec, prev = records.get(key), old.get(key)
+            values = history_values(rec) if rec is not None else None
+            if prev is None and values is None or prev is not None and prev[1] == values:
+                continue
+            changed += 1
+            if prev is not None:
+                close.append((ts, key, prev[0]))
+            if values is not None:
+                stage_since   = prev[2] if prev and prev[1][0] == values[0] else ts
+                invoice_since = prev[3] if prev and prev[1][2] == values[2] else ts
+                insert.append((key, ts, *values, stage_since, invoice_since))
+        self.db.executemany("UPDATE states SET valid_to = ? WHERE key = ? AND valid_from = ?", close)
+        self.db.executemany(f"INSERT OR REPLACE INTO states (key, valid_from, {', '.join(HISTORY_FIELDS)}, "
+                            "stage_since, invoice_since) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", insert)
+        return ts, changed
+
+    def add_run(self, ts, generation, boxes, changed):
+        self.db.execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?)", (ts, generation, boxes, changed))
+        self.db.commit()
+
+    # ── queries ──
+    def transitions(self, start, end):
+        """Stage moves between `start` and `end` (datetimes), oldest first:
+        [{"key", "at", "from", "to"}]."""
+        rows = self.db.execute("""
+            SELECT n.key, n.valid_from, p.stage, n.stage
+            FROM states n JOIN states p ON p.key = n.key AND p.valid_to = n.valid_from
+            WHERE n.valid_from >= ? AND n.valid_from < ? AND p.stage != n.stage
+            ORDER BY n.valid_from, n.key""", (to_ms(start), to_ms(end)))
+        return [{"key": k, "at": at, "from": a, "to": b} for k, at, a, b in rows]
+
+    def transition_counts(self, start, end, bucket_days=7):
+        """{bucket start date: {"from→to": n}} — e.g. week-over-week movement."""
+        out, width = {}, bucket_days * 86_400_000
+        base = to_ms(start)
+        for t in self.transitions(start, end):
+            day = datetime.fromtimestamp((base + (t["at"] - base) // width * width) / 1000).strftime("%Y-%m-%d")
+            bucket = out.setdefault(day, {})
+            move = f"{t['from']}→{t['to']}"
+            bucket[move] = bucket.get(move, 0) + 1
+        return out
+
+    def revenue_curve(self, start, end, step_days=1, stages=SIGNED_STAGES):
+        """Signed revenue (dollars) and box count as they stood at each step
+        from `start` to `end`: [{"date", "value", "count"}]. One pass over the
+        intervals that overlap the range."""
+        s, e = to_ms(start), to_ms(end)
+        marks = ",".join("?" * len(stages))
+        rows = self.db.execute(f"""
+            SELECT valid_from, valid_to, cents FROM states
+            WHERE stage IN ({marks}) AND valid_from <= ? AND (valid_to IS NULL OR valid_to > ?)""",
+            (*stages, e, s)).fetchall()
+        events = sorted([(max(f, s), c, 1) for f, _, c in rows] +
+                        [(t, -c, -1) for _, t, c in rows if t is not None and t <= e])
+        points, cents, count, i, step = [], 0, 0, 0, step_days * 86_400_000
+        for at in range(s, e + 1, step):
+            while i < len(events) and events[i][0] <= at:
+                cents, count, i = cents + events[i][1], count + events[i][2], i + 1
+            points.append({"date": datetime.fromtimestamp(at / 1000).strftime("%Y-%m-%d"),
+                           "value": int(cents / 100), "count": count})
+        return points
+
+    def invoice_aging(self, as_of, buckets=AGING_BUCKETS, invoice=OUTSTANDING):
+        """Boxes with the given invoice status at `as_of`, bucketed by how long
+        they had had it: {"0-30": {"count", "value"}, …, "90+": …}."""
+        t = to_ms(as_of)
+        rows = self.db.execute("""
+            SELECT invoice_since, cents FROM states
+            WHERE invoice = ? AND valid_from <= ? AND (valid_to IS NULL OR valid_to > ?)""", (invoice, t, t))
+        labels = [f"{a}-{b}" for a, b in zip(buckets, buckets[1:])] + [f"{buckets[-1]}+"]
+        out = {label: {"count": 0, "value": 0} for label in labels}
+        for since, cents in rows:
+            b = out[labels[bisect_left(buckets, (t - since) / 86_400_000 + 1e-9) - 1]]
+            b["count"] += 1
+            b["value"] += int(cents / 100)
+        return out
+
+    def stage_dwell(self, start, end):
+        """Days spent in each stage by stints that ended between `start` and
+        `end`: {stage: {"count", "meanDays", "medianDays"}}."""
+        rows = self.db.execute("""
+            SELECT n.valid_from - p.stage_since, p.stage
+            FROM states n JOIN states p ON p.key = n.key AND p.valid_to = n.valid_from
+            WHERE n.valid_from >= ? AND n.valid_from < ? AND p.stage != n.stage""", (to_ms(start), to_ms(end)))
+        stints = defaultdict(list)
+        for ms, stage in rows:
+            stints[stage].append(ms / 86_400_000)
+        return {stage: {"count": len(d), "meanDays": round(sum(d) / len(d), 1),
+                        "medianDays": round(sorted(d)[len(d) // 2], 1)}
+                for stage, d in sorted(stints.items())}
+
+    def close(self):
+        self.db.close()
+
+def record_history(sync, state, path=BOX_HISTORY_PATH):
+    """Append this run's box states to the history store.
+
+    Only the synced changes are compared when the store is exactly one sync
+    behind; otherwise (first run, skipped runs) every box is reconciled.
+    """
+    history = BoxHistory(path)
+    try:
+        incremental = history.last_generation() == sync.generation - 1
+        keys = [*sync.changed, *sync.removed] if incremental else None
+        ts, changed = history.record(state.records, keys)
+        history.add_run(ts, sync.generation, len(state.records), changed)
+        print(f"  History: {changed} box(es) changed state")
+        return changed
+    finally:
+        history.close()
+
+def query_history(query, since=None, until=None, path=BOX_HISTORY_PATH):
+    """Answer a --history query from the local store (no Streak calls).
+    Dates are YYYY-MM-DD; the range defaults to the last 90 days."""
+    until = datetime.strptime(until, "%Y-%m-%d") if until else datetime.now()
+    since = datetime.strptime(since, "%Y-%m-%d") if since else until - timedelta(days=90)
+    history = BoxHistory(path)
+    try:
+        queries = {
+            "transitions": lambda: history.transitions(since, until),
+            "movement":    lambda: history.transition_counts(since, until),
+            "revenue":     lambda: history.revenue_curve(since, until),
+            "aging":       lambda: history.invoice_aging(until),
+            "dwell":       lambda: history.stage_dwell(since, until),
+        }
+        if query not in queries:
+            raise SystemExit(f"Unknown history query {query!r} — one of: {', '.join(queries)}")
+        return queries[query]()
+    finally:
+        history.close()
+
+# ── Portal link write-back ─────────────────────────────────────────
+def write_portal_links(boxes):
+    """Write each signed partner's portal URL into their Streak box.
+
+    Boxes whose Partner Portal Link already holds the right URL are skipped;
+    the rest are posted concurrently on the shared client. Returns
+    {"written", "skipped", "failed"} counts.
+    """
+    counts = {"written": 0, "skipped": 0, "failed": 0}
+    field_key = pipeline_schema().field_key("Partner Portal Link")
     if not field_key:
         print("Skipping portal links — 'Partner Portal Link' column not found in Streak.")
         print("  → Create a Text column named 'Partner Portal Link' in Streak, then re-run.")
-        return
-    signed = [p for p in partners if p["stageKey"] in SIGNED_STAGES]
-    print(f"Writing portal links to Streak ({len(signed)} partners)", end="", flush=True)
-    ok = 0
-    for p in signed:
-        url = PORTAL_BASE_URL + p["key"]
-        r = requests.post(
-            f"{BASE_URL}/boxes/{p['key']}/fields/{field_key}",
-            auth=AUTH,
-            json={"value": url}
-        )
-        if r.status_code in (200, 201):
-            ok += 1
+        return counts
+    todo = []
+    for b in boxes:
+        if str(b.get("stageKey", "")) not in SIGNED_STAGES:
+            continue
+        if str(field_val(b, field_key) or "").strip() == PORTAL_BASE_URL + b["key"]:
+            counts["skipped"] += 1
         else:
-            print(f"\n  Warning: failed for {p['name']} ({r.status_code})")
-        print(".", end="", flush=True)
-    print(f" {ok}/{len(signed)} updated")
+            todo.append({"key": b["key"], "name": b.get("name")})
 
-def print_summary(d):
+    def post(box):
+        try:
+            r = streak.post(f"/boxes/{box['key']}/fields/{field_key}",
+                            json={"value": PORTAL_BASE_URL + box["key"]})
+        except requests.RequestException as e:
+            return box, str(e)
+        return box, None if r.status_code in (200, 201) else r.status_code
+
+    for box, err in streak.map(post, todo):
+        if err is None:
+            counts["written"] += 1
+        else:
+            counts["failed"] += 1
+            print(f"  Warning: portal link failed for {box.get('name', box['key'])} ({err})")
+    print(f"Portal links: {counts['written']} written, {counts['skipped']} already current, "
+          f"{counts['failed']} failed")
+    return counts
+
+# ── Output files ───────────────────────────────────────────────────
+def write_atomic(path, body):
+    """Write bytes/str to `path` only if they differ from what is there.
+
+    Goes through a temp file + rename so readers (and a half-finished run)
+    never see a partial file. Returns True if the file changed.
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    try:
+        with open(path, "rb") as f:
+            if f.read() == body:
+                return False
+    except OSError:
+        pass
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, path)
+    return True
+
+def content_version(body):
+    """Short content hash used as a cache-busting version token."""
+    return hashlib.sha256(body).hexdigest()[:12]
+
+CHUNK_SIZE = 64 * 1024
+
+def stage_stream(path, chunks):
+    """Write an iterable of byte chunks to a temp file next to `path`,
+    hashing as it goes. Returns (temp path, content_version, size)."""
+    tmp, digest, size = f"{path}.tmp{os.getpid()}", hashlib.sha256(), 0
+    with open(tmp, "wb") as f:
+        for chunk in chunks:
+            digest.update(chunk)
+            size += len(chunk)
+            f.write(chunk)
+    return tmp, digest.hexdigest()[:12], size
+
+def same_file(a, b):
+    """True if both files exist and have identical bytes (read in chunks)."""
+    try:
+        if os.path.getsize(a) != os.path.getsize(b):
+            return False
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            while True:
+                ca, cb = fa.read(CHUNK_SIZE), fb.read(CHUNK_SIZE)
+                if ca != cb:
+                    return False
+                if not ca:
+                    return True
+    except OSError:
+        return False
+
+def publish_staged(tmp, path):
+    """Move a staged temp file over `path` unless the bytes are unchanged
+    (then the temp file is dropped). Returns True if `path` changed."""
+    if same_file(tmp, path):
+        os.remove(tmp)
+        return False
+    os.replace(tmp, path)
+    return True
+
+def read_chunks(path):
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+# ── Asset pipeline ─────────────────────────────────────────────────
+# Partner assets are uploaded full size to partner-assets/ through the
+# Assets tab. Each run checks every path the asset records refer to
+# and renders web variants of each image (and the first page of each PDF)
+# into assets/, named by their content hash so they can be cached forever.
+# assets/manifest.json maps each original path to its variants and is keyed
+# by the original's hash, so only new or changed files are processed.
+ASSET_SOURCE_DIR    = "partner-assets"
+ASSET_OUT_DIR       = os.path.join(SCRIPT_DIR, "assets")
+ASSET_MANIFEST_PATH = os.path.join(ASSET_OUT_DIR, "manifest.json")
+ASSET_TYPES    = {".png": "image", ".jpg": "image", ".jpeg": "image", ".gif": "image",
+                  ".webp": "image", ".pdf": "pdf"}
+ASSET_VARIANTS = {"image": 1600, "thumb": 320}   # longest side in pixels (PDFs: "preview" and "thumb")
+ASSET_QUALITY  = 80                              # WebP quality
+ASSET_SETTINGS = f"webp{ASSET_QUALITY}:" + ",".join(f"{k}{v}" for k, v in ASSET_VARIANTS.items())
+
+def asset_path_error(path):
+    """Why an asset path cannot be served, or None if it is fine."""
+    if not path:
+        return "no path"
+    norm = os.path.normpath(path)
+    if os.path.isabs(path) or norm.startswith("..") or not norm.startswith(ASSET_SOURCE_DIR + os.sep):
+        return f"outside {ASSET_SOURCE_DIR}/"
+    if os.path.splitext(norm)[1].lower() not in ASSET_TYPES:
+        return "unsupported file type"
+    if not os.path.isfile(os.path.join(SCRIPT_DIR, norm)):
+        return "file missing"
+    return None
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    for chunk in read_chunks(path):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+def pdf_first_page(path, size):
+    """The first page of a PDF as a PIL image (via poppler's pdftoppm), or
+    None when pdftoppm is not installed or fails."""
+    if not shutil.which("pdftoppm"):
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        out = subprocess.run(["pdftoppm", "-png", "-f", "1", "-l", "1", "-singlefile",
+                              "-scale-to", str(size), path, os.path.join(tmp, "page")],
+                             capture_output=True)
+        if out.returncode:
+            return None
+        with Image.open(os.path.join(tmp, "page.png")) as page:
+            page.load()
+            return page
+
+def asset_tools(kind):
+    """The renderers for `kind` that are installed. Entries record these, so
+    one processed without them is redone once they appear."""
+    tools = ["pillow"] if Image is not None else []
+    if kind == "pdf" and tools and shutil.which("pdftoppm"):
+        tools.append("pdftoppm")
+    return tools
+
+def asset_variants(path, kind):
+    """Render the web variants of one asset. Returns {variant: (bytes,
+    width, height)} — empty when Pillow (or, for PDFs, pdftoppm) is missing."""
+    if Image is None:
+        return {}
+    web = lambda im: im.convert("RGBA" if im.mode in ("RGBA", "LA", "P") else "RGB")
+    if kind == "pdf":
+        page = pdf_first_page(path, ASSET_VARIANTS["image"])
+        if page is None:
+            return {}
+        img, names = web(page), {"preview": ASSET_VARIANTS["image"], "thumb": ASSET_VARIANTS["thumb"]}
+    else:
+        with Image.open(path) as src:
+            img = web(src)
+        names = ASSET_VARIANTS
+    out = {}
+    for name, size in names.items():
+        variant = img.copy()
+        variant.thumbnail((size, size), Image.LANCZOS)   # only ever shrinks
+        buf = io.BytesIO()
+        variant.save(buf, "WEBP", quality=ASSET_QUALITY, method=6)
+        out[name] = (buf.getvalue(), variant.width, variant.height)
+    return out
+
+def load_asset_manifest(path=ASSET_MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        return manifest if manifest.get("settings") == ASSET_SETTINGS else {"assets": {}}
+    except (OSError, ValueError):
+        return {"assets": {}}
+
+def build_assets(assets, out_dir=ASSET_OUT_DIR):
+    """Validate the file path of every asset record and bring the variants
+    in `out_dir` and its manifest up to date. Returns (changed paths, counts)."""
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    previous = load_asset_manifest(manifest_path)["assets"]
+    entries, errors, todo = {}, {}, {}
+    for asset in assets:
+        path = asset.get("path")
+        if not path and asset.get("url"):
+            continue                                  # link assets have no file
+        error = asset_path_error(path)
+        if error:
+            errors[path or asset.get("id", "?")] = error
+            continue
+        if path in entries or path in todo:
+            continue
+        source = os.path.join(SCRIPT_DIR, os.path.normpath(path))
+        digest = file_sha256(source)
+        old  = previous.get(path)
+        kind = ASSET_TYPES[os.path.splitext(path)[1].lower()]
+        if old and old["hash"] == digest and all(os.path.exists(os.path.join(SCRIPT_DIR, v["path"]))
+                                                 for v in old["variants"].values()) \
+               and (old["variants"] or set(asset_tools(kind)) <= set(old.get("tools", []))):
+            entries[path] = old
+        else:
+            todo[path] = (source, digest)
+
+    def process(item):
+        path, (source, digest) = item
+        kind = ASSET_TYPES[os.path.splitext(path)[1].lower()]
+        try:
+            return path, kind, digest, asset_variants(source, kind), None
+        except Exception as e:                        # a corrupt upload must not stop the run
+            return path, kind, digest, {}, str(e)
+
+    os.makedirs(out_dir, exist_ok=True)
+    changed = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 2) as pool:
+        for path, kind, digest, variants, error in pool.map(process, todo.items()):
+            if error:
+                errors[path] = f"could not be processed ({error})"
+            entry = entries[path] = {"hash": digest, "type": kind, "bytes": os.path.getsize(todo[path][0]),
+                                     "tools": asset_tools(kind), "variants": {}}
+            for name, (body, width, height) in variants.items():
+                out = os.path.join(out_dir, f"{content_version(body)}.webp")
+                if write_atomic(out, body):
+                    changed.append(out)
+                entry["variants"][name] = {"path": os.path.relpath(out, SCRIPT_DIR),
+                                           "width": width, "height": height, "bytes": len(body)}
+
+    # Drop variants nothing refers to any more
+    keep = {os.path.basename(v["path"]) for e in entries.values() for v in e["variants"].values()}
+    for name in sorted(os.listdir(out_dir)):
+        if name.endswith(".webp") and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+            changed.append(os.path.join(out_dir, name))
+
+    manifest = {"settings": ASSET_SETTINGS, "assets": dict(sorted(entries.items())),
+                "errors": dict(sorted(errors.items()))}
+    if write_atomic(manifest_path, json.dumps(manifest, indent=1)):
+        changed.append(manifest_path)
+    for path, error in sorted(errors.items()):
+        print(f"  Warning: asset {path}: {error}")
+    if todo and Image is None:
+        print("  Note: Pillow is not installed — asset variants skipped (pip3 install pillow)")
+    print(f"Assets: {len(entries)} file(s), {len(todo)} processed, {len(errors)} problem(s)")
+    return changed, {"assets": len(entries), "assetsProcessed": len(todo), "assetErrors": len(errors)}
+
+# ── Asset index ────────────────────────────────────────────────────
+# Asset records are kept one per file in partner-resources/<id>.json, so an
+# Assets tab action writes one small file instead of rewriting a shared
+# list. The index in .cache/asset-index.json remembers each record's mtime,
+# size and git blob hash, plus the inverted map partner key → deliverable →
+# asset ids, so a run re-reads only the records that changed and rewrites
+# only the resources/<key>.json files of the partners they name.
+# partner-resources.json is generated from the records for the dashboard's
+# read-only views; its "shas" let the Assets tab fetch only newer records.
+ASSET_RECORD_DIR    = os.path.join(SCRIPT_DIR, "partner-resources")
+RESOURCES_PATH      = os.path.join(SCRIPT_DIR, "partner-resources.json")
+RESOURCES_OUT_DIR   = os.path.join(SCRIPT_DIR, "resources")
+ASSET_INDEX_PATH    = os.path.join(SCRIPT_DIR, ".cache", "asset-index.json")
+ASSET_INDEX_VERSION = 1
+PARTNER_KEY_RE      = re.compile(r"^[A-Za-z0-9_-]+$")   # as partner.html accepts
+
+def git_blob_sha(body):
+    """The hash git (and the GitHub contents API) gives a file's contents."""
+    return hashlib.sha1(b"blob %d\0" % len(body) + body).hexdigest()
+
+def asset_order(asset):
+    return (asset.get("uploadedAt", ""), asset.get("id", ""))
+
+def asset_view(asset, manifest):
+    """What a partner's portal shows of one record (with its web variants),
+    or None if it is not live or its file is broken."""
+    if asset.get("status") != "live" or asset.get("path") in manifest.get("errors", {}):
+        return None
+    info = {"label": asset.get("label", ""), "path": asset.get("path", ""), "note": asset.get("note", "")}
+    if asset.get("url"):
+        info["url"] = asset["url"]
+    variants = manifest["assets"].get(asset.get("path"), {}).get("variants", {})
+    info.update({name: v["path"] for name, v in variants.items()})
+    return info
+
+class AssetIndex:
+    """The persisted record stats and partner → deliverable → asset id map.
+
+    refresh() picks up added, edited and deleted records; emit() writes the
+    resource files of the partners whose assets changed (or whose asset
+    variants did) and the catalogue."""
+
+    def __init__(self, data=None):
+        if not data or data.get("version") != ASSET_INDEX_VERSION:
+            data = {}
+        self.records  = data.get("records", {})    # id → {mtime, size, sha, asset, view}
+        self.partners = data.get("partners", {})   # key → {deliverable: [ids]}
+        self.full     = not data                   # nothing to go on: write every partner's file
+        self.dirty    = set()                      # partner keys whose resource file is stale
+        self.edited   = 0
+
+    @classmethod
+    def load(cls, path=ASSET_INDEX_PATH):
+        try:
+            with open(path) as f:
+                return cls(json.load(f))
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path=ASSET_INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, json.dumps({"version": ASSET_INDEX_VERSION, "records": self.records,
+                                       "partners": self.partners}, separators=(",", ":")))
+
+    def assets(self):
+        return sorted((r["asset"] for r in self.records.values()), key=asset_order)
+
+    def _keys(self, aid):
+        asset = self.records[aid]["asset"]
+        keys = set(asset.get("partnerKeys", [])) if asset.get("status") == "live" else set()
+        bad = {k for k in keys if not PARTNER_KEY_RE.match(k)}
+        for key in sorted(bad):
+            print(f"  Warning: asset {aid}: invalid partner key {key!r}")
+        return keys - bad
+
+    def _unlink(self, aid):
+        deliv = self.records[aid]["asset"].get("deliverable", "")
+        for key in self._keys(aid):
+            ids = self.partners.get(key, {}).get(deliv, [])
+            if aid in ids:
+                ids.remove(aid)
+            if not ids:
+                self.partners.get(key, {}).pop(deliv, None)
+            if not self.partners.get(key):
+                self.partners.pop(key, None)
+            self.dirty.add(key)
+
+    def _link(self, aid):
+        deliv = self.records[aid]["asset"].get("deliverable", "")
+        for key in self._keys(aid):
+            ids = self.partners.setdefault(key, {}).setdefault(deliv, [])
+            ids.append(aid)
+            ids.sort(key=lambda i: asset_order(self.records[i]["asset"]))
+            self.dirty.add(key)
+
+    def refresh(self, record_dir=ASSET_RECORD_DIR):
+        """Sync with the record files: only those whose mtime or size moved
+        are read, and only those whose contents changed count as edits."""
+        seen = set()
+        with os.scandir(record_dir) if os.path.isdir(record_dir) else nullcontext([]) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                aid, st = entry.name[:-5], entry.stat()
+                seen.add(aid)
+                old = self.records.get(aid)
+                if old and old["mtime"] == st.st_mtime_ns and old["size"] == st.st_size:
+                    continue
+                with open(entry.path, "rb") as f:
+                    body = f.read()
+                sha = git_blob_sha(body)
+                if old and old["sha"] == sha:             # touched, e.g. by a fresh checkout
+                    old.update(mtime=st.st_mtime_ns, size=st.st_size)
+                    continue
+                try:
+                    asset = json.loads(body)
+                    if not isinstance(asset, dict):
+                        raise ValueError("not a JSON object")
+                except ValueError as e:                   # keep the last good version, if any
+                    print(f"  Warning: asset record {entry.name} ignored ({e})")
+                    continue
+                if old:
+                    self._unlink(aid)
+                self.records[aid] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha": sha,
+                                     "asset": {**asset, "id": aid}, "view": None}
+                self._link(aid)
+                self.edited += 1
+        for aid in set(self.records) - seen:
+            self._unlink(aid)
+            del self.records[aid]
+            self.edited += 1
+        return self.edited
+
+    def emit(self, manifest, out_dir=RESOURCES_OUT_DIR, catalogue_path=RESOURCES_PATH):
+        """Write resources/<key>.json for every stale partner (removing it
+        once they have no live assets) and the catalogue if a record changed.
+        Returns the paths written or removed."""
+        views = {}
+        for aid, rec in self.records.items():
+            view = views[aid] = asset_view(rec["asset"], manifest)
+            digest = view and content_version(json.dumps(view, sort_keys=True).encode())
+            if digest != rec["view"]:                  # e.g. its variants were just rendered
+                rec["view"] = digest
+                self.dirty |= self._keys(aid)
+
+        os.makedirs(out_dir, exist_ok=True)
+        keys = self.dirty
+        if self.full:                                  # also clear out files the index never saw
+            keys = set(self.partners) | {f[:-5] for f in os.listdir(out_dir) if f.endswith(".json")}
+        changed = []
+        for key in sorted(keys):
+            resources = {deliv: [views[i] for i in ids if views[i]]
+                         for deliv, ids in sorted(self.partners.get(key, {}).items())}
+            resources = {deliv: items for deliv, items in resources.items() if items}
+            path = os.path.join(out_dir, f"{key}.json")
+            if resources:
+                if write_atomic(path, json.dumps(resources, separators=(",", ":"))):
+                    changed.append(path)
+            elif os.path.exists(path):
+                os.remove(path)
+                changed.append(path)
+
+        if self.edited or self.full:
+            catalogue = {"_instructions": "Generated by update.py from partner-resources/ — "
+                                          "managed via the Assets tab in the internal dashboard.",
+                         "assets": self.assets(),
+                         "shas": {aid: rec["sha"] for aid, rec in sorted(self.records.items())}}
+            if write_atomic(catalogue_path, json.dumps(catalogue, indent=2, ensure_ascii=False) + "\n"):
+                changed.append(catalogue_path)
+        self.dirty, self.full = set(), False
+        return changed
+
+def refresh_assets():
+    """Sync the asset index with the records, render new variants and write
+    the affected partners' resource files. Returns (changed paths, counts)."""
+    index  = AssetIndex.load()
+    edited = index.refresh()
+    changed, counts = build_assets(index.assets())
+    written = index.emit(load_asset_manifest())
+    index.save()
+    print(f"Asset index: {len(index.records)} record(s), {edited} changed, "
+          f"{sum(p.startswith(RESOURCES_OUT_DIR) for p in written)} partner file(s) updated")
+    counts.update(assetRecords=len(index.records), assetRecordsChanged=edited,
+                  resourceFiles=sum(p.startswith(RESOURCES_OUT_DIR) for p in written))
+    return changed + written, counts
+
+# ── Partner portal data ────────────────────────────────────────────
+PORTAL_DIR = os.path.join(OUTPUT_DIR, "portal")
+
+INVOICE_FRIENDLY = {
+    "Paid":                        "Paid",
+    "Outstanding":                 "Invoice sent — payment pending",
+    "To Invoice":                  "Invoice coming soon",
+    "Waiting for billing details": "Awaiting your billing information",
+    "In Kind Sponsorship":         "In-kind partnership",
+    "Invoice held":                "On hold — please contact us",
+}
+
+def public_partner_records(partners):
+    """Portal view of each signed partner — no internal pricing or pipeline
+    info. Their assets are in resources/<key>.json (see AssetIndex)."""
+    public_partners = {}
+    for p in partners:
+        if p["stageKey"] not in SIGNED_STAGES:
+            continue
+        public_partners[p["key"]] = {
+            "name":          p["name"],
+            "package":       p["package"],
+            "invoiceStatus": INVOICE_FRIENDLY.get(p["invoiceStatus"], p["invoiceStatus"] or ""),
+            "deliverables":  p["features"],
+            "quarters":      p["quarters"],
+            "country":       p["country"],
+        }
+    return public_partners
+
+def shard_id(key):
+    """Manifest id for a partner key. The key is the portal's access token, so
+    the public manifest carries only this digest, never the key itself."""
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+def write_portal_shards(public_partners, last_updated, out_dir=PORTAL_DIR, keys=None):
+    """Write portal/<key>.json for each partner plus portal/manifest.json.
+
+    The manifest maps shard_id(key) → content hash. A shard is rewritten only
+    when its content hash changes (its lastUpdated is the date it last
+    changed), and shards of partners no longer signed are removed. With
+    `keys`, only those partners are considered (`public_partners` need only
+    cover them) and the rest of the manifest is kept as is.
+    Returns the paths that were written or removed.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    try:
+        with open(manifest_path) as f:
+            old_shards = json.load(f).get("shards", {})
+    except (OSError, ValueError):
+        old_shards = {}
+
+    shards, written, removed = ({} if keys is None else dict(old_shards)), [], []
+    for key, entry in public_partners.items():
+        digest = content_version(json.dumps(entry, sort_keys=True).encode())
+        sid    = shard_id(key)
+        shards[sid] = digest
+        path = os.path.join(out_dir, f"{key}.json")
+        if old_shards.get(sid) == digest and os.path.exists(path):
+            continue
+        if write_atomic(path, json.dumps({**entry, "lastUpdated": last_updated}, separators=(",", ":"))):
+            written.append(path)
+
+    candidates = keys if keys is not None else \
+        [f[:-5] for f in os.listdir(out_dir) if f.endswith(".json") and f != "manifest.json"]
+    for key in candidates:
+        if key in public_partners:
+            continue
+        shards.pop(shard_id(key), None)
+        path = os.path.join(out_dir, f"{key}.json")
+        if os.path.exists(path):
+            os.remove(path)
+            removed.append(path)
+
+    shards  = dict(sorted(shards.items()))
+    version = content_version(json.dumps(shards).encode())
+    manifest = json.dumps({"version": version, "count": len(shards), "shards": shards}, indent=0)
+    changed = written + removed + ([manifest_path] if write_atomic(manifest_path, manifest) else [])
+    print(f"Portal shards: {len(written)} written, {len(shards) - len(written)} unchanged, {len(removed)} removed")
+    return changed
+
+# ── Search index ───────────────────────────────────────────────────
+COMPACT = (",", ":")
+SEARCH_FIELDS = ("name", "brand", "group", "country", "email")
+SEARCH_FACETS = {                 # facet → row → values
+    "stage":   lambda p: [p["stage"]],
+    "package": lambda p: [p["package"]] if p["package"] else [],
+    "quarter": lambda p: p["quarters"] or ["TBD"],
+    "invoice": lambda p: [p["invoiceStatus"]] if p["invoiceStatus"] else [],
+    "feature": lambda p: [f["name"] for f in p["features"]],
+}
+
+class SearchIndex:
+    """Inverted index over the partner table, shipped as data-search.json.
+
+    Row ids are positions in data-partners.json. `grams` maps every trigram
+    of the lower-cased SEARCH_FIELDS to the rows containing it (a query of
+    3+ characters intersects its trigrams, then checks the few candidates;
+    shorter ones are checked against every candidate row, matching anywhere
+    like the full scan); `facets` holds one posting list per filter value. Postings are sorted and
+    gap-encoded ([3, 7, 8] → [3, 4, 1]).
+    """
+
+    def __init__(self):
+        self.rows   = 0
+        self.grams  = defaultdict(list)
+        self.facets = {name: defaultdict(list) for name in SEARCH_FACETS}
+
+    @staticmethod
+    def _post(postings, token, row):
+        ids = postings[token]
+        if not ids or ids[-1] != row:
+            ids.append(row)
+
+    def add(self, p):
+        row, self.rows = self.rows, self.rows + 1
+        for field in SEARCH_FIELDS:
+            text = (p.get(field) or "").lower()
+            for i in range(len(text) - 2):
+                self._post(self.grams, text[i:i + 3], row)
+        for name, values in SEARCH_FACETS.items():
+            for value in values(p):
+                self._post(self.facets[name], value, row)
+        return p
+
+    def feed(self, partners):
+        """Index rows as they stream past (for the data-partners.json writer)."""
+        for p in partners:
+            yield self.add(p)
+
+    @staticmethod
+    def _gaps(postings):
+        return {token: [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+                for token, ids in sorted(postings.items())}
+
+    def encode(self):
+        return json.dumps({
+            "rows":   self.rows,
+            "fields": SEARCH_FIELDS,
+            "grams":  self._gaps(self.grams),
+            "facets": {name: self._gaps(p) for name, p in self.facets.items()},
+        }, separators=COMPACT).encode()
+
+# ── Columnar partner table ─────────────────────────────────────────
+# data-partners-cols.json holds the same rows as data-partners.json, one
+# array per field instead of one object per row:
+#   plain  [v, …]                         numbers, mostly-unique strings
+#   dict   {"dict": [s, …], "ids": [i, …]}  low-cardinality strings
+#   prefix {"prefix": p, "values": [s|null, …]}  strings sharing a long
+#          prefix (keys, invoice URLs); null is ""
+#   derived {"derived": p, "from": f}     p + the row's f (streakUrl)
+#   set    {"names": [n, …], "masks": [m, …]}  lists of names as bitmasks,
+#          bits in list order; features add "timings", a column with one
+#          entry per set bit, row after row
+# index.html decodes it into lazy row objects (decodePartnerColumns).
+COLUMN_DICT_MAX   = 0.5  # dictionary-encode strings with at most this many distinct values per row
+COLUMN_PREFIX_MIN = 8    # shortest shared prefix worth factoring out
+COLUMN_MAX_BITS   = 31   # set columns with more names fall back to a dict of lists
+
+class PartnerColumns:
+    """Builds the columnar partner table from rows streamed through feed()."""
+
+    def __init__(self):
+        self.fields, self.rows = None, 0
+        self.cols    = defaultdict(list)
+        self.combos  = defaultdict(dict)         # set field → {tuple of names: id}
+        self.timings = []
+
+    def feed(self, rows):
+        for row in rows:
+            if self.fields is None:
+                self.fields = list(row)
+            for field in self.fields:
+                value = row[field]
+                if field == "features":
+                    self.timings += [f["timing"] for f in value]
+                    value = [f["name"] for f in value]
+                if isinstance(value, list):
+                    combos = self.combos[field]
+                    value  = combos.setdefault(tuple(value), len(combos))
+                self.cols[field].append(value)
+            self.rows += 1
+            yield row
+
+    def encode(self):
+        cols = {}
+        for field in self.fields or ():
+            values = self.cols[field]
+            if field in self.combos:
+                cols[field] = self._set(list(self.combos[field]), values)
+                if field == "features":
+                    cols[field]["timings"] = self._strings(self.timings)
+            elif field == "streakUrl" and self._derived(values):
+                cols[field] = self._derived(values)
+            elif all(isinstance(v, str) for v in values):
+                cols[field] = self._strings(values)
+            else:
+                cols[field] = values
+        return json.dumps({"rows": self.rows, "fields": self.fields or [], "cols": cols},
+                          separators=COMPACT).encode()
+
+    def _derived(self, values):
+        keys = self.cols["key"]
+        if not values or not values[0].endswith(keys[0]):
+            return None
+        prefix = values[0][:len(values[0]) - len(keys[0])]
+        if all(v == prefix + k for v, k in zip(values, keys)):
+            return {"derived": prefix, "from": "key"}
+        return None
+
+    @staticmethod
+    def _strings(values):
+        distinct = list(dict.fromkeys(values))
+        if len(distinct) <= len(values) * COLUMN_DICT_MAX:
+            ids = {v: i for i, v in enumerate(distinct)}
+            return {"dict": distinct, "ids": [ids[v] for v in values]}
+        prefix = os.path.commonprefix([v for v in values if v])
+        if len(prefix) >= COLUMN_PREFIX_MIN:
+            return {"prefix": prefix, "values": [v[len(prefix):] if v else None for v in values]}
+        return values
+
+    @staticmethod
+    def _set(combos, ids):
+        """Bitmasks over the names in `combos` (tuples), ordered so each
+        tuple's names come out in its own order; a dict of lists if no such
+        order exists (or there are too many names)."""
+        graph = {}
+        for combo in combos:
+            for name in combo:
+                graph.setdefault(name, set())
+            for a, b in zip(combo, combo[1:]):
+                graph[b].add(a)
+        try:
+            names = list(TopologicalSorter(graph).static_order())
+        except CycleError:
+            names = None
+        if names is None or len(names) > COLUMN_MAX_BITS or any(len(set(c)) < len(c) for c in combos):
+            return {"dict": [list(c) for c in combos], "ids": ids}
+        bits  = {n: 1 << i for i, n in enumerate(names)}
+        masks = [sum(bits[n] for n in c) for c in combos]
+        return {"names": names, "masks": [masks[i] for i in ids]}
+
+# ── Dashboard bundles ──────────────────────────────────────────────
+DATA_JS_PATH       = os.path.join(OUTPUT_DIR, "data.js")
+PARTNERS_JSON_PATH = os.path.join(OUTPUT_DIR, "data-partners.json")
+# Raw-size ceilings; the run fails instead of publishing a bundle past these.
+BUNDLE_BUDGETS = {
+    "data.js":                 16 * 1024,
+    "data-partners.json":      1024 * 1024,
+    "data-partners-cols.json": 512 * 1024,
+    "data-search.json":        1024 * 1024,
+    "data-cube.json":          512 * 1024,
+}
+
+def read_summary(path=DATA_JS_PATH):
+    """Parse the AMPLIFY_DATA object out of an existing data.js, or None."""
+    try:
+        with open(path) as f:
+            src = f.read()
+        return json.loads(src[src.index("{"):src.rindex("}") + 1])
+    except (OSError, ValueError):
+        return None
+
+def as_json(value):
+    """`value` as it reads back from JSON (tuples become lists), so it
+    compares equal to what read_summary() returns."""
+    return json.loads(json.dumps(value))
+
+def iter_json_array(items):
+    """Encode an iterable as a compact JSON array, one chunk per item, so the
+    full document never exists as a single string."""
+    yield b"["
+    for i, item in enumerate(items):
+        yield (b"," if i else b"") + json.dumps(item, separators=COMPACT).encode()
+    yield b"]"
+
+# ── Partner table deltas ──
+# Clients keep the partner rows they last loaded (with their version) and,
+# when data.js names a newer version, fetch only the patches in between:
+# deltas/<from>-<to>.json. A patch is an op list rebuilding the new array
+# from the old one — [start, count] copies old rows, an object is a new or
+# changed row — so rows keep exactly the published order (the search index
+# refers to rows by position). The previous generation is simply the
+# data-partners.json being replaced; data.js lists the chain of patches.
+DELTA_DIR      = "deltas"
+DELTA_KEEP     = 10     # patches kept; clients further behind download in full
+DELTA_MAX_SIZE = 0.5    # of the full table — past this, a patch is not worth it
+LINK_FIELDS    = ("partnersUrl", "partnersColsUrl", "searchUrl", "cubeUrl", "partnersDeltas")
+
+def iter_array_items(chunks):
+    """Yield (raw text, value) for each item of a JSON array of objects
+    written by iter_json_array (compact, no whitespace between items),
+    reading the byte `chunks` only as far as needed, so one item is held at
+    a time however big the array is."""
+    decoder, utf8, chunks = json.JSONDecoder(), codecs.getincrementaldecoder("utf-8")(), iter(chunks)
+    text, i = "", 0
+
+    def more():
+        nonlocal text, i
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError("truncated JSON array")
+        text, i = text[i:] + utf8.decode(chunk), 0
+
+    while not text:
+        more()
+    if text[0] != "[":
+        raise ValueError("not a JSON array")
+    i = 1
+    while True:
+        while i >= len(text):
+            more()
+        if text[i] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(text, i)
+        except json.JSONDecodeError:              # the item runs past this chunk
+            more()
+            continue
+        yield text[i:end], value
+        i = end
+        while i >= len(text):
+            more()
+        i += text[i] == ","
+
+class PartnerDelta:
+    """Diffs the partner rows being written against the previous
+    data-partners.json at `path` (if any) while they stream through feed()."""
+
+    def __init__(self, path):
+        self.old, self.old_version = {}, None     # key → (index, hash of its JSON)
+        digest = hashlib.sha256()
+
+        def hashed(chunks):
+            for chunk in chunks:
+                digest.update(chunk)
+                yield chunk
+        try:
+            chunks = hashed(read_chunks(path))
+            self.old = {row["key"]: (i, hash(t)) for i, (t, row) in enumerate(iter_array_items(chunks))}
+            for _ in chunks:                      # anything after the array, so the version is exact
+                pass
+            self.old_version = digest.hexdigest()[:12]
+        except (OSError, ValueError, KeyError, TypeError):
+            self.old = {}
+        self.ops, self.rows, self.last = [], 0, -1
+        self.added = self.changed = 0
+
+    def feed(self, rows):
+        for row in rows:
+            i, h = self.old.get(row["key"], (None, None))
+            if h is not None and i > self.last and h == hash(json.dumps(row, separators=COMPACT)):
+                op = self.ops[-1] if self.ops else None
+                if isinstance(op, list) and op[0] + op[1] == i:
+                    op[1] += 1
+                else:
+                    self.ops.append([i, 1])
+                self.last = i
+            else:
+                self.ops.append(row)
+                if h is None:
+                    self.added += 1
+                else:
+                    self.changed += 1
+            self.rows += 1
+            yield row
+
+    def removed(self):
+        kept = sum(op[1] for op in self.ops if isinstance(op, list))
+        return len(self.old) - kept - self.changed
+
+    def encode(self, version, summary, previous):
+        """The patch to `version` as bytes, with the summary fields that
+        differ from `previous`; None if there is no previous generation."""
+        if self.old_version is None or self.old_version == version:
+            return None
+        prev, summary = previous or {}, as_json(summary)
+        return json.dumps({
+            "from": self.old_version, "to": version, "rows": self.rows,
+            "added": self.added, "changed": self.changed, "removed": self.removed(),
+            "summary": {k: v for k, v in summary.items() if k not in LINK_FIELDS and prev.get(k) != v},
+            "ops": self.ops,
+        }, separators=COMPACT).encode()
+
+def delta_chain(delta, body, version, size, previous):
+    """The partnersDeltas list for data.js: the previous chain plus this
+    run's patch, or an empty chain when the patch would not pay off."""
+    chain = list((previous or {}).get("partnersDeltas") or [])
+    if delta.old_version == version:
+        return chain
+    if body is None or len(body) > size * DELTA_MAX_SIZE:
+        return []
+    if not chain or chain[-1]["to"] != delta.old_version:
+        chain = []
+    name = f"{delta.old_version}-{version}.json"
+    return (chain + [{"from": delta.old_version, "to": version, "url": f"{DELTA_DIR}/{name}"}])[-DELTA_KEEP:]
+
+def write_deltas(out_dir, chain, body):
+    """Write the newest patch of `chain` and delete those that dropped out
+    of it. Returns the changed paths."""
+    delta_dir = os.path.join(out_dir, DELTA_DIR)
+    changed   = []
+    if body is not None and chain:
+        os.makedirs(delta_dir, exist_ok=True)
+        changed += write_bundle(os.path.join(out_dir, chain[-1]["url"]), body)
+    keep = {os.path.basename(d["url"]) for d in chain}
+    if os.path.isdir(delta_dir):
+        for name in sorted(os.listdir(delta_dir)):
+            if name.split(".json")[0] + ".json" not in keep:
+                os.remove(os.path.join(delta_dir, name))
+                changed.append(os.path.join(delta_dir, name))
+    return changed
+
+def render_summary(summary, links, previous=None):
+    """Render data.js (KPIs, funnel, charts) with `links` ({"partnersUrl":
+    "data-partners.json?v=…", …}) to the bundles fetched after first paint.
+
+    If nothing but the date differs from `previous` (the summary already on
+    disk), its lastUpdated is kept so the bytes — and version — stay the same.
+    """
+    summary = as_json({**summary, **links})
+    if previous and {**previous, "lastUpdated": summary["lastUpdated"]} == summary:
+        summary["lastUpdated"] = previous["lastUpdated"]
+    return (f"// Auto-generated by update.py on {summary['lastUpdated']}\n"
+            "// Do not edit manually — run: python3 update.py\n"
+            f"const AMPLIFY_DATA={json.dumps(summary, separators=COMPACT)};\n").encode()
+
+def check_budgets(sizes, budgets=BUNDLE_BUDGETS):
+    """Return a message per bundle ({name: size}) that is over its size budget."""
+    return [f"{name} is {size // 1024}KB, over its {budgets[name] // 1024}KB budget"
+            for name, size in sizes.items() if name in budgets and size > budgets[name]]
+
+def gzip_chunks(chunks):
+    """Deterministic gzip (level 9, zero mtime — zlib's own gzip header, the
+    same bytes gzip.compress(..., mtime=0) produces) of a chunk stream."""
+    z = zlib.compressobj(9, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        yield z.compress(chunk)
+    yield z.flush()
+
+# Quality 11 is ~100x slower than 7 for ~10% smaller output, so only small
+# files (data.js, the cube, small pipelines) get it
+BROTLI_QUALITY       = 7
+BROTLI_SMALL_QUALITY = 11
+BROTLI_SMALL_SIZE    = 128 * 1024
+
+def brotli_chunks(chunks, quality=BROTLI_QUALITY):
+    z = brotli.Compressor(quality=quality)
+    for chunk in chunks:
+        yield z.process(chunk)
+    yield z.finish()
+
+def write_siblings(path, force=False):
+    """(Re)write the precompressed .gz and, if the optional brotli package is
+    installed, .br siblings of `path` by streaming it from disk. Only runs
+    when `path` changed (`force`) or a sibling is missing. Returns the
+    sibling paths that changed."""
+    siblings = [(path + ".gz", gzip_chunks)]
+    if brotli is not None:
+        quality = BROTLI_SMALL_QUALITY if os.path.getsize(path) <= BROTLI_SMALL_SIZE else BROTLI_QUALITY
+        siblings.append((path + ".br", lambda chunks: brotli_chunks(chunks, quality)))
+    changed = []
+    for sib, compress in siblings:
+        if force or not os.path.exists(sib):
+            tmp, _, _ = stage_stream(sib, compress(read_chunks(path)))
+            if publish_staged(tmp, sib):
+                changed.append(sib)
+    return changed
+
+def write_bundle(path, body):
+    """Write `body` to `path` plus its precompressed siblings. Returns the
+    paths that changed."""
+    changed = [path] if write_atomic(path, body) else []
+    return changed + write_siblings(path, force=bool(changed))
+
+def stamp_version(html_path, asset, version):
+    """Point `asset?v=...` references in an HTML page at `version`."""
+    with open(html_path) as f:
+        html = f.read()
+    return write_atomic(html_path, re.sub(rf'{re.escape(asset)}\?v=[0-9A-Za-z]+', f"{asset}?v={version}", html))
+
+def write_dashboard_bundles(state, summary, out_dir=OUTPUT_DIR, budgets=BUNDLE_BUDGETS):
+    """Write data-partners.json (streamed), its columnar encoding, the patch
+    to it from the previous version, its search index, the metrics cube and
+    data.js into `out_dir`, and stamp the data.js version into its index.html
+    if there is one.
+
+    Returns (changed paths, budget messages); when any bundle is over budget
+    nothing is published.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    partners_path = os.path.join(out_dir, "data-partners.json")
+    previous = read_summary(os.path.join(out_dir, "data.js"))
+    index, delta, columns = SearchIndex(), PartnerDelta(partners_path), PartnerColumns()
+    staged, partners_version, partners_size = stage_stream(
+        partners_path, iter_json_array(index.feed(delta.feed(columns.feed(state.partners())))))
+    bundles = {"data-partners-cols.json": columns.encode(),
+               "data-search.json": index.encode(),
+               "data-cube.json":   json.dumps(state.cube(), separators=COMPACT).encode()}
+    delta_body = delta.encode(partners_version, summary, previous)
+    chain   = delta_chain(delta, delta_body, partners_version, partners_size, previous)
+    links   = {"partnersUrl": f"data-partners.json?v={partners_version}",
+               "partnersColsUrl": f"data-partners-cols.json?v={content_version(bundles['data-partners-cols.json'])}",
+               "searchUrl":   f"data-search.json?v={content_version(bundles['data-search.json'])}",
+               "cubeUrl":     f"data-cube.json?v={content_version(bundles['data-cube.json'])}",
+               "partnersDeltas": chain}
+    data_js = render_summary(summary, links, previous=previous)
+    over    = check_budgets({"data.js": len(data_js), "data-partners.json": partners_size,
+                             **{name: len(body) for name, body in bundles.items()}}, budgets)
+    if over:
+        os.remove(staged)
+        return [], over
+
+    changed = []
+    written = publish_staged(staged, partners_path)
+    changed += ([partners_path] if written else []) + write_siblings(partners_path, force=written)
+    print(f"{'Wrote' if written else 'Unchanged'} data-partners.json ({partners_size//1024}KB)")
+    if written:
+        changed += write_deltas(out_dir, chain, delta_body)
+        if chain and delta_body is not None:
+            print(f"Wrote {chain[-1]['url']} ({len(delta_body)//1024}KB: {delta.added} added, "
+                  f"{delta.changed} changed, {delta.removed()} removed; chain of {len(chain)})")
+    for name, body in {**bundles, "data.js": data_js}.items():
+        written = write_bundle(os.path.join(out_dir, name), body)
+        changed += written
+        print(f"{'Wrote' if written else 'Unchanged'} {name} ({len(body)//1024}KB)")
+
+    # Version data.js in index.html by content, so browser caches only miss
+    # when the data actually changed
+    index_path, version = os.path.join(out_dir, "index.html"), content_version(data_js)
+    if os.path.exists(index_path) and stamp_version(index_path, "data.js", version):
+        changed.append(index_path)
+        print(f"Updated data.js version in index.html → v={version}")
+    return changed, over
+
+# ── Run report ─────────────────────────────────────────────────────
+class RunReport:
+    """Timings, HTTP counters, artifact sizes and outcome of one run,
+    written as JSON to RUN_REPORT_PATH and appended to RUN_HISTORY_PATH."""
+
+    def __init__(self, argv=()):
+        self.started = time.time()
+        self.data = {
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "args":    [a for a in argv if a.startswith("--")],
+            "phases":  {},
+            "counts":  {},
+            "outcome": None,
+        }
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block as `name` (repeats add up). Safe from any thread."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                phases = self.data["phases"]
+                phases[name] = round(phases.get(name, 0) + elapsed, 3)
+
+    def set(self, **counts):
+        with self.lock:
+            self.data["counts"].update(counts)
+
+    def finish(self, outcome, http=None, artifacts=None):
+        self.data.update(outcome=outcome, totalSeconds=round(time.time() - self.started, 3),
+                         http=http.report() if http else {}, artifacts=artifacts or {})
+        return self.data
+
+    def save(self, path=RUN_REPORT_PATH, history=RUN_HISTORY_PATH, keep=RUN_HISTORY_KEEP):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, json.dumps(self.data, indent=2))
+        if not history:
+            return
+        try:
+            with open(history) as f:
+                lines = f.readlines()[-(keep - 1):]
+        except OSError:
+            lines = []
+        lines.append(json.dumps(self.data, separators=COMPACT) + "\n")
+        write_atomic(history, "".join(lines))
+
+def artifact_sizes(out_dir=OUTPUT_DIR):
+    """Byte sizes of the published bundles and of the portal directory."""
+    sizes = {}
+    for name in ("data.js", "data-partners.json", "data-partners-cols.json", "data-search.json", "data-cube.json"):
+        for path in (name, name + ".gz", name + ".br"):
+            if os.path.exists(os.path.join(out_dir, path)):
+                sizes[path] = os.path.getsize(os.path.join(out_dir, path))
+    portal = os.path.join(out_dir, "portal")
+    if os.path.isdir(portal):
+        files = [os.path.join(portal, f) for f in os.listdir(portal)]
+        sizes["portal/"] = {"files": len(files), "bytes": sum(os.path.getsize(f) for f in files)}
+    return sizes
+
+def profiled(fn, *args, path=PROFILE_PATH, top=25, **kw):
+    """Run fn under cProfile, dump the stats to `path` and return
+    (result, top functions by cumulative time as text)."""
+    prof = cProfile.Profile()
+    result = prof.runcall(fn, *args, **kw)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    prof.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(top)
+    return result, out.getvalue()
+
+# ── Main ───────────────────────────────────────────────────────────
+def print_summary(d, partner_count):
     print(f"\n{'='*50}")
     print(f"  Signed Partners:   {d['signedCount']}")
     print(f"  Total Signed:      ${d['totalSigned']:>10,.0f}")
@@ -455,116 +2571,413 @@ def print_summary(d):
         print(f"    {k:<25} ${v:>8,.0f}  ({d['countByStage'].get(k,0)} partners)")
     print(f"\n  Features: {d['features']}")
     print(f"  Quarters: {d['quarters']}")
-    print(f"  Partners array: {len(d['partners'])} records")
+    print(f"  Partners array: {partner_count} records")
     print(f"{'='*50}\n")
 
-if __name__ == "__main__":
-    no_git = "--no-git" in sys.argv
-
-    boxes  = fetch_all_boxes()
-    data   = compute_metrics(boxes)
-    print_summary(data)
-    write_portal_links(data["partners"])
-
-    # Write data.js
-    script_dir   = os.path.dirname(os.path.abspath(__file__))
-    data_js_path = os.path.join(script_dir, "data.js")
-    with open(data_js_path, "w") as f:
-        f.write(f"// Auto-generated by update.py on {data['lastUpdated']}\n")
-        f.write("// Do not edit manually — run: python3 update.py\n\n")
-        f.write(f"const AMPLIFY_DATA = {json.dumps(data, indent=2)};\n")
-    print(f"Wrote data.js ({os.path.getsize(data_js_path)//1024}KB)")
-
-    # Update cache-bust version in index.html so browsers always load fresh data.js
-    index_path = os.path.join(script_dir, "index.html")
-    version    = datetime.now().strftime("%Y%m%d%H%M")
-    with open(index_path, "r") as f:
-        html = f.read()
-    html = re.sub(r'data\.js\?v=\d+', f'data.js?v={version}', html)
-    with open(index_path, "w") as f:
-        f.write(html)
-    print(f"Updated cache-bust version in index.html → v={version}")
-
-    # Write partners-public.js (partner portal data — no internal pricing info)
-    INVOICE_FRIENDLY = {
-        "Paid":                        "Paid",
-        "Outstanding":                 "Invoice sent — payment pending",
-        "To Invoice":                  "Invoice coming soon",
-        "Waiting for billing details": "Awaiting your billing information",
-        "In Kind Sponsorship":         "In-kind partnership",
-        "Invoice held":                "On hold — please contact us",
-    }
-    SIGNED_STAGE_KEYS = {"5014","5015","5016","5017","5007"}
-    # Load approved partner assets from partner-resources.json
-    resources_path = os.path.join(script_dir, "partner-resources.json")
-    partner_assets = {}  # key -> { deliverable_name -> [asset_info] }
-    if os.path.exists(resources_path):
-        try:
-            with open(resources_path) as f:
-                raw = json.load(f)
-            live_assets = [a for a in raw.get("assets", []) if a.get("status") == "live"]
-            for asset in live_assets:
-                for pk in asset.get("partnerKeys", []):
-                    if pk not in partner_assets:
-                        partner_assets[pk] = {}
-                    deliv = asset["deliverable"]
-                    if deliv not in partner_assets[pk]:
-                        partner_assets[pk][deliv] = []
-                    partner_assets[pk][deliv].append({
-                        "label": asset.get("label", ""),
-                        "path":  asset["path"],
-                        "note":  asset.get("note", ""),
-                    })
-            total = sum(len(v) for v in partner_assets.values())
-            if total:
-                print(f"  Loaded {total} live asset(s) across {len(partner_assets)} partner(s)")
-        except Exception as e:
-            print(f"  Warning: could not read partner-resources.json ({e})")
+def run(full=False, verify=False, no_git=False, profile=False, report=None):
+    """One update: sync, compute, write outputs, publish. Returns the outcome
+    ("published", "unchanged", "no-git", "nothing-to-commit" or
+    "over-budget")."""
+    report = report or RunReport()
+    with report.phase("schema"):
+        pipeline_schema()
+    with report.phase("fetch"):
+        sync = sync_boxes(full=full)
+    with report.phase("compute"):
+        state   = update_metrics(sync, verify=verify)
+        summary = state.summary()
+    if profile:
+        # A full recompute, so the profile covers every box whatever the
+        # incremental update had to do
+        with report.phase("profile"):
+            _, top = profiled(compute_metrics, sync.boxes)
+        print(f"compute_metrics profile saved to {os.path.relpath(PROFILE_PATH, SCRIPT_DIR)}")
+        report.data["profile"] = {"path": os.path.relpath(PROFILE_PATH, SCRIPT_DIR), "top": top.splitlines()}
+    with report.phase("history"):
+        history_changed = record_history(sync, state)
+    report.set(boxes=len(sync.boxes), changed=len(sync.changed), removed=len(sync.removed),
+               partners=state.partner_count(), historyChanged=history_changed)
+    print_summary(summary, state.partner_count())
 
-    public_partners = {}
-    for p in data["partners"]:
-        if p["stageKey"] not in SIGNED_STAGE_KEYS:
-            continue
-        public_partners[p["key"]] = {
-            "name":          p["name"],
-            "package":       p["package"],
-            "invoiceStatus": INVOICE_FRIENDLY.get(p["invoiceStatus"], p["invoiceStatus"] or ""),
-            "deliverables":  p["features"],
-            "quarters":      p["quarters"],
-            "country":       p["country"],
-            "resources":     partner_assets.get(p["key"], {}),
-            "lastUpdated":   data["lastUpdated"],
-        }
-    partners_js_path = os.path.join(script_dir, "partners-public.js")
-    with open(partners_js_path, "w") as f:
-        f.write(f"// Auto-generated by update.py on {data['lastUpdated']}\n")
-        f.write("// Partner portal data — no internal pricing or pipeline info\n\n")
-        f.write(f"const PARTNER_PUBLIC_DATA = {json.dumps(public_partners, indent=2)};\n")
-    print(f"Wrote partners-public.js ({len(public_partners)} partners, {os.path.getsize(partners_js_path)//1024}KB)")
-
-    # Update cache-bust version in partner.html too
-    partner_path = os.path.join(script_dir, "partner.html")
-    if os.path.exists(partner_path):
-        with open(partner_path, "r") as f:
-            phtml = f.read()
-        phtml = re.sub(r'partners-public\.js\?v=\d+', f'partners-public.js?v={version}', phtml)
-        with open(partner_path, "w") as f:
-            f.write(phtml)
-        print(f"Updated cache-bust version in partner.html → v={version}")
+    # Portal write-back only talks to Streak, so let it run while the
+    # output files are generated; it is joined before the git step.
+    def portal_links():
+        with report.phase("portalWriteBack"):
+            return write_portal_links(sync.boxes)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        portal_job = pool.submit(portal_links)
+        asset_changed = []
+        if not PIPELINE:             # with pipelines.json, the parent process does this once
+            with report.phase("assets"):
+                asset_changed, counts = refresh_assets()
+            report.set(**counts)
+        with report.phase("render"):
+            changed, over = render_outputs(state, summary)
+        changed += asset_changed
+        portal_links_written = portal_job.result()
+
+    report.set(portalLinks=portal_links_written, outputsChanged=len(changed))
+    report.data["changed"] = [os.path.relpath(p, SCRIPT_DIR) for p in changed]
+    if PIPELINE:
+        report.data["rollup"] = pipeline_rollup(state, read_summary(os.path.join(OUTPUT_DIR, "data.js")) or summary)
+    if over:
+        for msg in over:
+            print(f"Error: {msg}")
+        return "over-budget"
+    return publish(changed, summary["lastUpdated"], no_git, report)
+
+def render_outputs(state, summary, keys=None):
+    """Write the dashboard bundles and portal shards (only those of `keys`
+    if given). Returns (changed paths, budget messages)."""
+    # Write data-partners.json (lazy-loaded table) + data.js (summary)
+    changed, over = write_dashboard_bundles(state, summary, OUTPUT_DIR)
+    if not over:
+        # Write per-partner portal shards (partner portal data — no internal pricing info)
+        rows            = state.partners() if keys is None else state.partner_rows(keys)
+        public_partners = public_partner_records(rows)
+        changed += write_portal_shards(public_partners, summary["lastUpdated"], keys=keys)
+    return changed, over
+
+def publish(changed, last_updated, no_git=False, report=None):
+    """Commit and push the changed output files. Returns the outcome."""
+    if not changed:
+        print("No output changed — nothing to publish.")
+        return "unchanged"
 
     if no_git:
         print("Skipping git (--no-git mode, handled externally)")
+        return "no-git"
+
+    # Git commit + push (only the files this run changed)
+    with (report or RunReport()).phase("git"):
+        subprocess.run(["git", "add", "-A", *[os.path.relpath(p, SCRIPT_DIR) for p in changed],
+                        "partner-resources.json"], check=True, cwd=SCRIPT_DIR)
+        result = subprocess.run(
+            ["git", "commit", "-m", f"Auto-update from Streak ({last_updated})"],
+            capture_output=True, text=True, cwd=SCRIPT_DIR
+        )
+        if "nothing to commit" in result.stdout:
+            print("No changes to push — data is already up to date.")
+            return "nothing-to-commit"
+        subprocess.run(["git", "push"], check=True, cwd=SCRIPT_DIR)
+    print("Pushed! Dashboard updates at https://margaux-noel.github.io/amplify-2026-dashboard/ in ~1 min.")
+    return "published"
+
+# ── Pipelines ──────────────────────────────────────────────────────
+# With pipelines.json, a run starts one worker process per pipeline (this
+# script with AMPLIFY_PIPELINE set), all at once, so the run takes about
+# as long as the slowest pipeline. Each worker writes its own outputs and
+# report; this process then writes the cross-year rollup and publishes
+# everything in a single commit.
+ROLLUP_TOTALS = ("signedCount", "totalSigned", "totalPipeline", "paid", "outstanding",
+                 "waitingBilling", "needsInvoice", "inDiscussion")
+WORKER_FLAGS  = ("--full", "--verify", "--profile")   # passed on to every worker
+
+def pipeline_rollup(state, summary):
+    """This pipeline's entry in data-rollup.json, from the `summary` data.js
+    was published with (its lastUpdated only moves when the data does)."""
+    names = state.schema.stage_names
+    return {"id": PIPELINE_ID, "label": PIPELINE.get("label", PIPELINE_ID),
+            "outDir": os.path.relpath(OUTPUT_DIR, SCRIPT_DIR), "lastUpdated": summary["lastUpdated"],
+            **{k: summary[k] for k in ROLLUP_TOTALS}, "partners": state.partner_count(),
+            "countByStage": {names.get(k, k): n for k, n in sorted(state.stage_cnt.items())},
+            "leads": {target: state.stage_cnt.get(stage, 0) for stage, target in LEAD_STAGES.items()}}
+
+def merge_rollups(entries):
+    """Sum the per-pipeline entries into the cross-year rollup. Leads are
+    credited to the pipeline they are for, not the one they sit in."""
+    totals = {k: round(sum(e[k] for e in entries), 2) for k in (*ROLLUP_TOTALS, "partners")}
+    leads  = defaultdict(int)
+    for e in entries:
+        for target, n in e["leads"].items():
+            leads[target] += n
+    return {"lastUpdated": max((e["lastUpdated"] for e in entries), key=lambda d: datetime.strptime(d, "%b %d, %Y")),
+            "pipelines": [{**e, "incomingLeads": leads.get(e["id"], 0)} for e in entries],
+            "totals": totals, "leads": dict(leads)}
+
+def run_pipelines(no_git=False, report=None):
+    """Run every pipeline in PIPELINES in parallel worker processes, write
+    the merged rollup and publish. Returns the outcome."""
+    report = report or RunReport()
+    flags  = [a for a in sys.argv[1:] if a in WORKER_FLAGS] + ["--no-git"]
+    # The workers share one API key, so they share its request rate too
+    env    = {**os.environ, "STREAK_RATE": str(HTTP_RATE / len(PIPELINES))}
+    os.makedirs(os.path.join(SCRIPT_DIR, ".cache"), exist_ok=True)
+    # resources/ is keyed by partner, not pipeline, so this is done once here
+    with report.phase("assets"):
+        asset_changed, counts = refresh_assets()
+    report.set(**counts)
+    workers = {}
+    with report.phase("pipelines"):
+        for p in PIPELINES:
+            path = run_report_path(p)
+            if os.path.exists(path):
+                os.remove(path)
+            log = open(os.path.join(SCRIPT_DIR, ".cache", f"run-{p['id']}.log"), "w+")
+            proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), *flags],
+                                    env={**env, "AMPLIFY_PIPELINE": p["id"]}, cwd=SCRIPT_DIR,
+                                    stdout=log, stderr=subprocess.STDOUT)
+            workers[p["id"]] = (proc, log)
+        for proc, _ in workers.values():
+            proc.wait()
+
+    results, changed, failed = {}, asset_changed, []
+    for p in PIPELINES:
+        pid, (proc, log) = p["id"], workers[p["id"]]
+        log.seek(0)
+        print(f"── {pid} " + "─" * 40)
+        print(log.read().rstrip())
+        log.close()
+        try:
+            with open(run_report_path(p)) as f:
+                results[pid] = json.load(f)
+        except (OSError, ValueError):
+            results[pid] = {"outcome": "failed", "exitCode": proc.returncode}
+        if results[pid]["outcome"] in ("failed", "over-budget") or "rollup" not in results[pid]:
+            failed.append(pid)
+        else:
+            changed += [os.path.join(SCRIPT_DIR, path) for path in results[pid]["changed"]]
+    report.data["pipelines"] = results
+    report.set(pipelines=len(PIPELINES), failedPipelines=len(failed))
+    if failed:
+        print(f"Error: pipeline(s) {', '.join(failed)} failed — nothing published")
+        return "failed"
+
+    rollup = merge_rollups([results[p["id"]]["rollup"] for p in PIPELINES])
+    with report.phase("rollup"):
+        body     = json.dumps(rollup, separators=COMPACT, ensure_ascii=False).encode()
+        written  = write_bundle(os.path.join(SCRIPT_DIR, "data-rollup.json"), body)
+        changed += written
+    print(f"{'Wrote' if written else 'Unchanged'} data-rollup.json ({len(PIPELINES)} pipelines)")
+    t = rollup["totals"]
+    print(f"  All years: {t['signedCount']} signed, ${t['totalSigned']:,.0f} signed, "
+          f"${t['totalPipeline']:,.0f} pipeline, {t['partners']} partners")
+    return publish(changed, rollup["lastUpdated"], no_git, report)
+
+# ── Webhook daemon ─────────────────────────────────────────────────
+# `update.py --serve` keeps the snapshot, metrics and outputs current from
+# Streak box webhooks: events are coalesced, only the boxes they name are
+# re-fetched, and the in-memory state is patched instead of re-scanned.
+WEBHOOK_PORT     = int(os.environ.get("WEBHOOK_PORT", 8787))
+WEBHOOK_TOKEN    = os.environ.get("STREAK_WEBHOOK_TOKEN", "")  # if set, required as ?token=
+WEBHOOK_HOST     = "0.0.0.0" if WEBHOOK_TOKEN else "127.0.0.1"  # no token: local senders only
+WEBHOOK_DEBOUNCE = 2.0    # seconds of quiet before a batch is processed
+WEBHOOK_MAX_WAIT = 10.0   # …but never later than this after its first event
+
+def webhook_box_keys(payload):
+    """Box keys named by a webhook body — one event or a list of them, with
+    the key at the top level (boxKey / key) or under "box"."""
+    events = payload if isinstance(payload, list) else [payload]
+    keys = set()
+    for e in events:
+        if not isinstance(e, dict):
+            continue
+        box = e.get("box") if isinstance(e.get("box"), dict) else {}
+        key = e.get("boxKey") or box.get("key") or box.get("boxKey") or e.get("key")
+        if isinstance(key, str) and key:
+            keys.add(key)
+    return keys
+
+class ChangeBatcher:
+    """Collects box keys from webhook threads and hands them out in batches
+    once events stop arriving for `debounce` seconds (or `max_wait` after
+    the first one)."""
+
+    def __init__(self, debounce=WEBHOOK_DEBOUNCE, max_wait=WEBHOOK_MAX_WAIT):
+        self.debounce, self.max_wait = debounce, max_wait
+        self.cond    = threading.Condition()
+        self.pending = set()
+        self.first = self.last = 0.0
+
+    def add(self, keys):
+        with self.cond:
+            now = time.monotonic()
+            if not self.pending:
+                self.first = now
+            self.pending |= keys
+            self.last = now
+            self.cond.notify()
+
+    def wait(self):
+        """Block until a batch is due and return its keys."""
+        with self.cond:
+            while True:
+                if not self.pending:
+                    self.cond.wait()
+                    continue
+                due = min(self.last + self.debounce, self.first + self.max_wait) - time.monotonic()
+                if due <= 0:
+                    batch, self.pending = self.pending, set()
+                    return batch
+                self.cond.wait(due)
+
+def fetch_box(key):
+    """One box by key, or None if Streak no longer has it or it is not in
+    this pipeline (webhooks can name any box; one moved to another
+    pipeline has left this one)."""
+    r = streak.get(f"/boxes/{key}")
+    if r.status_code in (400, 404):
+        return key, None
+    r.raise_for_status()
+    box = r.json()
+    if box.get("pipelineKey") != PIPELINE_KEY:
+        print(f"  Ignoring box {key}: not in this pipeline")
+        return key, None
+    return key, box
+
+class UpdateDaemon:
+    """Long-running updater: one full sync at start, then per-batch patches."""
+
+    def __init__(self, no_git=False, batcher=None):
+        self.no_git  = no_git
+        self.batcher = batcher or ChangeBatcher()
+        self.lock    = threading.Lock()
+        report = RunReport(["--serve"])
+        pipeline_schema()
+        self.sync  = sync_boxes()
+        self.state = update_metrics(self.sync)
+        record_history(self.sync, self.state)
+        write_portal_links(self.sync.boxes)
+        changed, over = render_outputs(self.state, self.state.summary())
+        for msg in over:
+            print(f"Error: {msg}")
+        if not over:
+            publish(changed, self.state.summary()["lastUpdated"], no_git, report)
+
+    def apply(self, keys):
+        """Re-fetch `keys`, patch snapshot, metrics and history, and rewrite
+        whatever output they affect. Returns the RunReport data."""
+        report = RunReport(["--serve"])
+        with report.phase("fetch"):
+            fetched = dict(streak.map(fetch_box, sorted(keys)))
+            boxes   = [b for b in fetched.values() if b is not None]
+            snap = BoxSnapshot()
+            try:
+                changed = snap.upsert(boxes)
+                removed = snap.delete([k for k, b in fetched.items() if b is None])
+                generation = snap.advance(int(time.time() * 1000))
+                snap.commit()
+            finally:
+                snap.close()
+            self.sync = SyncResult(SnapshotBoxes(), changed, removed, generation)
+        with report.phase("compute"):
+            for key in removed:
+                self.state.discard(key)
+            for box in self.sync.boxes.get_many(changed):
+                self.state.upsert(box)
+            self.state.generation = generation
+            self.state.save()
+            summary = self.state.summary()
+        with report.phase("history"):
+            history_changed = record_history(self.sync, self.state)
+        report.set(boxes=len(self.state.records), changed=len(changed), removed=len(removed),
+                   partners=self.state.partner_count(), historyChanged=history_changed)
+        outcome = "unchanged"
+        if changed or removed:
+            with report.phase("portalWriteBack"):
+                fresh = set(changed)
+                report.set(portalLinks=write_portal_links(b for b in boxes if b["key"] in fresh))
+            with report.phase("render"):
+                paths, over = render_outputs(self.state, summary, keys=[*changed, *removed])
+            report.set(outputsChanged=len(paths))
+            for msg in over:
+                print(f"Error: {msg}")
+            outcome = "over-budget" if over else publish(paths, summary["lastUpdated"], self.no_git, report)
+        report.finish(outcome, None, artifact_sizes())
+        report.save()
+        phases = ", ".join(f"{k} {v * 1000:.0f}ms" for k, v in report.data["phases"].items())
+        print(f"Webhook batch: {len(keys)} box(es), {len(changed)} changed, {len(removed)} removed "
+              f"→ {outcome} ({phases})")
+        return report.data
+
+    def run_forever(self):
+        while True:
+            keys = self.batcher.wait()
+            with self.lock:
+                try:
+                    self.apply(keys)
+                except Exception as e:          # keep serving; retry these keys with the next batch
+                    print(f"Warning: webhook batch failed ({e}) — will retry")
+                    time.sleep(self.batcher.debounce)
+                    self.batcher.add(keys)
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body=b""):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        # health check
+        self.reply(200, b"ok") if urlparse(self.path).path == "/health" else self.reply(404)
+
+    def do_POST(self):
+        url  = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if url.path != "/webhook":
+            return self.reply(404)
+        token = (parse_qs(url.query).get("token") or [""])[0]
+        if WEBHOOK_TOKEN and not hmac.compare_digest(token, WEBHOOK_TOKEN):
+            return self.reply(403)
+        try:
+            keys = webhook_box_keys(json.loads(body or b"null"))
+        except ValueError:
+            return self.reply(400)
+        if keys:
+            self.server.batcher.add(keys)
+        self.reply(202)
+
+def serve(port=WEBHOOK_PORT, no_git=False):
+    """Run the webhook daemon until interrupted."""
+    daemon = UpdateDaemon(no_git=no_git)
+    server = ThreadingHTTPServer((WEBHOOK_HOST, port), WebhookHandler)
+    server.daemon_threads = True
+    server.batcher = daemon.batcher
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Listening for Streak webhooks on {WEBHOOK_HOST}:{port}/webhook "
+          f"(debounce {WEBHOOK_DEBOUNCE:g}s, max wait {WEBHOOK_MAX_WAIT:g}s)")
+    if not WEBHOOK_TOKEN:
+        print("  Note: STREAK_WEBHOOK_TOKEN is not set — only accepting local connections")
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+def arg_value(name, default=None):
+    return sys.argv[sys.argv.index(name) + 1] if name in sys.argv[:-1] else default
+
+if __name__ == "__main__":
+    if PIPELINES and not PIPELINE_ID and {"--pipeline", "--history", "--serve"} & set(sys.argv):
+        # These act on one pipeline (the first unless --pipeline says which):
+        # rerun as its worker
+        os.execve(sys.executable, [sys.executable, os.path.abspath(__file__), *sys.argv[1:]],
+                  {**os.environ, "AMPLIFY_PIPELINE": arg_value("--pipeline", PIPELINES[0]["id"])})
+
+    if "--history" in sys.argv:
+        print(json.dumps(query_history(arg_value("--history"), arg_value("--since"), arg_value("--until")),
+                         indent=1, ensure_ascii=False))
         sys.exit(0)
 
-    # Git commit + push
-    os.chdir(script_dir)
-    subprocess.run(["git", "add", "data.js", "index.html", "partners-public.js", "partner.html", "partner-resources.json"], check=True)
-    result = subprocess.run(
-        ["git", "commit", "-m", f"Auto-update from Streak ({data['lastUpdated']})"],
-        capture_output=True, text=True
-    )
-    if "nothing to commit" in result.stdout:
-        print("No changes to push — data is already up to date.")
-    else:
-        subprocess.run(["git", "push"], check=True)
-        print("Pushed! Dashboard updates at https://margaux-noel.github.io/amplify-2026-dashboard/ in ~1 min.")
+    if "--serve" in sys.argv:
+        serve(int(arg_value("--port", WEBHOOK_PORT)), no_git="--no-git" in sys.argv)
+        sys.exit(0)
+
+    report  = RunReport(sys.argv[1:])
+    outcome = "failed"
+    try:
+        if PIPELINES and not PIPELINE_ID:
+            outcome = run_pipelines(no_git="--no-git" in sys.argv, report=report)
+        else:
+            outcome = run(full="--full" in sys.argv, verify="--verify" in sys.argv,
+                          no_git="--no-git" in sys.argv, profile="--profile" in sys.argv, report=report)
+    finally:
+        report.finish(outcome, streak.stats, artifact_sizes())
+        # a worker's report goes into the history as part of its parent's
+        report.save(history=None if PIPELINE_ID else RUN_HISTORY_PATH)
+        phases = ", ".join(f"{k} {v:.1f}s" for k, v in report.data["phases"].items())
+        print(f"Run report → {os.path.relpath(RUN_REPORT_PATH, SCRIPT_DIR)} ({outcome}; {phases})")
+    sys.exit(1 if outcome in ("over-budget", "failed") else 0)